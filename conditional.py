@@ -0,0 +1,64 @@
+import hashlib
+from datetime import date
+from typing import Callable, Tuple
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from database.session import get_db
+from domain.user import user_schema
+from security import get_current_user
+
+# 조건부 GET(ETag/If-None-Match) 처리
+# 자주 폴링되는 조회 API에서 사용자 데이터의 버전(최신 row id, 건수 등)만 먼저 조회해
+# 클라이언트가 가진 ETag와 같으면 본문 조회/직렬화 없이 304를 반환합니다.
+
+VersionFunc = Callable[[Session, user_schema.User], Tuple]
+
+
+class NotModified(Exception):
+    """클라이언트 캐시가 최신인 경우 (main에서 304 응답으로 변환)"""
+
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # 압축 미들웨어가 본문을 바꾸므로 약한 비교 (W/ 접두사 무시)
+    weak = etag.removeprefix("W/")
+    return "*" in candidates or any(value.removeprefix("W/") == weak for value in candidates)
+
+
+def etag_for(version: VersionFunc):
+    """version(db, current_user)로 ETag를 계산하는 의존성 생성
+
+    ETag에는 경로와 쿼리 파라미터, 오늘 날짜(기본 조회 날짜가 오늘이므로)가 함께 들어갑니다.
+    """
+
+    def dependency(
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_db),
+        current_user: user_schema.User = Depends(get_current_user)
+    ):
+        parts = (
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            date.today().isoformat(),
+            current_user.id,
+            *version(db, current_user)
+        )
+        etag = 'W/"' + hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20] + '"'
+        if _etag_matches(request.headers.get("if-none-match", ""), etag):
+            raise NotModified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+
+    return dependency
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
@@ -12,6 +12,19 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # 인증 모드 (stateful: 요청마다 사용자 조회, stateless: 토큰 클레임만으로 인증)
+    AUTH_MODE: str = "stateful"
+    AUTH_REVOCATION_REFRESH_SECONDS: int = 30
+
+    # 비밀번호 해싱 전용 워커 설정
+    PASSWORD_HASH_EXECUTOR: str = "process"  # process 또는 thread
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # 실행 중 + 대기 중 요청 상한, 초과 시 503
+
+    # 인증 사용자 캐시 설정 (TTL 0이면 캐시 비활성화)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+
     AWS_REGION: str = "us-northeast-2"
     
     # 이메일 설정
@@ -21,6 +34,69 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     FROM_EMAIL: str = ""  # SMTP_USERNAME과 동일하게 설정
     FROM_NAME: str = "MINDI"
+    SMTP_POOL_SIZE: int = 2  # 재사용할 인증된 SMTP 연결 수
+    SMTP_POOL_MAX_IDLE_SECONDS: int = 60  # 이 시간 이상 쉰 연결은 NOOP으로 확인 후 사용
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    EMAIL_TEMPLATE_CACHE_DIR: str = ""  # Jinja2 바이트코드 캐시 경로 (비우면 시스템 임시 디렉토리)
+
+    # 이메일 발송 대기열(outbox) 워커 설정
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5.0
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 60  # 재시도 간격 = 기본값 * 2^(시도 횟수 - 1)
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 300  # 발송 중 워커가 죽은 경우 이 시간 후 재시도
+
+    # 스케줄러 리더 선출 설정 (여러 워커 중 1개 프로세스만 스케줄 작업 실행)
+    SCHEDULER_LEADER_ELECTION: bool = True
+    SCHEDULER_LEADER_LOCK_NAME: str = "mindi_scheduler_leader"
+    SCHEDULER_LEADER_CHECK_SECONDS: int = 15  # 리더 확인/인수 주기
+
+    # 배치 작업 실행 방식 (inline: API 이벤트 루프에서 실행, process: 별도 프로세스에서 실행)
+    SCHEDULER_BATCH_EXECUTION: str = "process"
+
+    # API 응답 압축 설정
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 1024  # 이보다 작은 응답은 압축하지 않음
+    RESPONSE_GZIP_LEVEL: int = 6
+    RESPONSE_BROTLI_QUALITY: int = 4  # brotli 패키지가 설치된 경우 사용 (0~11)
+
+    # 요청별 DB 쿼리 프로파일러 (개발/점검용, 켜면 모든 쿼리에 이벤트 훅이 붙음)
+    DB_PROFILE_ENABLED: bool = False
+    DB_PROFILE_SLOW_QUERY_MS: float = 100.0
+    DB_PROFILE_N_PLUS_ONE_THRESHOLD: int = 5  # 같은 형태의 쿼리가 이 횟수 이상이면 N+1로 표시
+    DB_PROFILE_HEADER: bool = True  # 응답에 X-DB-Profile 헤더 추가
+
+    # 이벤트 루프 차단 감지 (개발/점검용, 켜면 워커/배치 프로세스마다 감시 스레드가 스택을 캡처함)
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1  # 루프 지연 측정 간격
+    LOOP_MONITOR_BLOCK_THRESHOLD_SECONDS: float = 0.25  # 이 시간 이상 멈추면 스택과 라우트를 기록
+    LOOP_MONITOR_SAMPLE_WINDOW: int = 3000  # 백분위 계산에 쓰는 최근 측정값 수 (기본 간격에서 약 5분)
+
+    # AI 서버 요청 설정
+    AI_REQUEST_COMPRESSION: str = "none"  # none, gzip 또는 zstd(zstandard 패키지 필요), AI 서버가 Content-Encoding을 해석하는 배포에서만 사용
+    AI_REQUEST_COMPRESSION_MIN_BYTES: int = 1024  # 이보다 작은 요청 본문은 압축하지 않음
+
+    # 주간 케어 리포트 배치 설정
+    WEEKLY_REPORT_CONCURRENCY: int = 8  # 동시에 처리할 사용자 수 (AI 서버 동시 요청 수)
+    WEEKLY_REPORT_CHUNK_SIZE: int = 200  # 한 번에 불러와 대화 로그를 미리 조회할 사용자 수
+    WEEKLY_REPORT_USER_TIMEOUT_SECONDS: float = 120.0  # 사용자 1명 처리 제한 시간 (시도당)
+    WEEKLY_REPORT_MAX_ATTEMPTS: int = 3
+    WEEKLY_REPORT_RETRY_BASE_SECONDS: float = 10.0  # 재시도 간격 = 기본값 * 2^(시도 횟수 - 1)
+    WEEKLY_REPORT_SPREAD_MINUTES: int = 0  # 0보다 크면 사용자별 고정 오프셋으로 이 시간 동안 나눠서 생성
+    WEEKLY_REPORT_MAX_PER_MINUTE: float = 0  # 분당 시작 수 상한 (0이면 측정한 AI 서버 응답 시간으로 계산)
+    WEEKLY_REPORT_AI_SHARE: float = 0.5  # 분산 모드에서 배치가 사용할 AI 서버 처리량 비율
+    WEEKLY_REPORT_PAYLOAD: str = "transcript"  # transcript: 대화 원문 전송, digest: 하루 요약 + 통계 전송 (AI 서버가 지원하는 배포에서만)
+    CARE_DIGEST_CONCURRENCY: int = 4  # 새벽 하루 요약 생성 시 AI 서버 동시 요청 수
+
+    # 케어 로그 아카이브 설정
+    CARE_LOG_RETENTION_MONTHS: int = 12  # DB(hot)에 보관할 개월 수
+    CARE_LOG_ARCHIVE_DIR: str = ""  # 모든 서버가 공유하는 절대 경로 또는 s3://bucket/prefix (비어 있으면 아카이브하지 않음)
+
+    # 케어 로그 쓰기 설정 (sync: 요청 내 즉시 커밋, write_behind: 백그라운드 일괄 저장)
+    CARE_LOG_WRITE_MODE: str = "sync"
+    CARE_LOG_WRITE_BEHIND_QUEUE_SIZE: int = 1000
+    CARE_LOG_WRITE_BEHIND_BATCH_SIZE: int = 100
+    CARE_LOG_WRITE_BEHIND_FLUSH_INTERVAL: float = 0.5  # 초, 유실 가능 구간의 최대 길이
+    CARE_LOG_WRITE_BEHIND_ON_FULL: str = "sync"  # 큐가 가득 찼을 때: sync(즉시 저장) 또는 drop
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -0,0 +1,50 @@
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# create_all은 없는 테이블만 만들기 때문에 기존 테이블에 추가된 컬럼/제약은 시작 시 여기서 반영합니다.
+# 각 단계는 이미 반영된 경우 아무 작업도 하지 않습니다(여러 번 실행해도 안전).
+
+
+def ensure_report_log_period(engine: Engine):
+    """report_logs.period 컬럼과 (user_id, report_type, period) 유니크 제약 추가"""
+    inspector = inspect(engine)
+    if "report_logs" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("report_logs")}
+    unique_names = {constraint["name"] for constraint in inspector.get_unique_constraints("report_logs")}
+    unique_names |= {index["name"] for index in inspector.get_indexes("report_logs") if index.get("unique")}
+
+    try:
+        with engine.begin() as connection:
+            if "period" not in columns:
+                logger.info("report_logs.period 컬럼을 추가합니다.")
+                connection.execute(text("ALTER TABLE report_logs ADD COLUMN period VARCHAR(32) NULL"))
+            if "uq_report_logs_user_type_period" not in unique_names:
+                logger.info("report_logs 기간 유니크 제약을 추가합니다.")
+                connection.execute(text(
+                    "CREATE UNIQUE INDEX uq_report_logs_user_type_period "
+                    "ON report_logs (user_id, report_type, period)"
+                ))
+    except Exception as e:
+        # 여러 워커가 동시에 시작하면 다른 워커가 먼저 반영했을 수 있음
+        inspector = inspect(engine)
+        if "period" in {column["name"] for column in inspector.get_columns("report_logs")}:
+            logger.info(f"report_logs 스키마는 다른 프로세스가 이미 갱신했습니다. ({e})")
+            return
+        # 권한 부족 등으로 반영하지 못하면 케어 리포트 생성/조회가 unknown column 오류로 실패하므로 분명히 남김
+        logger.error(
+            "report_logs 스키마를 갱신하지 못했습니다. 케어 리포트 생성이 실패합니다. "
+            "다음을 직접 실행하세요: ALTER TABLE report_logs ADD COLUMN period VARCHAR(32) NULL; "
+            "CREATE UNIQUE INDEX uq_report_logs_user_type_period ON report_logs (user_id, report_type, period); "
+            f"({e})"
+        )
+
+
+def run_migrations(engine: Engine):
+    """시작 시 기존 테이블 스키마 보완"""
+    ensure_report_log_period(engine)
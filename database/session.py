@@ -22,3 +22,15 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def pool_stats() -> dict:
+    """DB 연결 풀 상태 (QueuePool이 아니면 빈 딕셔너리)"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0)
+    }
@@ -0,0 +1,21 @@
+from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import List
+
+from . import auth_model
+
+def create_token_revocation(db: Session, user_id: int, reason: str) -> auth_model.TokenRevocation:
+    """토큰 무효화 기록 추가 (커밋은 호출한 쪽에서 수행)"""
+    revocation = auth_model.TokenRevocation(
+        user_id=user_id,
+        reason=reason,
+        revoked_at=datetime.now(timezone.utc).replace(tzinfo=None)
+    )
+    db.add(revocation)
+    return revocation
+
+def get_token_revocations_since(db: Session, since: datetime) -> List[auth_model.TokenRevocation]:
+    """특정 시각 이후의 토큰 무효화 기록 조회"""
+    return db.query(auth_model.TokenRevocation).filter(
+        auth_model.TokenRevocation.revoked_at >= since
+    ).all()
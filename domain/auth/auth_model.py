@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from database.session import Base
+
+class TokenRevocation(Base):
+    """토큰 무효화 기록 (stateless 인증 모드에서 이전에 발급된 토큰 차단용)"""
+    __tablename__ = "token_revocations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
+    reason = Column(String(20), nullable=False)  # revoked, tier_change, profile_change
+    revoked_at = Column(DateTime, nullable=False, index=True)  # 이 시각 이전에 발급된 토큰은 무효
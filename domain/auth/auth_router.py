@@ -5,7 +5,7 @@ from starlette import status
 
 from database import session
 from domain.user import user_crud, user_schema
-from security import verify_password, create_token_pair, verify_refresh_token, create_access_token, create_refresh_token
+from security import verify_password, create_token_pair, verify_refresh_token, get_current_user_profile
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -44,11 +44,8 @@ async def refresh_token(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # 새로운 access token 생성
-        access_token = create_access_token(data={"sub": phone})
-        
-        # 새로운 refresh token도 생성 (선택사항)
-        new_refresh_token = create_refresh_token(data={"sub": phone})
+        # 최신 사용자 클레임으로 새로운 access token과 refresh token 생성
+        access_token, new_refresh_token = create_token_pair(data={"sub": phone}, user=user)
         
         return user_schema.Token(
             access_token=access_token,
@@ -66,7 +63,7 @@ async def refresh_token(
 
 @router.post("/validate")
 async def validate_token(
-    current_user: user_schema.User = Depends(user_crud.get_current_user)
+    current_user: user_schema.User = Depends(get_current_user_profile)
 ):
     """
     현재 access token의 유효성을 검증하고 사용자 정보를 반환합니다.
@@ -76,5 +73,5 @@ async def validate_token(
         "phone": current_user.phone,
         "name": current_user.name,
         "email": current_user.email,
-        "is_active": current_user.is_active
+        "is_active": True  # 인증에 성공한 사용자
     } 
\ No newline at end of file
@@ -1,8 +1,13 @@
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from .care_model import CareLog
+from .care_model import CareLog, Conversation, CareDailyDigest
 from .care_schema import CareLogCreate
-from datetime import date, timedelta
-from typing import List, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+import uuid
+
+from services.care_archive_service import care_archive_service
 
 def create_care_log(db: Session, care_log: CareLogCreate):
     db_log = CareLog(
@@ -10,28 +15,225 @@ def create_care_log(db: Session, care_log: CareLogCreate):
         user_question=care_log.user_question,
         ai_reply=care_log.ai_reply,
         conversation_date=care_log.conversation_date,
-        conversation_id=care_log.conversation_id
+        conversation_id=care_log.conversation_id,
+        created_at=datetime.now(timezone.utc)
     )
     db.add(db_log)
+    record_conversation_turns(db, [{
+        "conversation_id": db_log.conversation_id,
+        "user_id": db_log.user_id,
+        "user_question": db_log.user_question,
+        "ai_reply": db_log.ai_reply,
+        "created_at": db_log.created_at
+    }])
     db.commit()
     db.refresh(db_log)
     return db_log
 
+def create_conversation(db: Session, user_id: int) -> Conversation:
+    """대화 세션 생성"""
+    db_conversation = Conversation(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        started_at=datetime.now(timezone.utc),
+        turn_count=0
+    )
+    db.add(db_conversation)
+    db.commit()
+    db.refresh(db_conversation)
+    return db_conversation
+
+def get_conversation(db: Session, conversation_id: str) -> Optional[Conversation]:
+    return db.query(Conversation).filter(Conversation.id == conversation_id).first()
+
+def get_conversations_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 20) -> List[Conversation]:
+    """사용자의 대화 세션 목록 조회 (최신순)"""
+    return db.query(Conversation).filter(
+        Conversation.user_id == user_id
+    ).order_by(Conversation.started_at.desc()).offset(skip).limit(limit).all()
+
+def _conversation_turn_update(conversation_turns: List[dict]) -> dict:
+    """세션 통계 갱신 값 (동시 요청에도 누락되지 않도록 증가 연산은 DB에서 수행)"""
+    first_turn, last_turn = conversation_turns[0], conversation_turns[-1]
+    return {
+        Conversation.turn_count: Conversation.turn_count + len(conversation_turns),
+        Conversation.first_turn_at: func.coalesce(Conversation.first_turn_at, first_turn["created_at"]),
+        Conversation.last_turn_at: last_turn["created_at"],
+        Conversation.last_user_question: last_turn["user_question"],
+        Conversation.last_ai_reply: last_turn["ai_reply"]
+    }
+
+def is_conversation_owned_by_other(db: Session, conversation_id: str, user_id: int) -> bool:
+    """다른 사용자의 대화 세션 ID인지 확인 (없는 세션이면 False)"""
+    return db.query(Conversation.id).filter(
+        Conversation.id == conversation_id,
+        Conversation.user_id != user_id
+    ).first() is not None
+
+def record_conversation_turns(db: Session, turns: List[dict]):
+    """저장되는 대화 턴으로 세션 통계 갱신 (커밋은 호출한 쪽에서 로그와 함께 수행)
+
+    세션 행은 소유자의 턴으로만 갱신하며, 다른 사용자의 세션 ID로 들어온 턴은 통계에 반영하지 않습니다.
+    """
+    turns_by_conversation = {}
+    for turn in turns:
+        turns_by_conversation.setdefault((turn["conversation_id"], turn["user_id"]), []).append(turn)
+    
+    for (conversation_id, user_id), conversation_turns in turns_by_conversation.items():
+        conversation_turns.sort(key=lambda turn: turn["created_at"])
+        first_turn, last_turn = conversation_turns[0], conversation_turns[-1]
+        owner_filter = (Conversation.id == conversation_id, Conversation.user_id == user_id)
+        
+        updated = db.query(Conversation).filter(*owner_filter).update(
+            _conversation_turn_update(conversation_turns), synchronize_session=False
+        )
+        
+        if updated or is_conversation_owned_by_other(db, conversation_id, user_id):
+            continue
+        
+        # /conversation/start 없이 시작된 세션
+        # 같은 세션의 첫 턴이 동시에 저장되면 한쪽의 insert가 기본 키 충돌로 실패하므로
+        # savepoint만 되돌리고(로그 insert는 유지) 먼저 생성된 행에 갱신 (소유자가 다르면 갱신되지 않음)
+        try:
+            with db.begin_nested():
+                db.add(Conversation(
+                    id=conversation_id,
+                    user_id=user_id,
+                    started_at=first_turn["created_at"],
+                    first_turn_at=first_turn["created_at"],
+                    last_turn_at=last_turn["created_at"],
+                    turn_count=len(conversation_turns),
+                    last_user_question=last_turn["user_question"],
+                    last_ai_reply=last_turn["ai_reply"]
+                ))
+        except IntegrityError:
+            db.query(Conversation).filter(*owner_filter).update(
+                _conversation_turn_update(conversation_turns), synchronize_session=False
+            )
+
+def end_conversation(db: Session, conversation_id: str, user_id: int) -> Optional[Conversation]:
+    """사용자 본인의 대화 세션 종료 시각 기록 (다른 사용자의 세션이면 None)"""
+    conversation = db.query(Conversation).filter(
+        Conversation.id == conversation_id,
+        Conversation.user_id == user_id
+    ).first()
+    if conversation and conversation.ended_at is None:
+        conversation.ended_at = datetime.now(timezone.utc)
+        db.commit()
+        db.refresh(conversation)
+    return conversation
+
 def get_last_care_log_by_user(db: Session, user_id: int):
     return db.query(CareLog).filter(CareLog.user_id == user_id).order_by(CareLog.created_at.desc()).first()
 
+def _with_archived_logs(db: Session, logs: List[CareLog], user_id: int, start_date: date, end_date: date) -> List[CareLog]:
+    """보관 기간 이전 날짜가 포함된 조회라면 아카이브 로그를 앞에 합쳐서 반환"""
+    if start_date >= care_archive_service.retention_cutoff():
+        return logs
+    
+    # 아카이브 직후 삭제 전 구간에는 양쪽에 같은 로그가 있을 수 있으므로 id로 중복 제거
+    hot_ids = {log.id for log in logs}
+    archived_logs = [
+        log for log in care_archive_service.load_care_logs(db, user_id, start_date, end_date)
+        if log.id not in hot_ids
+    ]
+    return archived_logs + logs
+
 def get_care_logs_for_week(db: Session, user_id: int, start_of_week: date, end_of_week: date):
-    return db.query(CareLog).filter(
+    logs = db.query(CareLog).filter(
         CareLog.user_id == user_id,
         CareLog.conversation_date >= start_of_week,
         CareLog.conversation_date <= end_of_week
     ).order_by(CareLog.conversation_date).all()
+    return _with_archived_logs(db, logs, user_id, start_of_week, end_of_week)
 
-def get_care_logs_by_conversation_id(db: Session, conversation_id: str):
-    """특정 대화 세션의 모든 로그 조회"""
-    return db.query(CareLog).filter(
-        CareLog.conversation_id == conversation_id
-    ).order_by(CareLog.created_at).all()
+def get_care_logs_for_users(
+    db: Session,
+    user_ids: List[int],
+    start_date: date,
+    end_date: date
+) -> Dict[int, Dict[date, list]]:
+    """여러 사용자의 기간 내 대화 로그를 한 번에 조회해 {user_id: {날짜: [로그]}}로 묶어서 반환
+
+    리포트 배치에서 사용자 x 날짜마다 조회하지 않도록 필요한 컬럼만 한 쿼리로 가져옵니다.
+    """
+    grouped: Dict[int, Dict[date, list]] = {user_id: {} for user_id in user_ids}
+    if not user_ids:
+        return grouped
+
+    rows = db.query(
+        CareLog.id,
+        CareLog.user_id,
+        CareLog.conversation_date,
+        CareLog.user_question,
+        CareLog.ai_reply,
+        CareLog.conversation_id,
+        CareLog.created_at
+    ).filter(
+        CareLog.user_id.in_(user_ids),
+        CareLog.conversation_date >= start_date,
+        CareLog.conversation_date <= end_date
+    ).order_by(CareLog.user_id, CareLog.conversation_date, CareLog.created_at).all()
+
+    logs_by_user: Dict[int, list] = {user_id: [] for user_id in user_ids}
+    for row in rows:
+        logs_by_user[row.user_id].append(row)
+
+    for user_id, logs in logs_by_user.items():
+        for log in _with_archived_logs(db, logs, user_id, start_date, end_date):
+            grouped[user_id].setdefault(log.conversation_date, []).append(log)
+    return grouped
+
+def get_daily_digests_for_users(
+    db: Session,
+    user_ids: List[int],
+    start_date: date,
+    end_date: date
+) -> Dict[int, Dict[date, CareDailyDigest]]:
+    """여러 사용자의 기간 내 하루 요약을 한 번에 조회 ({user_id: {날짜: 요약}})"""
+    grouped: Dict[int, Dict[date, CareDailyDigest]] = {user_id: {} for user_id in user_ids}
+    if not user_ids:
+        return grouped
+
+    digests = db.query(CareDailyDigest).filter(
+        CareDailyDigest.user_id.in_(user_ids),
+        CareDailyDigest.digest_date >= start_date,
+        CareDailyDigest.digest_date <= end_date
+    ).all()
+    for digest in digests:
+        grouped[digest.user_id][digest.digest_date] = digest
+    return grouped
+
+def save_daily_digest(db: Session, user_id: int, digest_date: date, digest: dict) -> CareDailyDigest:
+    """하루 요약 저장 (다른 작업이 먼저 저장했다면 기존 요약 반환)"""
+    db_digest = CareDailyDigest(
+        user_id=user_id,
+        digest_date=digest_date,
+        summary_text=digest["summary_text"],
+        key_topics=digest.get("key_topics"),
+        emotional_tone=digest.get("emotional_tone"),
+        conversation_count=digest["conversation_count"],
+        duration_minutes=digest.get("duration_minutes"),
+        created_at=datetime.now(timezone.utc)
+    )
+    db.add(db_digest)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return db.query(CareDailyDigest).filter(
+            CareDailyDigest.user_id == user_id,
+            CareDailyDigest.digest_date == digest_date
+        ).first()
+    db.refresh(db_digest)
+    return db_digest
+
+def get_care_logs_by_conversation_id(db: Session, conversation_id: str, user_id: Optional[int] = None):
+    """특정 대화 세션의 모든 로그 조회 (user_id가 주어지면 해당 사용자의 로그만)"""
+    query = db.query(CareLog).filter(CareLog.conversation_id == conversation_id)
+    if user_id is not None:
+        query = query.filter(CareLog.user_id == user_id)
+    return query.order_by(CareLog.created_at).all()
 
 def get_recent_care_logs(db: Session, user_id: int, limit: int = 5):
     """사용자의 최근 대화 로그 조회"""
@@ -39,9 +241,24 @@ def get_recent_care_logs(db: Session, user_id: int, limit: int = 5):
         CareLog.user_id == user_id
     ).order_by(CareLog.created_at.desc()).limit(limit).all()
 
-def get_conversation_summary(db: Session, conversation_id: str):
-    """대화 세션 요약 정보 조회"""
-    logs = get_care_logs_by_conversation_id(db, conversation_id)
+def get_conversation_summary(db: Session, conversation_id: str, user_id: int):
+    """사용자 본인의 대화 세션 요약 정보 조회"""
+    conversation = get_conversation(db, conversation_id)
+    if conversation and conversation.user_id != user_id:
+        return None
+    if conversation:
+        if not conversation.turn_count:
+            return None
+        return {
+            "conversation_id": conversation_id,
+            "start_time": conversation.first_turn_at,
+            "end_time": conversation.last_turn_at,
+            "turn_count": conversation.turn_count,
+            "total_duration": (conversation.last_turn_at - conversation.first_turn_at).total_seconds()
+        }
+    
+    # conversations 테이블 도입 이전 세션은 로그에서 계산
+    logs = get_care_logs_by_conversation_id(db, conversation_id, user_id=user_id)
     if not logs:
         return None
     
@@ -53,10 +270,11 @@ def get_conversation_summary(db: Session, conversation_id: str):
         "total_duration": (logs[-1].created_at - logs[0].created_at).total_seconds()
     }
 
-def get_latest_care_log_by_conversation(db: Session, conversation_id: str):
-    """특정 대화 세션의 최신 로그 조회"""
+def get_latest_care_log_by_conversation(db: Session, conversation_id: str, user_id: int):
+    """사용자 본인의 특정 대화 세션 최신 로그 조회"""
     return db.query(CareLog).filter(
-        CareLog.conversation_id == conversation_id
+        CareLog.conversation_id == conversation_id,
+        CareLog.user_id == user_id
     ).order_by(CareLog.created_at.desc()).first()
 
 def get_latest_conversation_date_logs(db: Session, user_id: int) -> List[CareLog]:
@@ -81,16 +299,20 @@ def get_daily_conversations(db: Session, user_id: int, target_date: Optional[dat
     if target_date is None:
         target_date = date.today()
     
-    return db.query(CareLog).filter(
+    logs = db.query(CareLog).filter(
         CareLog.user_id == user_id,
         CareLog.conversation_date == target_date
     ).order_by(CareLog.created_at).all()
+    return _with_archived_logs(db, logs, user_id, target_date, target_date)
 
 def check_daily_conversation_status(db: Session, user_id: int, target_date: Optional[date] = None) -> bool:
     """특정 날짜에 대화했는지 확인 (일일 기록 현황용)"""
     if target_date is None:
         target_date = date.today()
     
+    if target_date < care_archive_service.retention_cutoff():
+        return len(care_archive_service.load_care_logs(db, user_id, target_date, target_date)) > 0
+    
     conversation_count = db.query(CareLog).filter(
         CareLog.user_id == user_id,
         CareLog.conversation_date == target_date
@@ -98,11 +320,18 @@ def check_daily_conversation_status(db: Session, user_id: int, target_date: Opti
     
     return conversation_count > 0
 
+def get_care_log_version(db: Session, user_id: int) -> tuple:
+    """사용자 대화 로그의 버전 (최신 id, 건수) - 조건부 조회(ETag)용"""
+    return tuple(db.query(func.max(CareLog.id), func.count(CareLog.id)).filter(
+        CareLog.user_id == user_id
+    ).one())
+
 def get_total_conversation_count(db: Session, user_id: int) -> int:
-    """사용자의 총 대화 횟수 반환"""
-    return db.query(CareLog).filter(
+    """사용자의 총 대화 횟수 반환 (아카이브 포함)"""
+    hot_count = db.query(CareLog).filter(
         CareLog.user_id == user_id
     ).count()
+    return hot_count + care_archive_service.count_care_logs(db, user_id)
 
 def get_conversation_categories_from_previous_day(db: Session, user_id: int, target_date: Optional[date] = None) -> List[str]:
     """전날 대화에서 주요 카테고리/키워드 추출 (기본 구현)"""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, JSON, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from database.session import Base
@@ -13,4 +13,48 @@ class CareLog(Base):
     conversation_id = Column(String(36), nullable=False, index=True)  # 대화 세션 ID
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
 
-    user = relationship("User", back_populates="care_logs")
\ No newline at end of file
+    user = relationship("User", back_populates="care_logs")
+
+class Conversation(Base):
+    """대화 세션 (세션 통계를 비정규화하여 보관)"""
+    __tablename__ = "conversations"
+    id = Column(String(36), primary_key=True)  # conversation_id
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
+    started_at = Column(DateTime, nullable=False, index=True)  # 세션 시작 시각
+    first_turn_at = Column(DateTime, nullable=True)
+    last_turn_at = Column(DateTime, nullable=True)
+    ended_at = Column(DateTime, nullable=True)
+    turn_count = Column(Integer, nullable=False, default=0)
+    last_user_question = Column(String(2048), nullable=True)  # 마지막 턴 사용자 질문
+    last_ai_reply = Column(String(4096), nullable=True)       # 마지막 턴 AI 답변
+
+class CareLogArchive(Base):
+    """사용자별 월 단위 아카이브 로그 수 (아카이브 파일 인덱스)
+
+    DB에서 로그를 삭제하는 트랜잭션에서 함께 갱신되므로 DB 로그 수와 합치면 항상 정확한 총 대화 수가 됩니다.
+    """
+    __tablename__ = "care_log_archives"
+    __table_args__ = (
+        UniqueConstraint("user_id", "archive_month", name="uq_care_log_archives_user_month"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    archive_month = Column(Date, nullable=False)  # 해당 월 1일
+    log_count = Column(Integer, nullable=False, default=0)
+    archived_at = Column(DateTime, nullable=False)
+
+class CareDailyDigest(Base):
+    """사용자별 하루 대화 요약 (주간 리포트에 대화 원문 대신 전달)"""
+    __tablename__ = "care_daily_digests"
+    __table_args__ = (
+        UniqueConstraint("user_id", "digest_date", name="uq_care_daily_digests_user_date"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    digest_date = Column(Date, nullable=False)
+    summary_text = Column(Text, nullable=False)
+    key_topics = Column(JSON, nullable=True)
+    emotional_tone = Column(String(50), nullable=True)
+    conversation_count = Column(Integer, nullable=False, default=0)
+    duration_minutes = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False)
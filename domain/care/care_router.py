@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Body, Depends, UploadFile, File, Form, Request
+from fastapi import APIRouter, HTTPException, Body, Depends, UploadFile, File, Form, Request, Response
 from fastapi.responses import StreamingResponse
 import boto3
 from sqlalchemy.orm import Session
@@ -15,6 +15,12 @@ from domain.care import care_schema
 from domain.user import user_schema, user_crud
 from database.session import get_db
 from security import get_current_user
+from conditional import etag_for
+from serialization import orm_list_response
+from services.care_log_writer_service import care_log_writer_service
+from services.care_digest_service import care_digest_service
+from services.ai_client import ai_client
+from services.metrics_service import metrics_service
 from . import care_crud
 
 router = APIRouter(
@@ -29,7 +35,9 @@ polly_client = boto3.Session(
 AI_STT_REPLY_URL = "http://localhost:8001/stt-and-reply"
 # 🆕 새로운 AI 서버 엔드포인트들
 AI_PERSONALIZED_GREETING_URL = "http://localhost:8001/personalized-greeting"
-AI_CONVERSATION_SUMMARY_URL = "http://localhost:8001/conversation-summary"
+
+# 대화 로그가 바뀌지 않았으면 304로 응답하는 조건부 조회 의존성
+care_log_etag = etag_for(lambda db, user: care_crud.get_care_log_version(db, user.id))
 
 def polly_tts(text: str):
     response = polly_client.synthesize_speech(
@@ -43,6 +51,11 @@ def polly_tts(text: str):
         raise HTTPException(status_code=500, detail="Polly API로부터 오디오 스트림을 받지 못했습니다.")
     return StreamingResponse(audio_stream, media_type="audio/mpeg")
 
+def _check_conversation_owner(db: Session, conversation_id: str, user_id: int):
+    """다른 사용자의 대화 세션 ID로 대화를 기록하지 못하도록 확인"""
+    if care_crud.is_conversation_owned_by_other(db, conversation_id, user_id):
+        raise HTTPException(status_code=403, detail="다른 사용자의 대화 세션입니다.")
+
 @router.post("/audio-to-answer")
 async def audio_to_answer(
     file: UploadFile = File(...),
@@ -51,18 +64,21 @@ async def audio_to_answer(
     db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
 ):
+    _check_conversation_owner(db, conversation_id, current_user.id)
     os.makedirs("uploads", exist_ok=True)
     ext = (file.filename.split('.')[-1] if file.filename and '.' in file.filename else 'webm')
     raw_filename = f"{uuid.uuid4()}.{ext}"
     raw_path = os.path.join("uploads", raw_filename)
-    with open(raw_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    with metrics_service.stage("voice_turn", "upload"):
+        with open(raw_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
     # wav 변환
     wav_filename = raw_filename.rsplit('.', 1)[0] + ".wav"
     wav_path = os.path.join("uploads", wav_filename)
     try:
-        audio = AudioSegment.from_file(raw_path)
-        audio.export(wav_path, format="wav")
+        with metrics_service.stage("voice_turn", "transcode"):
+            audio = AudioSegment.from_file(raw_path)
+            audio.export(wav_path, format="wav")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"wav 변환 실패: {e}")
     # AI 서버로 wav 파일 + messages 전송
@@ -70,7 +86,8 @@ async def audio_to_answer(
         files = {"file": (wav_filename, wav_file, "audio/wav")}
         data = {"messages": messages}
         async with httpx.AsyncClient() as client:
-            ai_response = await client.post(AI_STT_REPLY_URL, files=files, data=data, timeout=30)
+            with metrics_service.stage("voice_turn", "stt_reply"):
+                ai_response = await client.post(AI_STT_REPLY_URL, files=files, data=data, timeout=30)
             if ai_response.status_code != 200:
                 raise HTTPException(status_code=500, detail="AI 서버 오류")
             ai_data = ai_response.json()
@@ -81,12 +98,13 @@ async def audio_to_answer(
     # os.remove(raw_path)
     # os.remove(wav_path)
     # Polly TTS 변환
-    tts_response = polly_client.synthesize_speech(
-        Engine='neural',
-        OutputFormat='mp3',
-        Text=ai_reply,
-        VoiceId='Seoyeon'
-    )
+    with metrics_service.stage("voice_turn", "tts"):
+        tts_response = polly_client.synthesize_speech(
+            Engine='neural',
+            OutputFormat='mp3',
+            Text=ai_reply,
+            VoiceId='Seoyeon'
+        )
     audio_stream = tts_response.get("AudioStream")
     if not audio_stream:
         raise HTTPException(status_code=500, detail="Polly API로부터 오디오 스트림을 받지 못했습니다.")
@@ -98,7 +116,8 @@ async def audio_to_answer(
         conversation_date=date.today(),
         conversation_id=conversation_id  # 대화 세션 ID 저장
     )
-    care_log_id = care_crud.create_care_log(db=db, care_log=care_log)
+    with metrics_service.stage("voice_turn", "persist"):
+        care_log_writer_service.write(db, care_log)
     # 음성 파일만 반환 (텍스트는 DB에 저장됨)
     return StreamingResponse(audio_stream, media_type="audio/mpeg")
 
@@ -132,6 +151,7 @@ def log_care_activity(
     db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
 ):
+    _check_conversation_owner(db, care_log.conversation_id, current_user.id)
     # user_id를 강제로 현재 로그인 사용자로 세팅
     care_log_data = care_log.dict()
     care_log_data["user_id"] = current_user.id
@@ -148,7 +168,7 @@ def get_last_log(
         raise HTTPException(status_code=404, detail="대화 기록이 없습니다.")
     return log
 
-@router.get("/total-count")
+@router.get("/total-count", dependencies=[Depends(care_log_etag)])
 def get_total_conversation_count(
     db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
@@ -159,27 +179,30 @@ def get_total_conversation_count(
 
 @router.get("/logs/week", response_model=list[care_schema.CareLog])
 def get_weekly_logs(
+        response: Response,
         db: Session = Depends(get_db),
         current_user: user_schema.User = Depends(get_current_user)
 ):
     today = date.today()
     start_of_week = today - timedelta(days=today.weekday())
     end_of_week = today + timedelta(days=6)
-    return care_crud.get_care_logs_for_week(
+    logs = care_crud.get_care_logs_for_week(
         db=db, user_id=current_user.id, start_of_week=start_of_week, end_of_week=end_of_week
     )
+    return orm_list_response(logs, care_schema.CareLog, response)
 
 @router.get("/conversation/{conversation_id}", response_model=list[care_schema.CareLog])
 def get_conversation_logs(
     conversation_id: str,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
 ):
     """특정 대화 세션의 모든 로그 조회"""
-    logs = care_crud.get_care_logs_by_conversation_id(db, conversation_id)
+    logs = care_crud.get_care_logs_by_conversation_id(db, conversation_id, user_id=current_user.id)
     if not logs:
         raise HTTPException(status_code=404, detail="대화 세션을 찾을 수 없습니다.")
-    return logs
+    return orm_list_response(logs, care_schema.CareLog, response)
 
 @router.get("/conversation/{conversation_id}/summary")
 def get_conversation_summary(
@@ -188,7 +211,7 @@ def get_conversation_summary(
     current_user: user_schema.User = Depends(get_current_user)
 ):
     """대화 세션 요약 정보 조회"""
-    summary = care_crud.get_conversation_summary(db, conversation_id)
+    summary = care_crud.get_conversation_summary(db, conversation_id, current_user.id)
     if not summary:
         raise HTTPException(status_code=404, detail="대화 세션을 찾을 수 없습니다.")
     return summary
@@ -200,7 +223,7 @@ def get_latest_conversation_text(
     current_user: user_schema.User = Depends(get_current_user)
 ):
     """특정 대화 세션의 최신 대화 내용 조회 (텍스트만)"""
-    log = care_crud.get_latest_care_log_by_conversation(db, conversation_id)
+    log = care_crud.get_latest_care_log_by_conversation(db, conversation_id, current_user.id)
     if not log:
         raise HTTPException(status_code=404, detail="대화 내용을 찾을 수 없습니다.")
     return {
@@ -216,7 +239,7 @@ def get_all_conversation_texts(
     current_user: user_schema.User = Depends(get_current_user)
 ):
     """특정 대화 세션의 모든 대화 내용 조회 (텍스트만)"""
-    logs = care_crud.get_care_logs_by_conversation_id(db, conversation_id)
+    logs = care_crud.get_care_logs_by_conversation_id(db, conversation_id, user_id=current_user.id)
     if not logs:
         raise HTTPException(status_code=404, detail="대화 세션을 찾을 수 없습니다.")
     return [
@@ -230,12 +253,25 @@ def get_all_conversation_texts(
 
 @router.post("/conversation/start")
 def start_conversation(
+    db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
 ):
     """대화 세션 시작: 새로운 conversation_id 발급"""
-    conversation_id = str(uuid.uuid4())
+    conversation = care_crud.create_conversation(db, current_user.id)
     start_time = datetime.now().isoformat()
-    return {"conversation_id": conversation_id, "start_time": start_time}
+    return {"conversation_id": conversation.id, "start_time": start_time}
+
+@router.get("/conversations", response_model=list[care_schema.Conversation])
+def get_conversations(
+    response: Response,
+    skip: int = 0,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: user_schema.User = Depends(get_current_user)
+):
+    """사용자의 대화 세션 목록 조회 (최신순)"""
+    conversations = care_crud.get_conversations_by_user(db, current_user.id, skip=skip, limit=limit)
+    return orm_list_response(conversations, care_schema.Conversation, response)
 
 @router.post("/conversation/end/{conversation_id}")
 def end_conversation(
@@ -244,7 +280,21 @@ def end_conversation(
     current_user: user_schema.User = Depends(get_current_user)
 ):
     """대화 세션 종료: 해당 세션의 로그 요약 반환"""
-    logs = care_crud.get_care_logs_by_conversation_id(db, conversation_id)
+    conversation = care_crud.end_conversation(db, conversation_id, current_user.id)
+    if conversation:
+        if not conversation.turn_count:
+            raise HTTPException(status_code=404, detail="대화 세션을 찾을 수 없습니다.")
+        return {
+            "conversation_id": conversation_id,
+            "turn_count": conversation.turn_count,
+            "start_time": conversation.first_turn_at,
+            "end_time": conversation.last_turn_at,
+            "last_user_question": conversation.last_user_question,
+            "last_ai_reply": conversation.last_ai_reply
+        }
+    
+    # conversations 테이블 도입 이전 세션은 로그에서 계산 (본인 로그만)
+    logs = care_crud.get_care_logs_by_conversation_id(db, conversation_id, user_id=current_user.id)
     if not logs:
         raise HTTPException(status_code=404, detail="대화 세션을 찾을 수 없습니다.")
     # 간단 요약: turn 수, 시작/종료 시각, 최근 질문/답변
@@ -296,9 +346,10 @@ async def get_personalized_greeting(
     
     try:
         async with httpx.AsyncClient() as client:
-            ai_response = await client.post(
+            ai_response = await ai_client.post_json(
+                client,
                 AI_PERSONALIZED_GREETING_URL,
-                json=context_data,
+                context_data,
                 timeout=30
             )
             if ai_response.status_code != 200:
@@ -318,7 +369,7 @@ async def get_personalized_greeting(
         has_previous_conversation=True
     )
 
-@router.get("/daily-status", response_model=care_schema.DailyStatusResponse)
+@router.get("/daily-status", response_model=care_schema.DailyStatusResponse, dependencies=[Depends(care_log_etag)])
 def get_daily_status(
     target_date: Optional[str] = None,  # YYYY-MM-DD 형식
     db: Session = Depends(get_db),
@@ -347,7 +398,7 @@ def get_daily_status(
         last_conversation_time=last_conversation_time
     )
 
-@router.get("/weekly-status", response_model=care_schema.WeeklyStatusResponse)
+@router.get("/weekly-status", response_model=care_schema.WeeklyStatusResponse, dependencies=[Depends(care_log_etag)])
 def get_weekly_status(
     target_date: Optional[str] = None,  # YYYY-MM-DD 형식
     db: Session = Depends(get_db),
@@ -399,35 +450,18 @@ async def get_daily_summary(
     if not daily_conversations:
         raise HTTPException(status_code=404, detail="해당 날짜에 대화 기록이 없습니다.")
     
-    # AI 서버에 대화 요약 요청
-    summary_data = {
-        "user_id": current_user.id,
-        "target_date": parsed_date.isoformat(),
-        "conversations": [
-            {
-                "user_question": log.user_question,
-                "ai_reply": log.ai_reply,
-                "created_at": log.created_at.isoformat(),
-                "conversation_id": log.conversation_id
-            }
-            for log in daily_conversations
-        ]
-    }
-    
+    # AI 서버에 대화 요약 요청 (지난 날짜는 저장된 하루 요약을 재사용하고 없으면 저장)
     try:
+        stored_digest = care_crud.get_daily_digests_for_users(
+            db, [current_user.id], parsed_date, parsed_date
+        )[current_user.id].get(parsed_date)
         async with httpx.AsyncClient() as client:
-            ai_response = await client.post(
-                AI_CONVERSATION_SUMMARY_URL,
-                json=summary_data,
-                timeout=30
+            digest = await care_digest_service.get_or_create_digest(
+                db, client, current_user.id, parsed_date, daily_conversations, digest=stored_digest
             )
-            if ai_response.status_code != 200:
-                raise HTTPException(status_code=500, detail="AI 서버에서 요약 생성 실패")
-            
-            ai_data = ai_response.json()
-            summary_text = ai_data.get("summary_text", "요약을 생성할 수 없습니다.")
-            key_topics = ai_data.get("key_topics", [])
-            emotional_tone = ai_data.get("emotional_tone")
+        summary_text = digest["summary_text"]
+        key_topics = digest["key_topics"]
+        emotional_tone = digest["emotional_tone"]
             
     except Exception as e:
         print(f"AI 서버 통신 오류: {e}")
@@ -17,11 +17,26 @@ class CareLogRead(CareLogBase):
     created_at: datetime
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class CareLog(CareLogRead):
     pass
 
+class Conversation(BaseModel):
+    """대화 세션 정보"""
+    id: str
+    user_id: int
+    started_at: datetime
+    first_turn_at: Optional[datetime] = None
+    last_turn_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    turn_count: int
+    last_user_question: Optional[str] = None
+    last_ai_reply: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class PersonalizedGreetingResponse(BaseModel):
     """개인화된 인사말 응답"""
     greeting_text: str
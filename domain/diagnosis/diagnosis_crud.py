@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from datetime import date, datetime, timezone
 from typing import List, Optional
 
@@ -43,6 +43,13 @@ def get_diagnosis_history_by_user(db: Session, user_id: int, limit: int = 10) ->
         .limit(limit)\
         .all()
 
+def get_diagnosis_version(db: Session, user_id: int) -> tuple:
+    """사용자 진단 기록의 버전 (최신 id, 건수) - 조건부 조회(ETag)용"""
+    return tuple(db.query(
+        func.max(diagnosis_model.DiagnosisLog.id),
+        func.count(diagnosis_model.DiagnosisLog.id)
+    ).filter(diagnosis_model.DiagnosisLog.user_id == user_id).one())
+
 def get_diagnosis_by_date_range(db: Session, user_id: int, start_date: date, end_date: date) -> List[diagnosis_model.DiagnosisLog]:
     """특정 기간의 진단 기록 조회"""
     return db.query(diagnosis_model.DiagnosisLog)\
@@ -1,5 +1,5 @@
 import shutil
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Response
 from pathlib import Path
 from pydub import AudioSegment
 import httpx
@@ -12,9 +12,14 @@ from typing import List
 from database.session import get_db
 from domain.user import user_schema, user_crud
 from security import get_current_user
+from conditional import etag_for
+from serialization import orm_list_response
 from . import diagnosis_crud, diagnosis_schema
 from domain.report import report_crud, report_schema
 from services.email_service import email_service
+from services.email_outbox_service import email_outbox_service
+from services.ai_client import ai_client
+from services.metrics_service import metrics_service
 
 # APIRouter 인스턴스 생성
 router = APIRouter(
@@ -25,6 +30,9 @@ router = APIRouter(
 # AI 서버 URL
 AI_DIAGNOSIS_URL = "http://localhost:8001/diagnosis"
 
+# 진단 기록이 바뀌지 않았으면 304로 응답하는 조건부 조회 의존성 (결과에 사용자 이름 포함)
+diagnosis_etag = etag_for(lambda db, user: (*diagnosis_crud.get_diagnosis_version(db, user.id), user.name))
+
 # 녹음 파일을 저장할 디렉토리 설정
 UPLOAD_DIRECTORY = Path("uploads/")
 UPLOAD_DIRECTORY.mkdir(parents=True, exist_ok=True)
@@ -44,16 +52,18 @@ async def audio_to_diagnosis(
     raw_filename = f"{uuid.uuid4()}.{ext}"
     raw_path = os.path.join("uploads", raw_filename)
     
-    with open(raw_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    with metrics_service.stage("diagnosis_audio", "upload"):
+        with open(raw_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
     
     # wav 변환
     wav_filename = raw_filename.rsplit('.', 1)[0] + ".wav"
     wav_path = os.path.join("uploads", wav_filename)
     
     try:
-        audio = AudioSegment.from_file(raw_path)
-        audio.export(wav_path, format="wav")
+        with metrics_service.stage("diagnosis_audio", "transcode"):
+            audio = AudioSegment.from_file(raw_path)
+            audio.export(wav_path, format="wav")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"wav 변환 실패: {e}")
     
@@ -67,12 +77,13 @@ async def audio_to_diagnosis(
             }
             
             async with httpx.AsyncClient() as client:
-                ai_response = await client.post(
-                    AI_DIAGNOSIS_URL, 
-                    files=files, 
-                    data=data, 
-                    timeout=30
-                )
+                with metrics_service.stage("diagnosis_audio", "ai_upload"):
+                    ai_response = await client.post(
+                        AI_DIAGNOSIS_URL, 
+                        files=files, 
+                        data=data, 
+                        timeout=30
+                    )
                 
                 if ai_response.status_code != 200:
                     raise HTTPException(status_code=500, detail="AI 서버 파일 저장 오류")
@@ -135,11 +146,13 @@ async def submit_diagnosis(
         }
         
         async with httpx.AsyncClient() as client:
-            ai_response = await client.post(
-                f"{AI_DIAGNOSIS_URL}/final",
-                json=diagnosis_data,
-                timeout=120  # 전체 진단은 더 오래 걸림
-            )
+            with metrics_service.stage("diagnosis_submit", "ai_final"):
+                ai_response = await ai_client.post_json(
+                    client,
+                    f"{AI_DIAGNOSIS_URL}/final",
+                    diagnosis_data,
+                    timeout=120  # 전체 진단은 더 오래 걸림
+                )
             
             if ai_response.status_code != 200:
                 raise HTTPException(status_code=500, detail="AI 서버 최종 진단 오류")
@@ -161,25 +174,28 @@ async def submit_diagnosis(
                 detailed_analysis=diagnosis_result.get("detailed_analysis", ""),
             )
             
-            saved_diagnosis = diagnosis_crud.create_diagnosis_log(db, diagnosis_log_data)
+            with metrics_service.stage("diagnosis_submit", "persist"):
+                saved_diagnosis = diagnosis_crud.create_diagnosis_log(db, diagnosis_log_data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"진단 제출 오류: {e}")
 
     if (user.subscription_type != "standard"):
         try:
             async with httpx.AsyncClient() as client:
-                ai_response = await client.post(
-                    f"{AI_DIAGNOSIS_URL}/generate-diagnosis-report",
-                    json={
-                        "user_id": current_user.id,
-                        "acoustic_score_vit": diagnosis_result.get("acoustic_score_vit", 0),
-                        "acoustic_score_lgbm": diagnosis_result.get("acoustic_score_lgbm", 0),
-                        "language_score_BERT": diagnosis_result.get("language_score_BERT", 0),
-                        "language_score_gpt": diagnosis_result.get("language_score_gpt", 0),
-                        "user_name": current_user.name
-                    },
-                    timeout=120
-                )
+                with metrics_service.stage("diagnosis_submit", "ai_report"):
+                    ai_response = await ai_client.post_json(
+                        client,
+                        f"{AI_DIAGNOSIS_URL}/generate-diagnosis-report",
+                        {
+                            "user_id": current_user.id,
+                            "acoustic_score_vit": diagnosis_result.get("acoustic_score_vit", 0),
+                            "acoustic_score_lgbm": diagnosis_result.get("acoustic_score_lgbm", 0),
+                            "language_score_BERT": diagnosis_result.get("language_score_BERT", 0),
+                            "language_score_gpt": diagnosis_result.get("language_score_gpt", 0),
+                            "user_name": current_user.name
+                        },
+                        timeout=120
+                    )
 
                 if ai_response.status_code != 200:
                     raise HTTPException(status_code=500, detail="AI 서버에서 리포트 생성 실패")
@@ -200,39 +216,32 @@ async def submit_diagnosis(
                     }
                 }
                 
-                report_log = report_crud.create_report_log(
-                    db,
-                    report_schema.ReportLogCreate(
-                        user_id=current_user.id,
-                        report_type="diagnosis",
-                        report_data=report_data
-                    )
-                )
-                
-                # 유료 구독자에게 이메일 발송
+                # 유료 구독자 이메일은 리포트와 같은 트랜잭션으로 발송 대기열에 기록
+                email = None
                 if user.email:
-                    try:
-                        email_success = email_service.send_diagnosis_report(
+                    with metrics_service.stage("diagnosis_submit", "email"):
+                        email = email_service.compose_diagnosis_report(
                             to_email=user.email,
                             user_name=current_user.name,
                             evaluate_good_list=ai_response["evaluate_good_list"],
                             evaluate_bad_list=ai_response["evaluate_bad_list"],
                             result_good_list=ai_response["result_good_list"],
                             result_bad_list=ai_response["result_bad_list"],
-                            scores={
-                                "acoustic_score_vit": diagnosis_result.get("acoustic_score_vit", 0),
-                                "acoustic_score_lgbm": diagnosis_result.get("acoustic_score_lgbm", 0),
-                                "language_score_BERT": diagnosis_result.get("language_score_BERT", 0),
-                                "language_score_gpt": diagnosis_result.get("language_score_gpt", 0)
-                            }
+                            scores=report_data["scores"]
                         )
-                        
-                        if email_success:
-                            # 이메일 발송 상태 업데이트
-                            report_crud.update_report_sent_status(db, report_log.id, datetime.now())
-                    except Exception as email_error:
-                        print(f"이메일 발송 실패: {email_error}")
-                        # 이메일 발송 실패는 전체 프로세스를 중단하지 않음
+
+                with metrics_service.stage("diagnosis_submit", "persist_report"):
+                    report_crud.create_report_log(
+                        db,
+                        report_schema.ReportLogCreate(
+                            user_id=current_user.id,
+                            report_type="diagnosis",
+                            report_data=report_data
+                        ),
+                        email=email
+                    )
+                if email:
+                    email_outbox_service.notify()
                 
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"리포트 생성 오류: {e}")
@@ -242,7 +251,7 @@ async def submit_diagnosis(
     return saved_diagnosis
 
 
-@router.get("/result", response_model=diagnosis_schema.DiagnosisLog)
+@router.get("/result", response_model=diagnosis_schema.DiagnosisLog, dependencies=[Depends(diagnosis_etag)])
 async def get_latest_diagnosis_result(
     db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
@@ -285,8 +294,9 @@ async def get_diagnosis_result_by_id(
     
     return diagnosis
 
-@router.get("/history", response_model=List[diagnosis_schema.DiagnosisHistoryResponse])
+@router.get("/history", response_model=List[diagnosis_schema.DiagnosisHistoryResponse], dependencies=[Depends(diagnosis_etag)])
 async def get_diagnosis_history(
+    response: Response,
     limit: int = 10,
     db: Session = Depends(get_db),
     current_user: user_schema.User = Depends(get_current_user)
@@ -294,7 +304,7 @@ async def get_diagnosis_history(
     """사용자의 진단 기록 조회"""
     
     history = diagnosis_crud.get_diagnosis_history_by_user(db, current_user.id, limit)
-    return history
+    return orm_list_response(history, diagnosis_schema.DiagnosisHistoryResponse, response)
 
 @router.get("/statistics")
 async def get_diagnosis_statistics(
@@ -1,18 +1,100 @@
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Set
 from . import report_model, report_schema
 
-def create_report_log(db: Session, report_log: report_schema.ReportLogCreate):
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def report_period(start_date: date, end_date: date) -> str:
+    """리포트 기간 키 (report_logs.period, report_run_ledger.period)"""
+    return f"{start_date.strftime('%Y-%m-%d')}~{end_date.strftime('%Y-%m-%d')}"
+
+def get_report_log_by_period(db: Session, user_id: int, report_type: str, period: str):
+    return db.query(report_model.ReportLog).filter(
+        report_model.ReportLog.user_id == user_id,
+        report_model.ReportLog.report_type == report_type,
+        report_model.ReportLog.period == period
+    ).first()
+
+def get_report_log_ids_by_period(db: Session, user_ids: List[int], report_type: str, period: str) -> dict:
+    """여러 사용자의 해당 기간 리포트 ID 조회 ({user_id: report_log_id})"""
+    if not user_ids:
+        return {}
+    rows = db.query(report_model.ReportLog.user_id, report_model.ReportLog.id).filter(
+        report_model.ReportLog.user_id.in_(user_ids),
+        report_model.ReportLog.report_type == report_type,
+        report_model.ReportLog.period == period
+    ).all()
+    return {row.user_id: row.id for row in rows}
+
+def create_report_log(db: Session, report_log: report_schema.ReportLogCreate, email: Optional[dict] = None):
+    """리포트 저장 (email이 주어지면 같은 트랜잭션으로 발송 대기열에 추가)
+
+    period가 있으면 (user_id, report_type, period) 기준으로 멱등하게 동작하여
+    이미 저장된 리포트가 있으면 새로 만들지 않고(이메일도 추가하지 않음) 기존 리포트를 반환합니다.
+
+    email: EmailService.compose_* 결과 (to_email, subject, html_content, text_content)
+    """
+    if report_log.period:
+        existing = get_report_log_by_period(db, report_log.user_id, report_log.report_type, report_log.period)
+        if existing:
+            return existing
+
     db_report_log = report_model.ReportLog(
         user_id=report_log.user_id,
         report_type=report_log.report_type,
-        report_data=report_log.report_data
+        report_data=report_log.report_data,
+        period=report_log.period
     )
     db.add(db_report_log)
+    try:
+        db.flush()
+    except IntegrityError:
+        # 다른 프로세스가 같은 기간의 리포트를 먼저 저장한 경우
+        db.rollback()
+        existing = None
+        if report_log.period:
+            existing = get_report_log_by_period(db, report_log.user_id, report_log.report_type, report_log.period)
+        if existing is None:
+            raise
+        return existing
+
+    if email:
+        db.add(_outbox_email(db_report_log.id, email))
     db.commit()
     db.refresh(db_report_log)
     return db_report_log
 
+def _outbox_email(report_log_id: int, email: dict) -> report_model.EmailOutbox:
+    return report_model.EmailOutbox(
+        report_log_id=report_log_id,
+        to_email=email["to_email"],
+        subject=email["subject"],
+        html_content=email["html_content"],
+        text_content=email.get("text_content"),
+        status="pending",
+        attempts=0,
+        next_attempt_at=_utcnow(),
+        created_at=_utcnow()
+    )
+
+def get_report_log_ids_with_email(db: Session, report_log_ids: List[int]) -> Set[int]:
+    """발송 대기열에 이메일이 기록된 리포트 ID 조회"""
+    if not report_log_ids:
+        return set()
+    rows = db.query(report_model.EmailOutbox.report_log_id).filter(
+        report_model.EmailOutbox.report_log_id.in_(report_log_ids)
+    ).distinct().all()
+    return {row.report_log_id for row in rows}
+
+def add_report_email(db: Session, report_log_id: int, email: dict):
+    """이미 저장된 리포트의 이메일을 발송 대기열에 추가"""
+    db.add(_outbox_email(report_log_id, email))
+    db.commit()
+
 def get_report_logs_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 100):
     return db.query(report_model.ReportLog).filter(
         report_model.ReportLog.user_id == user_id
@@ -33,6 +115,14 @@ def update_report_sent_status(db: Session, report_id: int, sent_at: datetime = N
         db.refresh(db_report_log)
     return db_report_log
 
+def get_report_log_version(db: Session, user_id: int) -> tuple:
+    """사용자 리포트의 버전 (최신 id, 건수, 발송 완료 건수) - 조건부 조회(ETag)용"""
+    return tuple(db.query(
+        func.max(report_model.ReportLog.id),
+        func.count(report_model.ReportLog.id),
+        func.count(case((report_model.ReportLog.email_sent == True, 1)))
+    ).filter(report_model.ReportLog.user_id == user_id).one())
+
 def get_recent_reports_by_type(db: Session, user_id: int, report_type: str, days: int = 7):
     from datetime import timedelta
     cutoff_date = datetime.now() - timedelta(days=days)
@@ -42,3 +132,174 @@ def get_recent_reports_by_type(db: Session, user_id: int, report_type: str, days
         report_model.ReportLog.report_type == report_type,
         report_model.ReportLog.generated_at >= cutoff_date
     ).order_by(report_model.ReportLog.generated_at.desc()).all()
+
+def claim_due_outbox_emails(db: Session, limit: int, lease_seconds: int, max_attempts: int) -> List[dict]:
+    """발송할 이메일을 가져와 임대 (다른 워커와 중복 발송하지 않도록 잠금 후 sending으로 변경)
+
+    커밋 후 다시 조회하지 않도록 발송에 필요한 값을 딕셔너리로 반환합니다.
+    발송 중 워커가 죽거나 멈춰 임대가 만료된 이메일이 이미 max_attempts번 시도했다면
+    다시 발송하지 않고 같은 트랜잭션에서 failed로 변경합니다.
+    """
+    now = _utcnow()
+    emails = db.query(report_model.EmailOutbox).filter(
+        report_model.EmailOutbox.status.in_(["pending", "sending"]),
+        report_model.EmailOutbox.next_attempt_at <= now
+    ).order_by(report_model.EmailOutbox.next_attempt_at).limit(limit).with_for_update(skip_locked=True).all()
+    
+    claimed = []
+    for email in emails:
+        if email.attempts >= max_attempts:
+            email.status = "failed"
+            email.last_error = "발송 중 임대가 만료되어 최대 시도 횟수를 초과했습니다."
+            continue
+        email.status = "sending"
+        email.attempts += 1
+        email.next_attempt_at = now + timedelta(seconds=lease_seconds)
+        claimed.append({
+            "id": email.id,
+            "attempts": email.attempts,
+            "to_email": email.to_email,
+            "subject": email.subject,
+            "html_content": email.html_content,
+            "text_content": email.text_content
+        })
+    db.commit()
+    return claimed
+
+def mark_outbox_email_sent(db: Session, outbox_id: int):
+    """이메일 발송 성공 처리 (연결된 리포트의 발송 상태도 갱신)"""
+    email = db.query(report_model.EmailOutbox).filter(report_model.EmailOutbox.id == outbox_id).first()
+    if not email:
+        return None
+    email.status = "sent"
+    email.sent_at = _utcnow()
+    email.last_error = None
+    db.commit()
+    if email.report_log_id:
+        update_report_sent_status(db, email.report_log_id, datetime.now())
+    return email
+
+def mark_outbox_email_failed(db: Session, outbox_id: int, error: str, retry_at: Optional[datetime]):
+    """이메일 발송 실패 처리 (retry_at이 없으면 더 이상 재시도하지 않음)"""
+    email = db.query(report_model.EmailOutbox).filter(report_model.EmailOutbox.id == outbox_id).first()
+    if not email:
+        return None
+    email.last_error = error[:1024]
+    if retry_at is None:
+        email.status = "failed"
+    else:
+        email.status = "pending"
+        email.next_attempt_at = retry_at
+    db.commit()
+    return email
+
+def ensure_report_run_entries(db: Session, job_name: str, period: str, user_ids: List[int]):
+    """작업 대상 사용자의 ledger 행을 pending으로 생성 (이미 있는 행은 유지)"""
+    existing = {
+        row.user_id for row in db.query(report_model.ReportRunLedger.user_id).filter(
+            report_model.ReportRunLedger.job_name == job_name,
+            report_model.ReportRunLedger.period == period
+        )
+    }
+    now = _utcnow()
+    for user_id in user_ids:
+        if user_id not in existing:
+            db.add(report_model.ReportRunLedger(
+                job_name=job_name,
+                period=period,
+                user_id=user_id,
+                state="pending",
+                attempts=0,
+                updated_at=now
+            ))
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 프로세스가 동시에 생성한 경우 (이미 있는 행은 그대로 사용)
+        db.rollback()
+
+def get_completed_report_run_user_ids(db: Session, job_name: str, period: str) -> Set[int]:
+    """ledger에서 이미 처리 완료된 사용자 ID 목록"""
+    return {
+        row.user_id for row in db.query(report_model.ReportRunLedger.user_id).filter(
+            report_model.ReportRunLedger.job_name == job_name,
+            report_model.ReportRunLedger.period == period,
+            report_model.ReportRunLedger.state == "done"
+        )
+    }
+
+def update_report_run_state(
+    db: Session,
+    job_name: str,
+    period: str,
+    user_id: int,
+    state: str,
+    error: Optional[str] = None,
+    report_log_id: Optional[int] = None
+):
+    """ledger의 사용자 처리 상태 변경 (processing으로 바뀔 때마다 시도 횟수 증가)"""
+    values = {"state": state, "updated_at": _utcnow()}
+    if state == "processing":
+        values["attempts"] = report_model.ReportRunLedger.attempts + 1
+    if error is not None:
+        values["last_error"] = error[:1024]
+    if report_log_id is not None:
+        values["report_log_id"] = report_log_id
+
+    # 조회 없이 한 번의 UPDATE로 처리
+    updated = db.query(report_model.ReportRunLedger).filter(
+        report_model.ReportRunLedger.job_name == job_name,
+        report_model.ReportRunLedger.period == period,
+        report_model.ReportRunLedger.user_id == user_id
+    ).update(values, synchronize_session=False)
+    db.commit()
+    return updated
+
+def create_scheduler_job_run(
+    db: Session,
+    job_name: str,
+    status: str,
+    started_at: datetime,
+    finished_at: datetime,
+    processed: int = 0,
+    failed: int = 0,
+    summary: Optional[dict] = None
+):
+    """스케줄 작업 실행 이력 저장"""
+    db_job_run = report_model.SchedulerJobRun(
+        job_name=job_name,
+        status=status,
+        started_at=started_at,
+        finished_at=finished_at,
+        duration_seconds=(finished_at - started_at).total_seconds(),
+        processed=processed,
+        failed=failed,
+        summary=summary
+    )
+    db.add(db_job_run)
+    db.commit()
+    db.refresh(db_job_run)
+    return db_job_run
+
+def get_scheduler_job_runs(db: Session, job_name: Optional[str] = None, limit: int = 20):
+    """최근 스케줄 작업 실행 이력 조회"""
+    query = db.query(report_model.SchedulerJobRun)
+    if job_name:
+        query = query.filter(report_model.SchedulerJobRun.job_name == job_name)
+    return query.order_by(report_model.SchedulerJobRun.started_at.desc()).limit(limit).all()
+
+def get_latest_scheduler_job_runs(db: Session) -> list:
+    """작업별 가장 최근 실행 이력 조회"""
+    latest_ids = db.query(func.max(report_model.SchedulerJobRun.id)).group_by(
+        report_model.SchedulerJobRun.job_name
+    )
+    return db.query(report_model.SchedulerJobRun).filter(
+        report_model.SchedulerJobRun.id.in_(latest_ids)
+    ).all()
+
+def get_outbox_status_counts(db: Session) -> dict:
+    """이메일 발송 대기열의 상태별 건수 ({상태: 건수})"""
+    rows = db.query(
+        report_model.EmailOutbox.status, func.count(report_model.EmailOutbox.id)
+    ).group_by(report_model.EmailOutbox.status).all()
+    return {status: count for status, count in rows}
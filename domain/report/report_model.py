@@ -1,14 +1,67 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON, ForeignKey, Text, Float, UniqueConstraint
 from sqlalchemy.sql import func
 from database.session import Base
 
 class ReportLog(Base):
     __tablename__ = "report_logs"
+    __table_args__ = (
+        # 같은 기간의 리포트는 한 번만 생성 (period가 NULL인 진단 리포트는 제한 없음)
+        UniqueConstraint("user_id", "report_type", "period", name="uq_report_logs_user_type_period"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     report_type = Column(String(20), nullable=False)  # 'diagnosis' or 'care'
+    period = Column(String(32), nullable=True)  # 케어 리포트 분석 기간 (YYYY-MM-DD~YYYY-MM-DD)
     report_data = Column(JSON, nullable=False)
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
     sent_at = Column(DateTime(timezone=True), nullable=True)
     email_sent = Column(Boolean, default=False)
+
+class EmailOutbox(Base):
+    """이메일 발송 대기열 (리포트와 같은 트랜잭션으로 기록 후 워커가 발송)"""
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    report_log_id = Column(Integer, ForeignKey("report_logs.id"), nullable=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    html_content = Column(Text(16777215), nullable=False)
+    text_content = Column(Text(16777215), nullable=True)
+    status = Column(String(20), nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, index=True)  # 다음 발송 시도 시각 (sending이면 임대 만료 시각)
+    last_error = Column(String(1024), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+class ReportRunLedger(Base):
+    """배치 리포트 작업의 사용자별 처리 상태 (재시작 시 남은 사용자만 이어서 처리)"""
+    __tablename__ = "report_run_ledger"
+    __table_args__ = (
+        UniqueConstraint("job_name", "period", "user_id", name="uq_report_run_ledger_job_period_user"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(50), nullable=False)
+    period = Column(String(32), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    state = Column(String(20), nullable=False, default="pending")  # pending, processing, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    report_log_id = Column(Integer, ForeignKey("report_logs.id"), nullable=True)
+    last_error = Column(String(1024), nullable=True)
+    updated_at = Column(DateTime, nullable=False)
+
+class SchedulerJobRun(Base):
+    """스케줄 작업 실행 이력 (단계별 소요 시간, 처리량, 오류 수 등 실행 요약 포함)"""
+    __tablename__ = "scheduler_job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(50), nullable=False, index=True)
+    status = Column(String(20), nullable=False)  # success, partial, failed
+    started_at = Column(DateTime, nullable=False, index=True)
+    finished_at = Column(DateTime, nullable=False)
+    duration_seconds = Column(Float, nullable=False)
+    processed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    summary = Column(JSON, nullable=True)
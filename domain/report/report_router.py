@@ -1,16 +1,21 @@
-from fastapi import APIRouter, HTTPException, Depends, Body
+from fastapi import APIRouter, HTTPException, Depends, Body, Response
 from sqlalchemy.orm import Session
 import httpx
 from datetime import datetime, date
-from typing import List
+from typing import List, Optional
 
 from config import settings
 from domain.report import report_schema, report_crud
 from domain.user import user_schema, user_crud
 from database.session import get_db
 from security import get_current_user
+from conditional import etag_for
+from serialization import orm_list_response
 from services.email_service import email_service
 from services.scheduler_service import scheduler_service
+from services.leader_election_service import leader_election_service
+from services.care_digest_service import care_digest_service
+from services.ai_client import ai_client
 
 router = APIRouter(
     prefix="/report",
@@ -19,6 +24,9 @@ router = APIRouter(
 
 AI_REPORT_URL = "http://localhost:8001"
 
+# 리포트 이력이 바뀌지 않았으면 304로 응답하는 조건부 조회 의존성
+report_log_etag = etag_for(lambda db, user: report_crud.get_report_log_version(db, user.id))
+
 @router.post("/generate-care", response_model=report_schema.ReportResponse)
 async def generate_care_report(
     request: report_schema.CareReportRequest,
@@ -27,51 +35,41 @@ async def generate_care_report(
 ):
     """케어 대화 데이터를 바탕으로 주간 리포트 생성"""
     try:
-        from datetime import datetime, timedelta
-        from domain.care import care_crud
+        from datetime import datetime
         
         # 주간 대화 데이터 수집
         start_date = datetime.strptime(request.start_date, "%Y-%m-%d").date()
         end_date = datetime.strptime(request.end_date, "%Y-%m-%d").date()
         
-        weekly_conversations = []
-        
-        # 각 날짜별 대화 데이터 수집
-        current_date = start_date
-        while current_date <= end_date:
-            # 해당 날짜의 대화 로그 조회
-            daily_logs = care_crud.get_daily_conversations(
-                db, current_user.id, current_date
-            )
-            
-            # 대화 데이터 구성
-            conversations = []
-            for log in daily_logs:
-                conversations.append({
-                    "user_question": log.user_question,
-                    "ai_reply": log.ai_reply,
-                    "conversation_id": log.conversation_id,
-                    "created_at": log.created_at.isoformat() if log.created_at else None
-                })
-            
-            weekly_conversations.append({
-                "date": current_date.strftime("%Y-%m-%d"),
-                "conversations": conversations
-            })
-            
-            current_date += timedelta(days=1)
+        # 끝난 기간의 리포트는 기간별로 한 번만 생성 (이미 있으면 AI 서버를 다시 호출하지 않음)
+        # 진행 중인 기간의 리포트는 대화가 더 쌓일 수 있으므로 기간 키 없이 저장해
+        # 이후 요청이나 주간 배치가 부분 리포트를 재사용하지 않도록 함
+        period = report_crud.report_period(start_date, end_date) if end_date < date.today() else None
+        if period:
+            existing = report_crud.get_report_log_by_period(db, current_user.id, "care", period)
+            if existing:
+                return report_schema.ReportResponse(
+                    message="이미 생성된 케어 리포트가 있습니다.",
+                    report_id=existing.id
+                )
         
         # AI 서버에 케어 리포트 생성 요청
         async with httpx.AsyncClient() as client:
-            response = await client.post(
+            # 주간 대화 데이터 수집 (기본값은 대화 원문 대신 하루 요약 + 통계)
+            report_content, conversation_count = await care_digest_service.build_report_content(
+                db, client, current_user.id, start_date, end_date
+            )
+            
+            response = await ai_client.post_json(
+                client,
                 f"{AI_REPORT_URL}/generate-care-report",
-                json={
+                {
                     "user_id": request.user_id,
                     "start_date": request.start_date,
                     "end_date": request.end_date,
                     "user_email": request.user_email,
                     "user_name": request.user_name,
-                    "weekly_conversations": weekly_conversations
+                    **report_content
                 },
                 timeout=30
             )
@@ -92,7 +90,7 @@ async def generate_care_report(
                     "start_date": request.start_date,
                     "end_date": request.end_date
                 },
-                "conversation_count": sum(len(day["conversations"]) for day in weekly_conversations)
+                "conversation_count": conversation_count
             }
             
             report_log = report_crud.create_report_log(
@@ -100,7 +98,8 @@ async def generate_care_report(
                 report_schema.ReportLogCreate(
                     user_id=current_user.id,
                     report_type="care",
-                    report_data=report_data
+                    report_data=report_data,
+                    period=period
                 )
             )
             
@@ -154,8 +153,9 @@ async def send_report_email(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이메일 발송 실패: {str(e)}")
 
-@router.get("/history", response_model=List[report_schema.ReportLog])
+@router.get("/history", response_model=List[report_schema.ReportLog], dependencies=[Depends(report_log_etag)])
 async def get_report_history(
+    response: Response,
     report_type: str = None,
     skip: int = 0,
     limit: int = 10,
@@ -173,7 +173,7 @@ async def get_report_history(
                 db, current_user.id, skip=skip, limit=limit
             )
         
-        return reports
+        return orm_list_response(reports, report_schema.ReportLog, response)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리포트 이력 조회 실패: {str(e)}")
@@ -271,7 +271,24 @@ async def get_scheduler_status(
                     "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None
                 }
                 for job in jobs
+            ],
+            "leader": leader_election_service.stats(),
+            "batch": scheduler_service.batch_status(),
+            "last_weekly_run": scheduler_service.last_weekly_run,
+            "recent_runs": [
+                report_schema.SchedulerJobRun.model_validate(run).model_dump(exclude={"summary"})
+                for run in report_crud.get_scheduler_job_runs(db, limit=5)
             ]
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스케줄러 상태 조회 실패: {str(e)}")
+
+@router.get("/scheduler/runs", response_model=List[report_schema.SchedulerJobRun])
+async def get_scheduler_runs(
+    job_name: Optional[str] = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: user_schema.User = Depends(get_current_user)
+):
+    """스케줄 작업 실행 이력 조회 (단계별 소요 시간, 처리량, 오류 수 포함)"""
+    return report_crud.get_scheduler_job_runs(db, job_name=job_name, limit=min(limit, 100))
@@ -6,6 +6,7 @@ class ReportLogBase(BaseModel):
     user_id: int
     report_type: str  # 'diagnosis' or 'care'
     report_data: Dict[str, Any]
+    period: Optional[str] = None  # 케어 리포트 분석 기간 (YYYY-MM-DD~YYYY-MM-DD)
 
 class ReportLogCreate(ReportLogBase):
     pass
@@ -19,6 +20,20 @@ class ReportLog(ReportLogBase):
     class Config:
         from_attributes = True
 
+class SchedulerJobRun(BaseModel):
+    id: int
+    job_name: str
+    status: str
+    started_at: datetime
+    finished_at: datetime
+    duration_seconds: float
+    processed: int
+    failed: int
+    summary: Optional[Dict[str, Any]] = None
+
+    class Config:
+        from_attributes = True
+
 class DiagnosisReportRequest(BaseModel):
     user_id: int
     acoustic_score_vit: float
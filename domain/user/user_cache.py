@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from config import settings
+from domain.user import user_schema
+
+
+class UserCache:
+    """전화번호 기준 사용자 정보 LRU/TTL 캐시 (프로세스 단위)
+
+    인증마다 발생하는 사용자 조회를 줄이기 위해 사용합니다.
+    프로세스 간에는 공유되지 않으므로 다른 워커의 변경은 TTL 이내에 반영됩니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # phone -> (만료 시각, 사용자)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, phone: str) -> Optional[user_schema.User]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(phone)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[phone]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(phone)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, phone: str, user: user_schema.User):
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[phone] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(phone)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, phone: str):
+        with self._lock:
+            if self._entries.pop(phone, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+# 전역 사용자 캐시 인스턴스
+user_cache = UserCache(settings.USER_CACHE_TTL_SECONDS, settings.USER_CACHE_MAX_SIZE)
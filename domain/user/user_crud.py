@@ -1,13 +1,9 @@
 from sqlalchemy.orm import Session
-from fastapi import Depends, HTTPException
-from fastapi.security import OAuth2PasswordBearer
-from starlette import status
+from typing import List
 
 from domain.user import user_model, user_schema
-from security import decode_token
-from database.session import get_db
-
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/login")
+from domain.user.user_cache import user_cache
+from domain.auth import auth_crud
 
 def get_user_by_phone(db: Session, phone: str):
     return db.query(user_model.User).filter(user_model.User.phone == phone).first()
@@ -43,6 +39,39 @@ def get_users_by_subscription_type(db: Session, subscription_types: list):
         user_model.User.subscription_type.in_(subscription_types)
     ).all()
 
+def get_users_by_subscription_type_chunk(
+    db: Session,
+    subscription_types: list,
+    after_id: int = 0,
+    limit: int = 200,
+    email_required: bool = False
+):
+    """구독 타입별 사용자를 id 순으로 after_id 다음부터 limit명 조회 (배치 작업용 keyset 페이지)"""
+    query = db.query(user_model.User).filter(
+        user_model.User.subscription_type.in_(subscription_types),
+        user_model.User.id > after_id
+    )
+    if email_required:
+        query = query.filter(user_model.User.email.isnot(None), user_model.User.email != "")
+    return query.order_by(user_model.User.id).limit(limit).all()
+
+def get_user_ids_by_subscription_type(db: Session, subscription_types: list, email_required: bool = False) -> List[int]:
+    """구독 타입별 사용자 ID 목록 조회 (배치 작업 계획용)"""
+    query = db.query(user_model.User.id).filter(
+        user_model.User.subscription_type.in_(subscription_types)
+    )
+    if email_required:
+        query = query.filter(user_model.User.email.isnot(None), user_model.User.email != "")
+    return [row.id for row in query.all()]
+
+def get_users_by_ids(db: Session, user_ids: List[int]):
+    """ID 목록에 해당하는 사용자 조회 (id 순)"""
+    if not user_ids:
+        return []
+    return db.query(user_model.User).filter(
+        user_model.User.id.in_(user_ids)
+    ).order_by(user_model.User.id).all()
+
 def update_subscription_type(db: Session, user_id: int, subscription_type: str):
     """사용자의 구독 타입을 업데이트"""
     user = db.query(user_model.User).filter(user_model.User.id == user_id).first()
@@ -50,8 +79,11 @@ def update_subscription_type(db: Session, user_id: int, subscription_type: str):
         return None
     
     user.subscription_type = subscription_type
+    # 기존 토큰의 구독 타입 클레임 무효화
+    auth_crud.create_token_revocation(db, user.id, "tier_change")
     db.commit()
     db.refresh(user)
+    user_cache.invalidate(user.phone)
     return user
 
 def update_user_info(db: Session, user_id: int, name: str, email: str = None, gender: str = None, birth_year: int = None, birth_month: int = None, birth_day: int = None, education: str = None):
@@ -75,27 +107,11 @@ def update_user_info(db: Session, user_id: int, name: str, email: str = None, ge
     if education is not None:
         user.education = education
     
+    if name is not None:
+        # 기존 토큰의 이름 클레임 무효화
+        auth_crud.create_token_revocation(db, user.id, "profile_change")
+    
     db.commit()
     db.refresh(user)
+    user_cache.invalidate(user.phone)
     return user
-
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    payload = decode_token(token)
-    if payload is None:
-        raise credentials_exception
-    
-    phone: str = payload.get("sub")
-    if phone is None:
-        raise credentials_exception
-    
-    user = get_user_by_phone(db, phone=phone)
-    if user is None:
-        raise credentials_exception
-    
-    return user
\ No newline at end of file
@@ -1,43 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from domain.user import user_schema, user_crud
 import security
+from security import get_current_user, get_current_user_profile
 from database.session import get_db
+from services.password_hash_service import password_hash_service, PasswordHashServiceBusy
 
 router = APIRouter(
     prefix="/user",
     tags=["User"]
 )
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="user/login")
-
-# 현재 사용자 가져오기
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="유효하지 않은 인증 정보입니다.",
-        headers={"WWW-Authenticate": "Bearer"},
+def _password_hash_busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"},
     )
-    
-    try:
-        payload = security.decode_token(token)
-        phone: str = payload.get("sub")
-        if phone is None:
-            raise credentials_exception
-    except:
-        raise credentials_exception
-    
-    user = user_crud.get_user_by_phone(db, phone=phone)
-    if user is None:
-        raise credentials_exception
-    return user
 
 @router.post("/signup", response_model=user_schema.User)
-def signup(user: user_schema.UserCreate, db: Session = Depends(get_db)):
+async def signup(user: user_schema.UserCreate, db: Session = Depends(get_db)):
+    # 해싱은 전용 워커 풀에서 기다리고, 동기 DB 조회/저장은 이벤트 루프를 막지 않도록 스레드풀에서 실행
     # 전화번호 중복 확인
-    db_user = user_crud.get_user_by_phone(db, phone=user.phone)
+    db_user = await run_in_threadpool(user_crud.get_user_by_phone, db, phone=user.phone)
     if db_user:
         raise HTTPException(
             status_code=400, detail="이미 등록된 전화번호입니다."
@@ -45,22 +33,29 @@ def signup(user: user_schema.UserCreate, db: Session = Depends(get_db)):
     
     # 이메일 중복 확인 (이메일이 제공된 경우)
     if user.email:
-        db_user_by_email = user_crud.get_user_by_email(db, email=user.email)
+        db_user_by_email = await run_in_threadpool(user_crud.get_user_by_email, db, email=user.email)
         if db_user_by_email:
             raise HTTPException(
                 status_code=400, detail="이미 등록된 이메일입니다."
             )
     
-    hashed_password = security.get_password_hash(user.password)
-    return user_crud.create_user(db=db, user=user, hashed_password=hashed_password)
+    try:
+        hashed_password = await password_hash_service.hash(user.password)
+    except PasswordHashServiceBusy:
+        raise _password_hash_busy_exception()
+    return await run_in_threadpool(user_crud.create_user, db=db, user=user, hashed_password=hashed_password)
 
 
 @router.post("/login", response_model=user_schema.Token)
-def login_for_access_token(
+async def login_for_access_token(
         db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ):
-    user = user_crud.get_user_by_phone(db, phone=form_data.username)
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    user = await run_in_threadpool(user_crud.get_user_by_phone, db, phone=form_data.username)
+    try:
+        password_valid = bool(user) and await password_hash_service.verify(form_data.password, user.hashed_password)
+    except PasswordHashServiceBusy:
+        raise _password_hash_busy_exception()
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="전화번호 또는 비밀번호가 잘못되었습니다.",
@@ -68,7 +63,7 @@ def login_for_access_token(
         )
 
     # Access token과 refresh token 쌍 생성
-    access_token, refresh_token = security.create_token_pair(data={"sub": user.phone})
+    access_token, refresh_token = security.create_token_pair(data={"sub": user.phone}, user=user)
     return {
         "access_token": access_token, 
         "refresh_token": refresh_token,
@@ -76,12 +71,12 @@ def login_for_access_token(
     }
 
 @router.get("/validate", response_model=user_schema.User)
-async def validate_token(current_user = Depends(get_current_user)):
+async def validate_token(current_user = Depends(get_current_user_profile)):
     """토큰 유효성 검증 및 현재 사용자 정보 반환"""
     return current_user
 
 @router.get("/me", response_model=user_schema.User)
-async def get_current_user_info(current_user = Depends(get_current_user)):
+async def get_current_user_info(current_user = Depends(get_current_user_profile)):
     """현재 로그인한 사용자 정보 조회"""
     return current_user
 
@@ -108,14 +103,14 @@ async def update_subscription(
 @router.put("/profile", response_model=user_schema.User)
 async def update_user_profile(
     user_update: user_schema.UserUpdate,
-    current_user = Depends(get_current_user),
+    current_user = Depends(get_current_user_profile),
     db: Session = Depends(get_db)
 ):
     """사용자 프로필 정보 업데이트"""
     # 이메일 중복 확인 (이메일이 변경되는 경우)
     if user_update.email and user_update.email != current_user.email:
         db_user_by_email = user_crud.get_user_by_email(db, email=user_update.email)
-        if db_user_by_email:
+        if db_user_by_email and db_user_by_email.id != current_user.id:
             raise HTTPException(
                 status_code=400, detail="이미 등록된 이메일입니다."
             )
@@ -1,7 +1,8 @@
 import locale
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 
 # UTF-8 인코딩 설정
 try:
@@ -15,23 +16,67 @@ except locale.Error:
 from domain.user import user_router, user_model
 from domain.diagnosis import diagnosis_router, diagnosis_model
 from domain.care import care_router, care_model
-from domain.auth import auth_router
+from domain.auth import auth_router, auth_model
 from domain.report import report_router, report_model
-from database.session import engine
+from config import settings
+from conditional import NotModified, not_modified_response
+from database.session import engine, pool_stats
+from database.migrations import run_migrations
+from middleware.compression import CompressionMiddleware
+from middleware.query_profiler import QueryProfilerMiddleware, query_profiler
+from middleware.loop_monitor import LoopMonitorMiddleware
+from middleware.server_timing import ServerTimingMiddleware
 from services.scheduler_service import scheduler_service
+from services.care_log_writer_service import care_log_writer_service
+from services.password_hash_service import password_hash_service
+from services.email_service import email_service
+from services.email_outbox_service import email_outbox_service
+from services.leader_election_service import leader_election_service
+from services.ai_client import ai_client
+from services.metrics_service import metrics_service
+from services.loop_monitor_service import loop_monitor_service
+from domain.user.user_cache import user_cache
 
 user_model.Base.metadata.create_all(bind=engine)
 care_model.Base.metadata.create_all(bind=engine)
 diagnosis_model.Base.metadata.create_all(bind=engine)
 report_model.Base.metadata.create_all(bind=engine)
+auth_model.Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+
+# /metrics에 함께 노출할 서비스 상태
+metrics_service.register_stats("mindi_db_pool", pool_stats, "SQLAlchemy connection pool")
+metrics_service.register_stats(
+    "mindi_user_cache", user_cache.stats, "User cache",
+    counters=("hits", "misses", "evictions", "invalidations")
+)
+metrics_service.register_stats(
+    "mindi_password_hash", password_hash_service.stats, "Password hash executor", counters=("rejected",)
+)
+metrics_service.register_stats(
+    "mindi_ai_request", ai_client.stats, "AI server JSON requests",
+    counters=("bytes_raw", "bytes_sent")
+)
+metrics_service.register_stats("mindi_scheduler_leader", leader_election_service.stats, "Scheduler leader election")
+metrics_service.register_collector("scheduler_job_runs", scheduler_service.job_run_metrics)
+metrics_service.register_collector("email_outbox", email_outbox_service.outbox_metrics)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    loop_monitor_service.start()
+    password_hash_service.start()
+    care_log_writer_service.start()
+    email_outbox_service.start()
     scheduler_service.start()
     yield
     # Shutdown
     scheduler_service.stop()
+    await care_log_writer_service.stop()
+    await email_outbox_service.stop()
+    await password_hash_service.stop()
+    email_service.close()
+    await loop_monitor_service.stop()
 
 app = FastAPI(
     title="MINDI Backend API",
@@ -39,6 +84,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -56,6 +102,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 설정 (작은 응답과 음성 스트림은 압축하지 않음)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES,
+    gzip_level=settings.RESPONSE_GZIP_LEVEL,
+    brotli_quality=settings.RESPONSE_BROTLI_QUALITY
+)
+
+# 인증 단계 소요 시간 Server-Timing 헤더 (직접 반환하는 Response 포함)
+app.add_middleware(ServerTimingMiddleware)
+
+# 요청별 DB 쿼리 프로파일러 (DB_PROFILE_ENABLED일 때만)
+if settings.DB_PROFILE_ENABLED:
+    query_profiler.install(engine)
+    app.add_middleware(QueryProfilerMiddleware)
+    metrics_service.register_collector("db_query_profile", query_profiler.metrics)
+
+# 이벤트 루프 차단 감지 (LOOP_MONITOR_ENABLED일 때만)
+if settings.LOOP_MONITOR_ENABLED:
+    app.add_middleware(LoopMonitorMiddleware)
+    metrics_service.register_collector("event_loop", loop_monitor_service.metrics)
+
+# 조건부 조회에서 클라이언트 캐시가 최신이면 본문 없이 304 응답
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    return not_modified_response(exc.etag)
+
 # 사용자 관련 라우터를 앱에 포함시킵니다.
 app.include_router(user_router.router, prefix="/api")
 app.include_router(diagnosis_router.router, prefix="/api")
@@ -66,3 +139,8 @@ app.include_router(report_router.router, prefix="/api")
 @app.get("/")
 async def root():
     return {"message": "Hello Mindi World"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 메트릭 (DB 조회가 있으므로 스레드풀에서 실행)"""
+    return PlainTextResponse(metrics_service.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,98 @@
+from typing import Dict
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 패키지가 없으면 gzip만 사용
+    brotli = None
+
+# 이미 압축된 형식(음성, 이미지 등)과 스트리밍 이벤트는 다시 압축하지 않음
+EXCLUDED_CONTENT_TYPES = ("audio/", "image/", "video/", "application/zip", "text/event-stream")
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q값}으로 변환"""
+    encodings = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[name.strip().lower()] = q
+    return encodings
+
+
+class _ExcludedContentTypeMixin:
+    """음성/이미지 응답은 압축하지 않도록 제외 대상 Content-Type을 확장"""
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            await super().send_with_compression(message)
+            self.content_type_is_excluded = content_type.startswith(EXCLUDED_CONTENT_TYPES)
+            return
+        await super().send_with_compression(message)
+
+
+class _GZipResponder(_ExcludedContentTypeMixin, GZipResponder):
+    pass
+
+
+class _BrotliResponder(_ExcludedContentTypeMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        if more_body:
+            return compressed + self.compressor.flush()
+        return compressed + self.compressor.finish()
+
+
+class CompressionMiddleware:
+    """응답 압축 미들웨어 (brotli 우선, 없으면 gzip)
+
+    클라이언트 Accept-Encoding에 따라 br 또는 gzip으로 압축합니다.
+    minimum_size보다 작은 응답, 이미 Content-Encoding이 있는 응답,
+    음성(audio/mpeg 스트리밍 등)·이미지 응답은 그대로 보냅니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encodings = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        responder: ASGIApp
+        if brotli is not None and encodings.get("br", 0) > 0:
+            responder = _BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif encodings.get("gzip", 0) > 0:
+            responder = _GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -0,0 +1,18 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from services.loop_monitor_service import loop_monitor_service
+
+
+class LoopMonitorMiddleware:
+    """요청을 처리하는 태스크를 이벤트 루프 감시 서비스에 등록하는 미들웨어
+
+    루프 차단이 감지되면 이 정보로 어떤 라우트가 루프를 막고 있었는지 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            loop_monitor_service.register_task(scope)
+        await self.app(scope, receive, send)
@@ -0,0 +1,167 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# IN (%s, %s, ...) 처럼 값 개수만 다른 쿼리를 같은 형태로 묶기 위한 패턴
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?|%\(\w+\)s)(?:\s*,\s*(?:%s|\?|%\(\w+\)s))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _statement_shape(statement: str) -> str:
+    return _WHITESPACE.sub(" ", _PLACEHOLDER_LIST.sub("(?...)", statement)).strip()
+
+
+class QueryProfile:
+    """요청 하나에서 실행된 쿼리 기록"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes: Counter = Counter()
+        self.slowest: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float, keep_slowest: int = 3):
+        # 동기 라우터는 스레드풀에서 실행되므로 잠금 후 기록
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.shapes[_statement_shape(statement)] += 1
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[keep_slowest:]
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        """같은 형태로 threshold번 이상 실행된 쿼리 (N+1 의심)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar("db_query_profile", default=None)
+
+
+class QueryProfiler:
+    """SQLAlchemy 이벤트 기반 요청별 쿼리 프로파일러 (DB_PROFILE_ENABLED일 때만 사용)
+
+    엔진의 커서 실행 이벤트로 쿼리 수와 DB 시간을 현재 요청(contextvar)에 기록하고,
+    요청이 끝나면 라우트별로 집계합니다. 같은 형태의 쿼리가 반복되면 N+1로 표시하고
+    느린 쿼리와 함께 로그로 남깁니다.
+    """
+
+    def __init__(self):
+        self.slow_query_seconds = settings.DB_PROFILE_SLOW_QUERY_MS / 1000
+        self.n_plus_one_threshold = settings.DB_PROFILE_N_PLUS_ONE_THRESHOLD
+        self.header_enabled = settings.DB_PROFILE_HEADER
+        self._installed = False
+        self._route_stats: Dict[str, list] = {}  # 라우트 -> [요청 수, 쿼리 수, DB 시간, N+1 요청 수]
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine):
+        if self._installed:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._installed = True
+        logger.info("DB 쿼리 프로파일러가 활성화되었습니다.")
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if _current_profile.get() is not None:
+            conn.info.setdefault("query_profile_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        profile = _current_profile.get()
+        started = conn.info.get("query_profile_started")
+        if profile is None or not started:
+            return
+        profile.record(statement, time.perf_counter() - started.pop())
+
+    def header_value(self, profile: QueryProfile) -> str:
+        return (
+            f"queries={profile.count};db_ms={profile.total_seconds * 1000:.1f};"
+            f"n_plus_one={len(profile.repeated_shapes(self.n_plus_one_threshold))}"
+        )
+
+    def finish(self, method: str, route: str, profile: QueryProfile):
+        """요청 종료 시 라우트별 집계 및 N+1/느린 쿼리 로그"""
+        repeated = profile.repeated_shapes(self.n_plus_one_threshold)
+        with self._lock:
+            stats = self._route_stats.setdefault(f"{method} {route}", [0, 0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += profile.count
+            stats[2] += profile.total_seconds
+            stats[3] += 1 if repeated else 0
+
+        slow = [(seconds, statement) for seconds, statement in profile.slowest if seconds >= self.slow_query_seconds]
+        if repeated:
+            logger.warning(
+                f"N+1 의심 {method} {route}: 쿼리 {profile.count}개, DB {profile.total_seconds * 1000:.1f}ms, "
+                + ", ".join(f"{count}회 [{shape[:200]}]" for shape, count in repeated)
+            )
+        for seconds, statement in slow:
+            logger.warning(f"느린 쿼리 {method} {route}: {seconds * 1000:.1f}ms [{_statement_shape(statement)[:500]}]")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                route: {"requests": requests, "queries": queries, "db_seconds": round(seconds, 3), "n_plus_one_requests": n_plus_one}
+                for route, (requests, queries, seconds, n_plus_one) in self._route_stats.items()
+            }
+
+    def metrics(self) -> list:
+        """라우트별 누적 쿼리 수/DB 시간 메트릭 (/metrics용)"""
+        requests, queries, seconds, n_plus_one = [], [], [], []
+        for route, stats in self.stats().items():
+            labels = {"route": route}
+            requests.append((labels, stats["requests"]))
+            queries.append((labels, stats["queries"]))
+            seconds.append((labels, stats["db_seconds"]))
+            n_plus_one.append((labels, stats["n_plus_one_requests"]))
+        return [
+            ("mindi_db_route_requests_total", "counter", "Profiled requests per route", requests),
+            ("mindi_db_route_queries_total", "counter", "SQL statements executed per route", queries),
+            ("mindi_db_route_seconds_total", "counter", "Time spent in SQL per route", seconds),
+            ("mindi_db_route_n_plus_one_total", "counter", "Requests with repeated statement shapes per route", n_plus_one)
+        ]
+
+
+class QueryProfilerMiddleware:
+    """요청마다 쿼리 프로파일을 시작하고 X-DB-Profile 헤더를 추가하는 미들웨어"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile()
+        token = _current_profile.set(profile)
+
+        async def send_with_profile(message: Message) -> None:
+            if message["type"] == "http.response.start" and query_profiler.header_enabled:
+                MutableHeaders(scope=message).append("X-DB-Profile", query_profiler.header_value(profile))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            _current_profile.reset(token)
+            # 라우팅 후에는 scope["route"]에 매칭된 라우트가 들어 있음 (없으면 404 등)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            query_profiler.finish(scope["method"], route, profile)
+
+# 전역 쿼리 프로파일러 인스턴스
+query_profiler = QueryProfiler()
@@ -0,0 +1,32 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ServerTimingMiddleware:
+    """인증 의존성이 request.state.auth_timing에 남긴 단계별 소요 시간을 Server-Timing 헤더로 추가
+
+    엔드포인트가 Response(StreamingResponse 등)를 직접 반환해도 헤더가 빠지지 않도록
+    의존성 대신 응답 시작 시점에 미들웨어에서 추가합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # request.state는 scope["state"]를 그대로 사용하므로 미리 만들어 두고 같은 딕셔너리를 읽음
+        state = scope.setdefault("state", {})
+
+        async def send_with_timing(message: Message) -> None:
+            timing = state.get("auth_timing")
+            if message["type"] == "http.response.start" and timing:
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f"auth-decode;dur={timing['decode_ms']:.2f}, auth-lookup;dur={timing['lookup_ms']:.2f}"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
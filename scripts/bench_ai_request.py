@@ -0,0 +1,79 @@
+"""AI 서버 요청 본문 인코딩/압축 벤치마크
+
+주간 리포트 요청과 같은 모양(일별 대화 원문)의 본문을 만들어
+stdlib json과 orjson(AIClient) 직렬화 시간, gzip/zstd 압축 후 크기와 소요 시간을 비교합니다.
+--transcript-file로 실제 대화 원문(JSON: [{"user_question": ..., "ai_reply": ...}, ...])을 주면
+합성 데이터 대신 그 내용을 사용합니다. 합성 데이터는 문장이 반복되므로 압축률이 실제보다 높게 나옵니다.
+
+사용 예 (저장소 루트에서, .env 설정 필요):
+    python -m scripts.bench_ai_request --days 7 --turns 30
+"""
+import argparse
+import gzip
+import json
+import time
+
+from services.ai_client import ai_client, zstandard
+
+
+def _synthetic_turns(turns: int) -> list:
+    return [
+        {
+            "user_question": f"오늘 아침에는 {i}번째로 공원에 산책을 다녀왔어요. 날씨가 맑아서 기분이 좋았어요.",
+            "ai_reply": f"산책을 다녀오셨군요! {i}번째 이야기도 잘 들었어요. 어떤 꽃이 피어 있었나요?",
+            "created_at": f"2026-01-05T09:{i % 60:02d}:00"
+        }
+        for i in range(turns)
+    ]
+
+
+def _payload(args) -> dict:
+    if args.transcript_file:
+        with open(args.transcript_file, encoding="utf-8") as f:
+            turns = json.load(f)
+    else:
+        turns = _synthetic_turns(args.turns)
+    return {
+        "user_name": "홍길동",
+        "period": {"start_date": "2026-01-05", "end_date": "2026-01-11"},
+        "daily_logs": {f"2026-01-{5 + day:02d}": turns for day in range(args.days)}
+    }
+
+
+def _time(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def run(args) -> dict:
+    payload = _payload(args)
+    raw = ai_client._dumps(payload)
+    result = {
+        "body_bytes": len(raw),
+        "json_dumps_ms": round(_time(lambda: json.dumps(payload).encode("utf-8"), args.repeat) * 1000, 3),
+        "orjson_dumps_ms": round(_time(lambda: ai_client._dumps(payload), args.repeat) * 1000, 3),
+        "gzip_bytes": len(gzip.compress(raw, compresslevel=5)),
+        "gzip_ms": round(_time(lambda: gzip.compress(raw, compresslevel=5), args.repeat) * 1000, 3)
+    }
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=3)
+        result["zstd_bytes"] = len(compressor.compress(raw))
+        result["zstd_ms"] = round(_time(lambda: compressor.compress(raw), args.repeat) * 1000, 3)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 서버 요청 본문 인코딩/압축 벤치마크")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--turns", type=int, default=30, help="하루 대화 수 (합성 데이터)")
+    parser.add_argument("--transcript-file", default=None, help="하루치 대화 원문 JSON 파일")
+    parser.add_argument("--repeat", type=int, default=200)
+    result = run(parser.parse_args())
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""리포트 이메일 템플릿 렌더링 벤치마크
+
+서버 시작 시 컴파일해 둔 템플릿으로 렌더링하는 현재 방식(EmailService)과
+이메일마다 템플릿 파일을 읽고 컴파일하는 방식의 렌더링 시간을 비교합니다.
+SMTP 발송은 하지 않습니다.
+
+사용 예 (저장소 루트에서, .env 설정 필요):
+    python -m scripts.bench_email_render --renders 500
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+
+from jinja2 import Environment, select_autoescape
+
+from services.email_service import email_service
+
+
+def _care_kwargs(report_items: int) -> dict:
+    report_html = "".join(
+        f"<h3>{day}일차</h3><p>오늘은 산책과 식사에 대해 이야기했습니다. 기분이 좋았다고 합니다.</p>"
+        for day in range(1, report_items + 1)
+    )
+    return {
+        "to_email": "bench@example.com",
+        "user_name": "홍길동",
+        "report_html": report_html,
+        "report_text": "주간 리포트",
+        "period": {"start_date": "2026-01-05", "end_date": "2026-01-11"},
+        "conversation_count": 42
+    }
+
+
+def _diagnosis_kwargs() -> dict:
+    return {
+        "to_email": "bench@example.com",
+        "user_name": "홍길동",
+        "evaluate_good_list": ["기억력이 좋아요", "집중력이 좋아요"],
+        "evaluate_bad_list": ["계산 연습이 필요해요"],
+        "result_good_list": ["단기 기억", "주의 집중"],
+        "result_bad_list": ["수리 능력"],
+        "scores": {"memory": 90, "attention": 85, "calculation": 60}
+    }
+
+
+def _time_per_render(render, renders: int) -> float:
+    started = time.perf_counter()
+    for _ in range(renders):
+        render()
+    return (time.perf_counter() - started) / renders
+
+
+def run(args) -> dict:
+    care_kwargs = _care_kwargs(args.report_items)
+    diagnosis_kwargs = _diagnosis_kwargs()
+    template_dir = email_service.templates.loader.searchpath[0]
+    with open(os.path.join(template_dir, "care_email_template.html"), encoding="utf-8") as f:
+        care_source = f.read()
+    environment = Environment(autoescape=select_autoescape(["html"]))
+
+    def compile_and_render_care():
+        # 발송마다 템플릿을 새로 컴파일하는 경우 (캐시 없음)
+        environment.from_string(care_source).render(
+            user_name=care_kwargs["user_name"],
+            start_date=care_kwargs["period"]["start_date"],
+            end_date=care_kwargs["period"]["end_date"],
+            conversation_count=care_kwargs["conversation_count"],
+            daily_average=care_kwargs["conversation_count"] // 7,
+            report_html=care_kwargs["report_html"]
+        )
+
+    care = _time_per_render(lambda: email_service.compose_care_report(**care_kwargs), args.renders)
+    care_compiled_each = _time_per_render(compile_and_render_care, args.renders)
+    # compose_diagnosis_report의 디버그 print 출력은 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        diagnosis = _time_per_render(lambda: email_service.compose_diagnosis_report(**diagnosis_kwargs), args.renders)
+    return {
+        "renders": args.renders,
+        "care_precompiled_ms": round(care * 1000, 3),
+        "care_compile_each_ms": round(care_compiled_each * 1000, 3),
+        "care_total_ms": round(care * args.renders * 1000, 1),
+        "diagnosis_precompiled_ms": round(diagnosis * 1000, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포트 이메일 템플릿 렌더링 벤치마크")
+    parser.add_argument("--renders", type=int, default=500)
+    parser.add_argument("--report-items", type=int, default=7, help="케어 리포트 HTML에 넣을 일별 항목 수")
+    result = run(parser.parse_args())
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""로그인 처리량 벤치마크
+
+실행 중인 서버에 로그인 요청을 동시에 보내 처리량과 지연 시간, 503(해싱 대기열 초과) 비율을 측정하고,
+같은 시간 동안 다른 엔드포인트(--probe-path)의 응답 시간을 함께 측정해 로그인 폭주가
+다른 요청에 주는 영향을 확인합니다.
+
+사용 예:
+    python scripts/bench_login.py --base-url http://localhost:8000 --requests 200 --concurrency 32
+    python scripts/bench_login.py --probe-path /api/care/total-count --probe-token <access token>
+
+벤치마크용 계정(--phone/--password)이 없으면 /api/user/signup으로 먼저 생성합니다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+import httpx
+
+
+def _percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else 0.0
+
+
+async def _ensure_account(client: httpx.AsyncClient, phone: str, password: str):
+    response = await client.post("/api/user/signup", json={
+        "phone": phone,
+        "password": password,
+        "name": "bench"
+    })
+    if response.status_code not in (200, 400):
+        raise RuntimeError(f"벤치마크 계정 생성 실패: {response.status_code} {response.text}")
+
+
+async def _login_worker(
+    client: httpx.AsyncClient,
+    queue: asyncio.Queue,
+    phone: str,
+    password: str,
+    latencies: List[float],
+    statuses: dict
+):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        response = await client.post("/api/user/login", data={"username": phone, "password": password})
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+
+async def _probe(
+    client: httpx.AsyncClient,
+    path: str,
+    token: Optional[str],
+    stop: asyncio.Event,
+    latencies: List[float]
+):
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.05)
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        await _ensure_account(client, args.phone, args.password)
+
+        # 부하 없는 상태의 기준 응답 시간
+        baseline: List[float] = []
+        idle = asyncio.Event()
+        probe_task = asyncio.create_task(_probe(client, args.probe_path, args.probe_token, idle, baseline))
+        await asyncio.sleep(1)
+        idle.set()
+        await probe_task
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for _ in range(args.requests):
+            queue.put_nowait(None)
+        latencies: List[float] = []
+        statuses: dict = {}
+        probe_latencies: List[float] = []
+        done = asyncio.Event()
+
+        started = time.perf_counter()
+        probe_task = asyncio.create_task(_probe(client, args.probe_path, args.probe_token, done, probe_latencies))
+        await asyncio.gather(*(
+            _login_worker(client, queue, args.phone, args.password, latencies, statuses)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    succeeded = statuses.get(200, 0)
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "elapsed_seconds": round(elapsed, 2),
+        "logins_per_second": round(succeeded / elapsed, 1),
+        "statuses": statuses,
+        "login_p50_ms": round(_percentile(latencies, 0.5) * 1000, 1),
+        "login_p99_ms": round(_percentile(latencies, 0.99) * 1000, 1),
+        "probe_idle_p50_ms": round(statistics.median(baseline) * 1000, 1) if baseline else None,
+        "probe_under_load_p50_ms": round(_percentile(probe_latencies, 0.5) * 1000, 1),
+        "probe_under_load_p99_ms": round(_percentile(probe_latencies, 0.99) * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 처리량 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--phone", default="01000000000")
+    parser.add_argument("--password", default="bench-password")
+    parser.add_argument("--probe-path", default="/")
+    parser.add_argument("--probe-token", default=None, help="probe 경로가 인증을 요구하는 경우 access token")
+    result = asyncio.run(run(parser.parse_args()))
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""ORM 목록 응답 직렬화 벤치마크
+
+대화 로그 목록(/care/logs/week 등)을 응답으로 만드는 두 경로를 비교합니다.
+- 기존 경로: response_model 검증(from_attributes) -> jsonable_encoder -> ORJSONResponse
+- 현재 경로: serialization.orm_list_response (검증 없이 orjson으로 바로 직렬화)
+두 경로의 출력이 바이트 단위로 같은지도 확인합니다. DB 없이 메모리의 CareLog 객체를 사용합니다.
+
+사용 예 (저장소 루트에서, .env 설정 필요):
+    python -m scripts.bench_orm_serialization --rows 10000
+"""
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from typing import List
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from domain.auth import auth_model  # noqa: F401  (관계 매핑에 필요한 모델 등록)
+from domain.care import care_schema
+from domain.care.care_model import CareLog
+from domain.diagnosis import diagnosis_model  # noqa: F401
+from domain.report import report_model  # noqa: F401
+from domain.user import user_model  # noqa: F401
+from serialization import orm_list_response
+
+
+def _rows(count: int) -> list:
+    started_at = datetime(2026, 1, 5, 9)
+    return [
+        CareLog(
+            id=i + 1,
+            user_id=1,
+            conversation_date=date(2026, 1, 5) + timedelta(days=i % 7),
+            user_question="오늘 아침에 공원에 산책을 다녀왔어요. " * 5,
+            ai_reply="산책을 다녀오셨군요! 날씨가 좋았나요? " * 10,
+            conversation_id=f"conversation-{i // 30}",
+            created_at=started_at + timedelta(seconds=i, microseconds=i)
+        )
+        for i in range(count)
+    ]
+
+
+def _time(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def run(args) -> dict:
+    rows = _rows(args.rows)
+    adapter = TypeAdapter(List[care_schema.CareLog])
+
+    def validated_response() -> bytes:
+        # response_model이 있는 라우터의 FastAPI 기본 처리와 같은 단계
+        values = adapter.validate_python(rows, from_attributes=True)
+        return ORJSONResponse(jsonable_encoder(adapter.dump_python(values, mode="json"))).body
+
+    def direct_response() -> bytes:
+        return orm_list_response(rows, care_schema.CareLog, Response()).body
+
+    validated_body = validated_response()
+    direct_body = direct_response()
+    return {
+        "rows": args.rows,
+        "body_bytes": len(direct_body),
+        "identical_output": validated_body == direct_body,
+        "validated_ms": round(_time(validated_response, args.repeat) * 1000, 1),
+        "direct_ms": round(_time(direct_response, args.repeat) * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ORM 목록 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    result = run(parser.parse_args())
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""API 응답 직렬화/압축 벤치마크
+
+리포트 이력(/report/history)과 같은 모양의 응답으로
+JSONResponse와 ORJSONResponse의 본문 생성 시간을 비교하고,
+CompressionMiddleware를 거친 응답 크기와 요청당 소요 시간을 Accept-Encoding별로 측정합니다.
+--report-html-file로 실제 리포트 HTML을 주면 합성 HTML 대신 사용합니다.
+합성 HTML은 문장이 반복되므로 압축률이 실제보다 높게 나옵니다.
+
+사용 예 (저장소 루트에서, .env 설정 필요):
+    python -m scripts.bench_response_compression --reports 20
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from config import settings
+from middleware.compression import CompressionMiddleware
+
+
+def _report_html(args) -> str:
+    if args.report_html_file:
+        with open(args.report_html_file, encoding="utf-8") as f:
+            return f.read()
+    return "".join(
+        f"<h3>{day}일차</h3><p>오늘은 산책과 식사에 대해 이야기했습니다. 기분이 좋았다고 합니다.</p>"
+        for day in range(1, 8)
+    ) * 5
+
+
+def _payload(args) -> list:
+    report_html = _report_html(args)
+    return [
+        {
+            "id": i,
+            "user_id": 1,
+            "report_type": "care",
+            "report_data": {"report_html": report_html, "conversation_count": 42},
+            "period": "2026-01-05~2026-01-11",
+            "generated_at": "2026-01-12T09:00:00",
+            "sent_at": "2026-01-12T09:00:05",
+            "email_sent": True
+        }
+        for i in range(args.reports)
+    ]
+
+
+def _time(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+async def _measure_encodings(payload: list, repeat: int) -> dict:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES)
+
+    @app.get("/history")
+    async def history():
+        return payload
+
+    result = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for encoding in ("identity", "gzip", "br"):
+            headers = {"Accept-Encoding": encoding}
+            response = await client.get("/history", headers=headers)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                await client.get("/history", headers=headers)
+            elapsed = (time.perf_counter() - started) / repeat
+            result[f"{encoding}_bytes"] = len(response.content) if encoding == "identity" else int(
+                response.headers.get("content-length", 0)
+            )
+            result[f"{encoding}_content_encoding"] = response.headers.get("content-encoding", "-")
+            result[f"{encoding}_request_ms"] = round(elapsed * 1000, 3)
+    return result
+
+
+def run(args) -> dict:
+    payload = _payload(args)
+    result = {
+        "reports": args.reports,
+        "json_response_ms": round(_time(lambda: JSONResponse(payload), args.repeat) * 1000, 3),
+        "orjson_response_ms": round(_time(lambda: ORJSONResponse(payload), args.repeat) * 1000, 3)
+    }
+    result.update(asyncio.run(_measure_encodings(payload, args.repeat)))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답 직렬화/압축 벤치마크")
+    parser.add_argument("--reports", type=int, default=20, help="응답에 넣을 리포트 수")
+    parser.add_argument("--report-html-file", default=None, help="실제 리포트 HTML 파일")
+    parser.add_argument("--repeat", type=int, default=200)
+    result = run(parser.parse_args())
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""SMTP 연결 풀 발송 벤치마크
+
+같은 메시지들을 메시지마다 새로 연결해 보내는 방식(기존 방식)과
+SMTPConnectionPool.send_messages로 연결을 재사용해 보내는 방식의 처리량을 비교합니다.
+
+사용 예 (저장소 루트에서, .env 설정 필요):
+    # 로컬 테스트 서버 (aiosmtpd 필요, STARTTLS/로그인 생략)
+    python -m scripts.bench_smtp --local --messages 120
+    # 실제 SMTP 서버 (.env의 SMTP 설정 사용, 실제로 메일이 발송됨)
+    python -m scripts.bench_smtp --to bench@example.com --messages 20
+"""
+import argparse
+import smtplib
+import time
+from email.mime.text import MIMEText
+
+from config import settings
+from services.email_service import SMTPConnectionPool
+
+
+class PlainSMTPConnectionPool(SMTPConnectionPool):
+    """STARTTLS/로그인 없이 연결하는 풀 (로컬 테스트 서버용)"""
+
+    def _connect(self, insecure: bool = False) -> smtplib.SMTP:
+        self.connections += 1
+        return smtplib.SMTP(self.host, self.port, timeout=30)
+
+
+class CountingSMTPConnectionPool(SMTPConnectionPool):
+    def _connect(self, insecure: bool = False) -> smtplib.SMTP:
+        self.connections += 1
+        return super()._connect(insecure)
+
+
+def _messages(count: int, to_email: str):
+    messages = []
+    for i in range(count):
+        message = MIMEText(f"벤치마크 메시지 {i}", "plain", "utf-8")
+        message["Subject"] = f"[MINDI] SMTP 벤치마크 {i}"
+        message["From"] = settings.FROM_EMAIL or settings.SMTP_USERNAME or "bench@localhost"
+        message["To"] = to_email
+        messages.append(message)
+    return messages
+
+
+def _create_pool(args, host: str, port: int) -> SMTPConnectionPool:
+    pool_class = PlainSMTPConnectionPool if args.local else CountingSMTPConnectionPool
+    pool = pool_class(
+        host=host,
+        port=port,
+        username=settings.SMTP_USERNAME,
+        password=settings.SMTP_PASSWORD,
+        size=settings.SMTP_POOL_SIZE,
+        max_idle_seconds=settings.SMTP_POOL_MAX_IDLE_SECONDS,
+        max_messages_per_connection=settings.SMTP_MAX_MESSAGES_PER_CONNECTION
+    )
+    pool.connections = 0
+    return pool
+
+
+def _measure(args, host: str, port: int) -> dict:
+    messages = _messages(args.messages, args.to)
+
+    # 기존 방식: 메시지마다 연결/인증 후 종료
+    pool = _create_pool(args, host, port)
+    started = time.perf_counter()
+    per_message_errors = 0
+    for message in messages:
+        server = pool._connect()
+        try:
+            server.send_message(message)
+        except smtplib.SMTPException:
+            per_message_errors += 1
+        finally:
+            pool._close(server)
+    per_message_elapsed = time.perf_counter() - started
+    per_message_connections = pool.connections
+
+    # 연결 풀: 인증된 연결 재사용
+    pool = _create_pool(args, host, port)
+    started = time.perf_counter()
+    errors = pool.send_messages(messages)
+    pooled_elapsed = time.perf_counter() - started
+    pool.close()
+
+    return {
+        "messages": args.messages,
+        "per_message_seconds": round(per_message_elapsed, 3),
+        "per_message_msgs_per_second": round(args.messages / per_message_elapsed, 1),
+        "per_message_connections": per_message_connections,
+        "per_message_errors": per_message_errors,
+        "pooled_seconds": round(pooled_elapsed, 3),
+        "pooled_msgs_per_second": round(args.messages / pooled_elapsed, 1),
+        "pooled_connections": pool.connections,
+        "pooled_errors": sum(error is not None for error in errors)
+    }
+
+
+def run(args) -> dict:
+    if not args.local:
+        return _measure(args, settings.SMTP_SERVER, settings.SMTP_PORT)
+
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.handlers import Sink
+
+    controller = Controller(Sink(), hostname="127.0.0.1", port=args.local_port)
+    controller.start()
+    try:
+        return _measure(args, controller.hostname, controller.port)
+    finally:
+        controller.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SMTP 연결 풀 발송 벤치마크")
+    parser.add_argument("--messages", type=int, default=120)
+    parser.add_argument("--to", default="bench@example.com")
+    parser.add_argument("--local", action="store_true", help="aiosmtpd 로컬 서버로 측정 (STARTTLS/로그인 생략)")
+    parser.add_argument("--local-port", type=int, default=8025)
+    result = run(parser.parse_args())
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -10,7 +12,10 @@ from starlette import status
 
 from config import settings
 from database import session
+from domain.auth import auth_crud
 from domain.user import user_crud, user_schema
+from domain.user.user_cache import user_cache
+from services.metrics_service import metrics_service
 
 # JWT 및 비밀번호 해싱 설정을 별도 파일로 분리
 
@@ -20,7 +25,7 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = 30  # refresh token은 30일간 유효
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/users/token")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -34,7 +39,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -45,12 +50,23 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})  # refresh token임을 표시
+    # refresh token임을 표시 (API 인증에는 사용할 수 없음)
+    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc), "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def create_token_pair(data: dict):
-    """Access token과 refresh token 쌍을 생성"""
+def user_claims(user) -> dict:
+    """stateless 인증에 사용하는 사용자 클레임"""
+    return {
+        "uid": user.id,
+        "name": user.name,
+        "tier": user.subscription_type
+    }
+
+def create_token_pair(data: dict, user=None):
+    """Access token과 refresh token 쌍을 생성 (user가 주어지면 사용자 클레임 포함)"""
+    if user is not None:
+        data = {**data, **user_claims(user)}
     access_token = create_access_token(data=data)
     refresh_token = create_refresh_token(data=data)
     return access_token, refresh_token
@@ -74,22 +90,132 @@ def verify_refresh_token(token: str):
     except JWTError:
         return None
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(session.get_db)):
+class RevocationList:
+    """주기적으로 갱신되는 토큰 무효화 목록 (user_id -> 마지막 무효화 시각)
+
+    access token 유효 기간 안의 기록만 유지하면 되므로 목록은 항상 작습니다.
+    """
+
+    def __init__(self, refresh_seconds: int):
+        self.refresh_seconds = refresh_seconds
+        self._revoked_at: Dict[int, datetime] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh_if_stale(self, db: Session):
+        if time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._refreshed_at < self.refresh_seconds:
+                return
+            since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            revoked_at = {}
+            for revocation in auth_crud.get_token_revocations_since(db, since):
+                if revocation.user_id not in revoked_at or revocation.revoked_at > revoked_at[revocation.user_id]:
+                    revoked_at[revocation.user_id] = revocation.revoked_at
+            self._revoked_at = revoked_at
+            self._refreshed_at = time.monotonic()
+
+    def is_revoked(self, user_id: int, issued_at: Optional[int]) -> bool:
+        revoked_at = self._revoked_at.get(user_id)
+        if revoked_at is None:
+            return False
+        if issued_at is None:
+            return True
+        # iat는 초 단위이므로 무효화 시각도 초 단위로 비교
+        return issued_at < int(revoked_at.replace(tzinfo=timezone.utc).timestamp())
+
+revocation_list = RevocationList(settings.AUTH_REVOCATION_REFRESH_SECONDS)
+
+def _resolve_user(payload: dict, db: Session, credentials_exception: HTTPException) -> user_schema.User:
+    """토큰 페이로드로 사용자(principal) 조회"""
+    phone: str = payload.get("sub")
+    if phone is None:
+        raise credentials_exception
+
+    # stateless 모드: 클레임이 포함된 토큰은 DB 조회 없이 인증
+    if settings.AUTH_MODE == "stateless" and payload.get("uid") is not None:
+        revocation_list.refresh_if_stale(db)
+        if revocation_list.is_revoked(payload["uid"], payload.get("iat")):
+            raise credentials_exception
+        return user_schema.User(
+            id=payload["uid"],
+            phone=phone,
+            name=payload.get("name"),
+            subscription_type=payload.get("tier")
+        )
+
+    return _load_user(phone, db, credentials_exception)
+
+def _load_user(phone: str, db: Session, credentials_exception: HTTPException) -> user_schema.User:
+    """캐시에 없을 때만 DB 조회 (사용자 정보 변경 시 user_crud에서 무효화)"""
+    user = user_cache.get(phone)
+    if user is None:
+        db_user = user_crud.get_user_by_phone(db, phone=phone)
+        if db_user is None:
+            raise credentials_exception
+        user = user_schema.User.model_validate(db_user)
+        user_cache.set(phone, user)
+    return user
+
+def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(session.get_db)
+) -> user_schema.User:
+    """모든 라우터가 사용하는 단일 인증 의존성
+
+    요청마다 한 번만 사용자를 확인하고 request.state에 저장하여
+    다른 의존성에서도 같은 결과를 재사용합니다.
+    디코딩/조회 단계 소요 시간은 request.state.auth_timing에 기록하고
+    ServerTimingMiddleware가 Server-Timing 헤더로 노출합니다.
+    """
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    decode_start = time.perf_counter()
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        phone: str = payload.get("sub")
-        if phone is None:
-            raise credentials_exception
-        token_data = user_schema.TokenData(phone=phone)
     except JWTError:
         raise credentials_exception
-
-    user = user_crud.get_user_by_phone(db, phone=token_data.phone)
-    if user is None:
+    # refresh token은 /auth/refresh에서만 사용 (무효화 목록은 access token 유효 기간만 유지)
+    if payload.get("type") == "refresh":
         raise credentials_exception
-    return user
+    lookup_start = time.perf_counter()
+    current_user = _resolve_user(payload, db, credentials_exception)
+    lookup_end = time.perf_counter()
+
+    auth_timing = {
+        "decode_ms": (lookup_start - decode_start) * 1000,
+        "lookup_ms": (lookup_end - lookup_start) * 1000
+    }
+    metrics_service.auth_seconds.observe(lookup_start - decode_start, "decode")
+    metrics_service.auth_seconds.observe(lookup_end - lookup_start, "lookup")
+    request.state.current_user = current_user
+    request.state.auth_timing = auth_timing
+    return current_user
+
+def get_current_user_profile(
+    current_user: user_schema.User = Depends(get_current_user),
+    db: Session = Depends(session.get_db)
+) -> user_schema.User:
+    """이메일/성별/생년월일 등 전체 프로필이 필요한 엔드포인트용 인증 의존성
+
+    stateless 모드의 principal은 토큰 클레임(id, 이름, 구독)만 가지므로
+    stateful 모드와 같은 방식으로 캐시 또는 DB에서 사용자 정보를 읽습니다.
+    """
+    if settings.AUTH_MODE != "stateless":
+        return current_user
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    return _load_user(current_user.phone, db, credentials_exception)
@@ -0,0 +1,28 @@
+from typing import Iterable, Type
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+# 신뢰할 수 있는 ORM 조회 결과를 pydantic 검증 없이 바로 JSON 바이트로 변환
+# 목록 응답에서 row마다 모델을 검증/생성한 뒤 다시 직렬화하는 비용을 없애기 위해 사용합니다.
+# 응답 스키마(response_model)는 API 문서용으로 라우터에 그대로 둡니다.
+
+
+def orm_list_response(rows: Iterable, schema: Type[BaseModel], response: Response) -> Response:
+    """ORM 객체 목록을 schema 필드만 골라 orjson으로 직렬화한 응답
+
+    response: 의존성이 설정한 헤더(ETag 등)를 옮겨 담을 주입된 Response
+    """
+    fields = tuple(schema.model_fields)
+    body = orjson.dumps(
+        [{field: getattr(row, field) for field in fields} for row in rows],
+        option=orjson.OPT_UTC_Z
+    )
+    result = Response(content=body, media_type="application/json")
+    # Set-Cookie 등 같은 이름의 헤더가 여러 개일 수 있으므로 raw_headers를 그대로 복사
+    result.raw_headers.extend(
+        (key, value) for key, value in response.raw_headers
+        if key not in (b"content-length", b"content-type")
+    )
+    return result
@@ -0,0 +1,89 @@
+import gzip
+import logging
+from typing import Tuple
+
+import httpx
+import orjson
+
+from config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstd는 zstandard 패키지가 설치된 경우에만 사용
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+class AIClient:
+    """AI 서버 JSON 요청 인코딩/압축
+
+    대화 원문이 들어가는 큰 요청 본문을 orjson으로 직렬화하고,
+    AI_REQUEST_COMPRESSION이 설정된 경우 AI_REQUEST_COMPRESSION_MIN_BYTES 이상의 본문을
+    Content-Encoding(gzip/zstd)으로 압축해 보냅니다.
+    AI 요청은 다시 보내면 안 되는(비멱등) LLM 호출이므로 지원 여부를 요청으로 확인하지 않습니다.
+    압축 본문을 해석할 수 있는 AI 서버 배포에서만 설정으로 켭니다.
+    """
+
+    def __init__(self):
+        self.compression = settings.AI_REQUEST_COMPRESSION
+        self.min_bytes = settings.AI_REQUEST_COMPRESSION_MIN_BYTES
+        if self.compression == "zstd" and zstandard is None:
+            logger.warning("zstandard 패키지가 없어 AI 요청 압축에 gzip을 사용합니다.")
+            self.compression = "gzip"
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if self.compression == "zstd" else None
+        self.bytes_raw = 0
+        self.bytes_sent = 0
+        self.in_flight = 0
+
+    def encode(self, payload: dict, compress: bool = True) -> Tuple[bytes, dict]:
+        """요청 본문과 헤더 생성"""
+        return self._compress(self._dumps(payload), compress)
+
+    def _dumps(self, payload: dict) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    def _compress(self, body: bytes, compress: bool) -> Tuple[bytes, dict]:
+        headers = {"Content-Type": "application/json"}
+        if not compress or self.compression == "none" or len(body) < self.min_bytes:
+            return body, headers
+
+        if self.compression == "zstd":
+            headers["Content-Encoding"] = "zstd"
+            return self._zstd_compressor.compress(body), headers
+        headers["Content-Encoding"] = "gzip"
+        return gzip.compress(body, compresslevel=5), headers
+
+    async def post_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: dict,
+        timeout: float
+    ) -> httpx.Response:
+        """AI 서버에 JSON 요청 (client.post(url, json=payload)와 같은 용도)"""
+        raw = self._dumps(payload)
+        body, headers = self._compress(raw, True)
+        self.in_flight += 1
+        try:
+            response = await client.post(url, content=body, headers=headers, timeout=timeout)
+        finally:
+            self.in_flight -= 1
+
+        if response.status_code == 415 and "Content-Encoding" in headers:
+            logger.warning(f"AI 서버가 압축 요청을 지원하지 않습니다. AI_REQUEST_COMPRESSION=none으로 설정하세요. ({url})")
+
+        self.bytes_raw += len(raw)
+        self.bytes_sent += len(body)
+        return response
+
+    def stats(self) -> dict:
+        return {
+            "compression": self.compression,
+            "bytes_raw": self.bytes_raw,
+            "bytes_sent": self.bytes_sent,
+            "in_flight": self.in_flight
+        }
+
+# 전역 AI 서버 요청 클라이언트 인스턴스
+ai_client = AIClient()
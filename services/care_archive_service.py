@@ -0,0 +1,284 @@
+import gzip
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+import boto3
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from config import settings
+from domain.care.care_model import CareLog, CareLogArchive
+
+logger = logging.getLogger(__name__)
+
+# 아카이브 파일에 저장하는 컬럼 (컬럼 단위로 묶어서 저장)
+ARCHIVE_COLUMNS = [
+    "id",
+    "conversation_date",
+    "user_id",
+    "user_question",
+    "ai_reply",
+    "conversation_id",
+    "created_at",
+]
+DELETE_BATCH_SIZE = 5000
+ARCHIVE_CACHE_SIZE = 256  # 메모리에 보관할 사용자별 월 아카이브 수
+
+
+def _month_start(target: date) -> date:
+    return date(target.year, target.month, 1)
+
+
+def _add_months(target: date, months: int) -> date:
+    month_index = target.year * 12 + (target.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+class LocalArchiveStorage:
+    """모든 서버가 함께 마운트한 공유 디렉터리(NFS/EFS 등) 저장소"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def read(self, key: str) -> Optional[bytes]:
+        try:
+            with open(os.path.join(self.root, key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, key: str, data: bytes):
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class S3ArchiveStorage:
+    """S3 오브젝트 스토리지 저장소 (s3://bucket/prefix)"""
+
+    def __init__(self, bucket: str, prefix: str):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = boto3.Session(region_name=settings.AWS_REGION).client("s3")
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def read(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
+
+    def write(self, key: str, data: bytes):
+        self.client.put_object(Bucket=self.bucket, Key=self._object_key(key), Body=data)
+
+
+def create_archive_storage(location: str):
+    """CARE_LOG_ARCHIVE_DIR로 저장소 생성 (공유 위치가 아니면 None)
+
+    아카이브 후 DB 행을 삭제하므로 모든 서버가 같은 아카이브를 읽을 수 있어야 합니다.
+    로컬 상대 경로는 아카이브를 실행한 서버에만 남으므로 허용하지 않습니다.
+    """
+    if location.startswith("s3://"):
+        bucket, _, prefix = location[len("s3://"):].partition("/")
+        return S3ArchiveStorage(bucket, prefix) if bucket else None
+    if location and os.path.isabs(location):
+        return LocalArchiveStorage(location)
+    return None
+
+
+class CareArchiveService:
+    """care_logs 월별 콜드 아카이브 서비스
+
+    보관 기간(CARE_LOG_RETENTION_MONTHS)이 지난 달의 대화 로그를
+    사용자별/월별 gzip 압축 컬럼형 JSON 파일로 공유 저장소에 옮기고 DB에서 삭제합니다.
+    사용자별 아카이브 로그 수(care_log_archives)는 삭제와 같은 트랜잭션에서 기록하며,
+    과거 날짜 조회 시 care_crud가 이 인덱스에 있는 달의 파일만 읽어 투명하게 합쳐줍니다.
+    공유 저장소(CARE_LOG_ARCHIVE_DIR)가 설정되지 않으면 아카이브하지 않고 DB에 그대로 둡니다.
+    """
+
+    def __init__(self):
+        self.storage = create_archive_storage(settings.CARE_LOG_ARCHIVE_DIR)
+        self.retention_months = settings.CARE_LOG_RETENTION_MONTHS
+        self._lock = threading.Lock()
+        # (month_key, user_id, log_count) -> 컬럼 (로그 수가 바뀌면 키도 바뀌므로 별도 무효화 불필요)
+        self._cache: "OrderedDict[tuple, Dict[str, list]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.storage is not None
+
+    def retention_cutoff(self, today: Optional[date] = None) -> date:
+        """이 날짜(월 1일) 이전의 데이터는 아카이브 대상 (아카이브 비활성화 시 전체가 DB에 있음)"""
+        if not self.enabled:
+            return date.min
+        return _add_months(_month_start(today or date.today()), -self.retention_months)
+
+    def _month_key(self, month: date) -> str:
+        return f"{month.year:04d}_{month.month:02d}"
+
+    def _user_key(self, month_key: str, user_id: int) -> str:
+        return f"{month_key}/user_{user_id}.json.gz"
+
+    def _read_user_month(self, month_key: str, user_id: int) -> Optional[Dict[str, list]]:
+        data = self.storage.read(self._user_key(month_key, user_id))
+        if data is None:
+            return None
+        return json.loads(gzip.decompress(data))
+
+    def _read_user_month_cached(self, month_key: str, user_id: int, log_count: int) -> Optional[Dict[str, list]]:
+        cache_key = (month_key, user_id, log_count)
+        with self._lock:
+            columns = self._cache.get(cache_key)
+            if columns is not None:
+                self._cache.move_to_end(cache_key)
+                return columns
+
+        columns = self._read_user_month(month_key, user_id)
+        if columns is None:
+            return None
+        with self._lock:
+            self._cache[cache_key] = columns
+            while len(self._cache) > ARCHIVE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return columns
+
+    def archive_old_months(self, db: Session) -> int:
+        """보관 기간이 지난 모든 달을 아카이브하고 옮긴 로그 수를 반환"""
+        if not self.enabled:
+            logger.warning(
+                "CARE_LOG_ARCHIVE_DIR에 공유 디렉터리(절대 경로) 또는 s3:// 위치가 설정되지 않아 "
+                "케어 로그를 아카이브하지 않습니다."
+            )
+            return 0
+
+        cutoff = self.retention_cutoff()
+        archived = 0
+
+        while True:
+            oldest = db.query(func.min(CareLog.conversation_date)).filter(
+                CareLog.conversation_date < cutoff
+            ).scalar()
+            if oldest is None:
+                break
+            archived += self._archive_month(db, _month_start(oldest))
+
+        return archived
+
+    def _archive_month(self, db: Session, month: date) -> int:
+        """한 달치 로그를 사용자 단위로 아카이브 파일에 기록하고 DB에서 삭제"""
+        month_key = self._month_key(month)
+        month_filter = (
+            CareLog.conversation_date >= month,
+            CareLog.conversation_date < _add_months(month, 1),
+        )
+        user_ids = [
+            row.user_id for row in
+            db.query(CareLog.user_id).filter(*month_filter).distinct().order_by(CareLog.user_id)
+        ]
+
+        added = 0
+        for user_id in user_ids:
+            added += self._archive_user_month(db, month, month_key, user_id, month_filter)
+
+        logger.info(f"care_logs {month_key} 아카이브 완료: {added}건 ({len(user_ids)}명)")
+        return added
+
+    def _archive_user_month(self, db: Session, month: date, month_key: str, user_id: int, month_filter: tuple) -> int:
+        rows = db.query(*[getattr(CareLog, column) for column in ARCHIVE_COLUMNS]).filter(
+            CareLog.user_id == user_id,
+            *month_filter
+        ).order_by(CareLog.id).all()
+
+        # 재실행 시 기존 아카이브에 이어서 기록
+        columns = self._read_user_month(month_key, user_id) or {column: [] for column in ARCHIVE_COLUMNS}
+        existing_ids = set(columns["id"])
+        added = 0
+        for row in rows:
+            if row.id in existing_ids:
+                continue
+            for column, value in zip(ARCHIVE_COLUMNS, row):
+                if isinstance(value, (date, datetime)):
+                    value = value.isoformat()
+                columns[column].append(value)
+            added += 1
+
+        payload = json.dumps(columns, ensure_ascii=False).encode("utf-8")
+        self.storage.write(self._user_key(month_key, user_id), gzip.compress(payload))
+
+        # 파일 기록이 끝난 후 아카이브 로그 수 갱신과 DB 삭제를 한 트랜잭션으로 수행
+        # (총 대화 수 = DB 로그 수 + 아카이브 로그 수가 어느 시점에도 중복/누락 없이 맞음)
+        archive = db.query(CareLogArchive).filter(
+            CareLogArchive.user_id == user_id,
+            CareLogArchive.archive_month == month
+        ).first()
+        if archive is None:
+            archive = CareLogArchive(user_id=user_id, archive_month=month)
+            db.add(archive)
+        archive.log_count = len(columns["id"])
+        archive.archived_at = datetime.now(timezone.utc)
+
+        ids = [row.id for row in rows]
+        for i in range(0, len(ids), DELETE_BATCH_SIZE):
+            db.query(CareLog).filter(
+                CareLog.id.in_(ids[i:i + DELETE_BATCH_SIZE])
+            ).delete(synchronize_session=False)
+        db.commit()
+        return added
+
+    def load_care_logs(self, db: Session, user_id: int, start_date: date, end_date: date) -> List[CareLog]:
+        """아카이브에서 사용자의 기간 내 로그 조회 (DB에 저장되지 않은 CareLog 객체로 반환)
+
+        인덱스(care_log_archives)에 있는 달의 파일만 읽습니다.
+        """
+        if not self.enabled:
+            return []
+        end_date = min(end_date, self.retention_cutoff())
+        archives = db.query(CareLogArchive.archive_month, CareLogArchive.log_count).filter(
+            CareLogArchive.user_id == user_id,
+            CareLogArchive.archive_month >= _month_start(start_date),
+            CareLogArchive.archive_month <= end_date,
+            CareLogArchive.log_count > 0
+        ).all()
+
+        logs = []
+        start_text, end_text = start_date.isoformat(), end_date.isoformat()
+        for archive_month, log_count in archives:
+            columns = self._read_user_month_cached(self._month_key(archive_month), user_id, log_count)
+            if not columns:
+                continue
+            for i, conversation_date in enumerate(columns["conversation_date"]):
+                if not (start_text <= conversation_date <= end_text):
+                    continue
+                created_at = columns["created_at"][i]
+                logs.append(CareLog(
+                    id=columns["id"][i],
+                    conversation_date=date.fromisoformat(conversation_date),
+                    user_id=user_id,
+                    user_question=columns["user_question"][i],
+                    ai_reply=columns["ai_reply"][i],
+                    conversation_id=columns["conversation_id"][i],
+                    created_at=datetime.fromisoformat(created_at) if created_at else None,
+                ))
+
+        logs.sort(key=lambda log: (log.conversation_date, log.created_at or datetime.min))
+        return logs
+
+    def count_care_logs(self, db: Session, user_id: int) -> int:
+        """아카이브된 사용자의 총 대화 수"""
+        return db.query(func.coalesce(func.sum(CareLogArchive.log_count), 0)).filter(
+            CareLogArchive.user_id == user_id
+        ).scalar()
+
+# 전역 아카이브 서비스 인스턴스
+care_archive_service = CareArchiveService()
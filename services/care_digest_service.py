@@ -0,0 +1,265 @@
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.orm import Session
+
+from config import settings
+from database.session import SessionLocal
+from domain.care import care_crud
+from domain.user import user_crud
+from services.ai_client import ai_client
+
+logger = logging.getLogger(__name__)
+
+
+def _duration_minutes(logs: list) -> Optional[int]:
+    if len(logs) < 2 or not logs[0].created_at or not logs[-1].created_at:
+        return None
+    return int((logs[-1].created_at - logs[0].created_at).total_seconds() / 60)
+
+
+def _digest_to_dict(digest) -> dict:
+    return {
+        "date": digest.digest_date.strftime("%Y-%m-%d"),
+        "summary_text": digest.summary_text,
+        "key_topics": digest.key_topics or [],
+        "emotional_tone": digest.emotional_tone,
+        "conversation_count": digest.conversation_count,
+        "duration_minutes": digest.duration_minutes
+    }
+
+
+class CareDigestService:
+    """하루 대화 요약(digest) 서비스
+
+    매일 밤 전날 대화를 AI 서버 /conversation-summary로 요약해 저장해 두고,
+    주간 리포트는 7일치 대화 원문 대신 하루 요약 7개와 통계만 AI 서버에 보냅니다.
+    요약이 없는 날은 리포트 생성 시점에 바로 요약해서 채웁니다.
+    """
+
+    def __init__(self):
+        self.ai_server_url = "http://localhost:8001"
+        self.payload_mode = settings.WEEKLY_REPORT_PAYLOAD
+        self.concurrency = settings.CARE_DIGEST_CONCURRENCY
+        self.chunk_size = settings.WEEKLY_REPORT_CHUNK_SIZE
+
+    async def summarize_day(
+        self,
+        client: httpx.AsyncClient,
+        user_id: int,
+        target_date: date,
+        logs: list
+    ) -> dict:
+        """하루 대화를 AI 서버에서 요약 (실패 시 예외 발생)"""
+        response = await ai_client.post_json(
+            client,
+            f"{self.ai_server_url}/conversation-summary",
+            {
+                "user_id": user_id,
+                "target_date": target_date.isoformat(),
+                "conversations": [
+                    {
+                        "user_question": log.user_question,
+                        "ai_reply": log.ai_reply,
+                        "created_at": log.created_at.isoformat() if log.created_at else None,
+                        "conversation_id": log.conversation_id
+                    }
+                    for log in logs
+                ]
+            },
+            timeout=30
+        )
+        if response.status_code != 200:
+            raise Exception(f"AI 서버 요약 응답 오류: {response.status_code}")
+
+        ai_data = response.json()
+        return {
+            "date": target_date.strftime("%Y-%m-%d"),
+            "summary_text": ai_data.get("summary_text", "요약을 생성할 수 없습니다."),
+            "key_topics": ai_data.get("key_topics", []),
+            "emotional_tone": ai_data.get("emotional_tone"),
+            "conversation_count": len(logs),
+            "duration_minutes": _duration_minutes(logs)
+        }
+
+    async def get_or_create_digest(
+        self,
+        db: Session,
+        client: httpx.AsyncClient,
+        user_id: int,
+        target_date: date,
+        logs: list,
+        digest=None
+    ) -> dict:
+        """저장된 하루 요약을 반환하고, 없으면 요약 후 저장 (오늘 날짜는 대화가 끝나지 않았으므로 저장하지 않음)"""
+        if digest is not None:
+            return _digest_to_dict(digest)
+
+        summary = await self.summarize_day(client, user_id, target_date, logs)
+        if target_date < date.today():
+            care_crud.save_daily_digest(db, user_id, target_date, summary)
+        return summary
+
+    async def build_report_content(
+        self,
+        db: Session,
+        client: httpx.AsyncClient,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        daily_logs: Optional[Dict[date, list]] = None,
+        digests: Optional[Dict[date, object]] = None
+    ) -> Tuple[dict, int]:
+        """/generate-care-report 요청의 대화 부분과 총 대화 수를 생성
+
+        WEEKLY_REPORT_PAYLOAD가 digest면 daily_digests + statistics를,
+        transcript면 기존처럼 weekly_conversations(대화 원문)를 반환합니다.
+        digest 모드에서 요약이 없는 날을 요약하지 못하면 대화 원문으로 대신합니다.
+        daily_logs/digests: 미리 조회한 {날짜: 로그 목록}/{날짜: 요약} (없으면 직접 조회)
+        """
+        if daily_logs is None:
+            daily_logs = care_crud.get_care_logs_for_users(db, [user_id], start_date, end_date)[user_id]
+
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        conversation_count = sum(len(daily_logs.get(day, [])) for day in days)
+
+        if self.payload_mode != "digest":
+            return self._transcript_content(days, daily_logs), conversation_count
+
+        if digests is None:
+            digests = care_crud.get_daily_digests_for_users(db, [user_id], start_date, end_date)[user_id]
+
+        # 요약이 없는 날은 동시에 요약 (사용자별 제한 시간 안에 순차로 최대 7번 호출하지 않도록)
+        missing = [day for day in days if day not in digests and daily_logs.get(day)]
+        results = await asyncio.gather(
+            *(self.summarize_day(client, user_id, day, daily_logs[day]) for day in missing),
+            return_exceptions=True
+        )
+        summaries = {}
+        errors = []
+        for day, result in zip(missing, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                continue
+            summaries[day] = result
+            # 오늘 날짜는 대화가 끝나지 않았으므로 저장하지 않음
+            if day < date.today():
+                care_crud.save_daily_digest(db, user_id, day, result)
+        if errors:
+            # 하루라도 요약하지 못하면 대화 원문으로 리포트 생성 (성공한 요약은 저장해 두고 다음에 재사용)
+            logger.warning(f"하루 요약 생성 실패로 대화 원문을 전송합니다 (사용자 {user_id}): {errors[0]}")
+            return self._transcript_content(days, daily_logs), conversation_count
+
+        daily_digests = [
+            _digest_to_dict(digests[day]) if day in digests else summaries[day]
+            for day in days
+            if day in digests or day in summaries
+        ]
+
+        daily_counts = {day.strftime("%Y-%m-%d"): len(daily_logs.get(day, [])) for day in days}
+        statistics = {
+            "total_conversations": conversation_count,
+            "active_days": sum(1 for count in daily_counts.values() if count),
+            "daily_counts": daily_counts,
+            "average_daily_conversations": conversation_count // len(days) if days else 0,
+            "total_duration_minutes": sum(digest["duration_minutes"] or 0 for digest in daily_digests)
+        }
+        return {"daily_digests": daily_digests, "statistics": statistics}, conversation_count
+
+    def _transcript_content(self, days: List[date], daily_logs: Dict[date, list]) -> dict:
+        """기존 /generate-care-report 형식의 weekly_conversations (대화 원문)"""
+        return {
+            "weekly_conversations": [
+                {
+                    "date": day.strftime("%Y-%m-%d"),
+                    "conversations": [
+                        {
+                            "user_question": log.user_question,
+                            "ai_reply": log.ai_reply,
+                            "conversation_id": log.conversation_id,
+                            "created_at": log.created_at.isoformat() if log.created_at else None
+                        }
+                        for log in daily_logs.get(day, [])
+                    ]
+                }
+                for day in days
+            ]
+        }
+
+    async def generate_daily_digests(self, target_date: Optional[date] = None) -> dict:
+        """유료 구독자의 하루 대화 요약을 일괄 생성 (기본값: 어제)
+
+        주간 리포트 대상자(이메일이 있는 유료 구독자)만 처리하며 이미 요약된 사용자는 건너뜁니다.
+        """
+        target_date = target_date or date.today() - timedelta(days=1)
+        summary = {"date": target_date.isoformat(), "created": 0, "skipped": 0, "failed": 0}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _summarize_user(client: httpx.AsyncClient, user_id: int, logs: list):
+            async with semaphore:
+                try:
+                    digest = await self.summarize_day(client, user_id, target_date, logs)
+                    await asyncio.to_thread(self._save_digest, user_id, target_date, digest)
+                    summary["created"] += 1
+                except Exception as e:
+                    summary["failed"] += 1
+                    logger.warning(f"사용자 {user_id} {target_date} 대화 요약 실패: {e}")
+
+        async with httpx.AsyncClient() as client:
+            after_id = 0
+            while True:
+                chunk = await asyncio.to_thread(self._load_digest_chunk, target_date, after_id)
+                if chunk is None:
+                    break
+                after_id, pending, skipped = chunk
+                summary["skipped"] += skipped
+                await asyncio.gather(*[
+                    _summarize_user(client, user_id, logs) for user_id, logs in pending
+                ])
+
+        logger.info(
+            f"{target_date} 대화 요약 생성 완료: 생성 {summary['created']}건, "
+            f"기존 {summary['skipped']}건, 실패 {summary['failed']}건"
+        )
+        return summary
+
+    def _load_digest_chunk(self, target_date: date, after_id: int) -> Optional[tuple]:
+        """요약이 필요한 사용자 묶음 조회 ((마지막 사용자 id, [(user_id, 로그)], 기존 요약 수))"""
+        db = SessionLocal()
+        try:
+            users = user_crud.get_users_by_subscription_type_chunk(
+                db, ['premium', 'premium_plus'], after_id=after_id, limit=self.chunk_size,
+                email_required=True
+            )
+            if not users:
+                return None
+            user_ids = [user.id for user in users]
+
+            logs_by_user = care_crud.get_care_logs_for_users(db, user_ids, target_date, target_date)
+            digests = care_crud.get_daily_digests_for_users(db, user_ids, target_date, target_date)
+            pending: List[tuple] = []
+            skipped = 0
+            for user_id in user_ids:
+                logs = logs_by_user[user_id].get(target_date, [])
+                if not logs:
+                    continue
+                if target_date in digests[user_id]:
+                    skipped += 1
+                    continue
+                pending.append((user_id, logs))
+            return user_ids[-1], pending, skipped
+        finally:
+            db.close()
+
+    def _save_digest(self, user_id: int, target_date: date, digest: dict):
+        db = SessionLocal()
+        try:
+            care_crud.save_daily_digest(db, user_id, target_date, digest)
+        finally:
+            db.close()
+
+# 전역 대화 요약 서비스 인스턴스
+care_digest_service = CareDigestService()
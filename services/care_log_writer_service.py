@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from config import settings
+from database.session import SessionLocal
+from domain.care import care_crud
+from domain.care.care_model import CareLog
+from domain.care.care_schema import CareLogCreate
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+FLUSH_MAX_ATTEMPTS = 3
+
+
+class CareLogWriterService:
+    """케어 로그 write-behind 저장 서비스
+
+    write_behind 모드에서는 음성 응답 경로에서 커밋을 기다리지 않도록
+    로그를 제한된 크기의 메모리 큐에 넣고, 백그라운드 태스크가 모아서
+    multi-row INSERT로 저장합니다. sync 모드에서는 기존처럼 즉시 커밋합니다.
+    """
+
+    def __init__(self):
+        self.enabled = settings.CARE_LOG_WRITE_MODE == "write_behind"
+        self.batch_size = settings.CARE_LOG_WRITE_BEHIND_BATCH_SIZE
+        self.flush_interval = settings.CARE_LOG_WRITE_BEHIND_FLUSH_INTERVAL
+        self.on_full = settings.CARE_LOG_WRITE_BEHIND_ON_FULL
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """백그라운드 저장 태스크 시작 (이벤트 루프 안에서 호출)"""
+        if not self.enabled or self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=settings.CARE_LOG_WRITE_BEHIND_QUEUE_SIZE)
+        self._task = asyncio.create_task(self._run())
+        logger.info("케어 로그 write-behind 저장이 시작되었습니다.")
+
+    async def stop(self):
+        """큐에 남은 로그를 모두 저장한 후 종료"""
+        if not self.running:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        logger.info("케어 로그 write-behind 저장이 종료되었습니다.")
+
+    def write(self, db: Session, care_log: CareLogCreate):
+        """케어 로그 저장 (write_behind 모드면 큐에 넣고 바로 반환)"""
+        if not self.running:
+            return care_crud.create_care_log(db=db, care_log=care_log)
+
+        row = care_log.model_dump()
+        row["created_at"] = datetime.now(timezone.utc)
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            if self.on_full == "drop":
+                logger.error(f"케어 로그 큐가 가득 차 로그를 버립니다: user_id={care_log.user_id}")
+                return None
+            logger.warning("케어 로그 큐가 가득 차 즉시 저장합니다.")
+            return care_crud.create_care_log(db=db, care_log=care_log)
+        return None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+        # 종료 신호 이후 남아있는 로그까지 저장
+        remaining = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                remaining.append(item)
+        for i in range(0, len(remaining), self.batch_size):
+            await self._flush(remaining[i:i + self.batch_size])
+
+    async def _flush(self, batch: List[dict]):
+        for attempt in range(1, FLUSH_MAX_ATTEMPTS + 1):
+            try:
+                await asyncio.to_thread(self._insert_batch, batch)
+                return
+            except Exception as e:
+                logger.warning(f"케어 로그 일괄 저장 실패 ({attempt}/{FLUSH_MAX_ATTEMPTS}): {e}")
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+        logger.error(f"케어 로그 {len(batch)}건 저장 최종 실패")
+
+    def _insert_batch(self, batch: List[dict]):
+        db = SessionLocal()
+        try:
+            db.execute(insert(CareLog), batch)
+            care_crud.record_conversation_turns(db, batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+# 전역 케어 로그 저장 서비스 인스턴스
+care_log_writer_service = CareLogWriterService()
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from config import settings
+from database.session import SessionLocal
+from domain.report import report_crud
+from services.email_service import email_service
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxService:
+    """이메일 발송 대기열(outbox) 워커
+
+    요청 처리 중에는 리포트와 함께 email_outbox에 기록만 하고,
+    이 워커가 백그라운드에서 SMTP 발송과 재시도(지수 백오프)를 담당합니다.
+    프로세스가 재시작되어도 대기열은 DB에 남아 있으므로 이메일이 유실되지 않습니다.
+    """
+
+    def __init__(self):
+        self.poll_seconds = settings.EMAIL_OUTBOX_POLL_SECONDS
+        self.batch_size = settings.EMAIL_OUTBOX_BATCH_SIZE
+        self.max_attempts = settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS
+        self.lease_seconds = settings.EMAIL_OUTBOX_LEASE_SECONDS
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def start(self):
+        """발송 워커 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info("이메일 발송 워커가 시작되었습니다.")
+
+    async def stop(self):
+        """진행 중인 발송을 마친 후 워커 종료"""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info("이메일 발송 워커가 중지되었습니다.")
+
+    def notify(self):
+        """새 이메일이 대기열에 추가되었음을 알림 (같은 프로세스의 워커를 즉시 깨움)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                delivered = await asyncio.to_thread(self.deliver_due_emails)
+            except Exception as e:
+                logger.error(f"이메일 발송 워커 오류: {e}")
+                delivered = 0
+
+            # 가득 채워 보냈다면 남은 이메일이 있을 수 있으므로 바로 이어서 처리
+            if delivered >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def deliver_due_emails(self) -> int:
+        """발송 시각이 된 이메일을 한 번에 발송하고 처리한 건수를 반환"""
+        db = SessionLocal()
+        try:
+            emails = report_crud.claim_due_outbox_emails(
+                db, self.batch_size, self.lease_seconds, self.max_attempts
+            )
+            if not emails:
+                return 0
+
+            results = email_service.send_many([
+                {
+                    "to_email": email["to_email"],
+                    "subject": email["subject"],
+                    "html_content": email["html_content"],
+                    "text_content": email["text_content"]
+                }
+                for email in emails
+            ])
+
+            for email, error in zip(emails, results):
+                if error is None:
+                    report_crud.mark_outbox_email_sent(db, email["id"])
+                    continue
+                if email["attempts"] >= self.max_attempts:
+                    logger.error(f"이메일 발송 최종 실패 (outbox {email['id']}): {email['to_email']}")
+                    retry_at = None
+                else:
+                    delay = self.retry_base_seconds * 2 ** (email["attempts"] - 1)
+                    retry_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=delay)
+                report_crud.mark_outbox_email_failed(
+                    db, email["id"], f"{type(error).__name__}: {error}", retry_at
+                )
+
+            return len(emails)
+        finally:
+            db.close()
+
+    def outbox_metrics(self) -> list:
+        """발송 대기열 상태별 건수 메트릭 (/metrics용)"""
+        db = SessionLocal()
+        try:
+            counts = report_crud.get_outbox_status_counts(db)
+        finally:
+            db.close()
+        samples = [
+            ({"status": status}, counts.get(status, 0))
+            for status in ("pending", "sending", "sent", "failed")
+        ]
+        return [("mindi_email_outbox_emails", "gauge", "Emails in the outbox by status", samples)]
+
+# 전역 이메일 발송 워커 인스턴스
+email_outbox_service = EmailOutboxService()
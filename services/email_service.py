@@ -1,4 +1,5 @@
 import smtplib
+import socket
 import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -6,13 +7,161 @@ from email.mime.base import MIMEBase
 from email import encoders
 from typing import Optional, List
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 import logging
 
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateNotFound, select_autoescape
+
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+class SMTPConnectionPool:
+    """인증된 SMTP 연결을 재사용하는 연결 풀
+
+    메시지마다 연결/STARTTLS/로그인을 반복하지 않도록 연결을 보관했다가 재사용합니다.
+    SSL 인증서 검증에 실패하면 해당 연결만 검증 없는 컨텍스트로 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        size: int,
+        max_idle_seconds: int,
+        max_messages_per_connection: int
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.max_idle_seconds = max_idle_seconds
+        self.max_messages_per_connection = max_messages_per_connection
+        self._idle: List[list] = []  # [연결, 마지막 사용 시각, 발송 건수]
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _ssl_context(self, insecure: bool = False) -> ssl.SSLContext:
+        context = ssl.create_default_context()
+        if insecure:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    def _connect(self, insecure: bool = False) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=30)
+        try:
+            server.starttls(context=self._ssl_context(insecure))
+        except ssl.SSLError as ssl_error:
+            server.close()
+            if insecure:
+                raise
+            # SSL 인증서 문제가 있는 경우 이번 연결만 안전하지 않은 방법으로 재시도
+            logger.warning(f"SSL 인증서 검증 실패, 안전하지 않은 연결로 재시도: {ssl_error}")
+            return self._connect(insecure=True)
+        except Exception:
+            server.close()
+            raise
+        try:
+            server.login(self.username, self.password)
+        except Exception:
+            # 로그인 실패 시 소켓을 닫고 오류 전달
+            server.close()
+            raise
+        return server
+
+    def _close(self, server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _checkout(self) -> list:
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return [self._connect(), time.monotonic(), 0]
+            if time.monotonic() - entry[1] < self.max_idle_seconds:
+                return entry
+            # 오래 쉰 연결은 서버가 끊었을 수 있으므로 확인
+            try:
+                if entry[0].noop()[0] == 250:
+                    return entry
+            except (smtplib.SMTPException, OSError):
+                # 끊긴 연결은 SMTPServerDisconnected 외에 ConnectionResetError 등 소켓 오류로도 나타남
+                pass
+            self._close(entry[0])
+
+    def _checkin(self, entry: list):
+        entry[1] = time.monotonic()
+        if entry[2] >= self.max_messages_per_connection:
+            self._close(entry[0])
+            return
+        with self._lock:
+            self._idle.append(entry)
+
+    def send_messages(self, messages: List[MIMEMultipart]) -> List[Optional[Exception]]:
+        """하나의 연결로 메시지들을 발송하고 메시지별 오류(성공 시 None)를 반환
+
+        연결이 끊긴 경우에만 새 연결로 한 번 더 시도하고, 수신자 거부 등 메시지 자체의 오류는 재시도하지 않습니다.
+        연결/로그인 자체가 실패하면 이미 발송한 메시지의 결과는 그대로 두고 남은 메시지만 그 오류로 표시합니다.
+        """
+        results: List[Optional[Exception]] = []
+        self._slots.acquire()
+        entry = None
+        try:
+            for index, message in enumerate(messages):
+                error = None
+                for attempt in range(2):
+                    if entry is None:
+                        try:
+                            entry = self._checkout()
+                        except Exception as e:
+                            logger.error(f"SMTP 연결 실패: {e}")
+                            results.extend([e] * (len(messages) - index))
+                            return results
+                    try:
+                        entry[0].send_message(message)
+                        entry[2] += 1
+                        error = None
+                        break
+                    except (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout) as e:
+                        # 끊어진 연결은 버리고 새 연결로 한 번 더 시도
+                        error = e
+                        self._close(entry[0])
+                        entry = None
+                    except smtplib.SMTPException as e:
+                        # 수신자 거부 등 메시지 자체의 오류는 재시도하지 않음 (연결은 계속 사용)
+                        error = e
+                        break
+                    except Exception as e:
+                        # 그 밖의 오류는 연결 상태를 알 수 없으므로 연결을 버리고 이 메시지만 실패 처리
+                        error = e
+                        self._close(entry[0])
+                        entry = None
+                        break
+                results.append(error)
+                if entry is not None and entry[2] >= self.max_messages_per_connection:
+                    self._close(entry[0])
+                    entry = None
+        finally:
+            if entry is not None:
+                self._checkin(entry)
+            self._slots.release()
+        return results
+
+    def close(self):
+        """보관 중인 연결을 모두 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._close(entry[0])
+
 class EmailService:
     """이메일 발송 서비스 클래스"""
     
@@ -23,6 +172,78 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.FROM_EMAIL if settings.FROM_EMAIL else settings.SMTP_USERNAME
         self.from_name = settings.FROM_NAME
+        self.pool = SMTPConnectionPool(
+            host=self.smtp_server,
+            port=self.smtp_port,
+            username=self.smtp_username,
+            password=self.smtp_password,
+            size=settings.SMTP_POOL_SIZE,
+            max_idle_seconds=settings.SMTP_POOL_MAX_IDLE_SECONDS,
+            max_messages_per_connection=settings.SMTP_MAX_MESSAGES_PER_CONNECTION
+        )
+        # 템플릿은 서버 시작 시 한 번만 컴파일해 두고 발송마다 렌더링만 수행
+        self.templates = self._create_template_environment()
+        self.diagnosis_template = self._load_template("email_template.html")
+        self.care_template = self._load_template("care_email_template.html")
+    
+    def _create_template_environment(self) -> Environment:
+        """services 디렉토리의 이메일 템플릿용 Jinja2 환경 생성"""
+        if settings.EMAIL_TEMPLATE_CACHE_DIR:
+            os.makedirs(settings.EMAIL_TEMPLATE_CACHE_DIR, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(settings.EMAIL_TEMPLATE_CACHE_DIR)
+        else:
+            bytecode_cache = FileSystemBytecodeCache()
+
+        return Environment(
+            loader=FileSystemLoader(os.path.dirname(__file__)),
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False
+        )
+    
+    def _load_template(self, name: str) -> Optional[Template]:
+        try:
+            return self.templates.get_template(name)
+        except TemplateNotFound:
+            logger.error(f"이메일 템플릿 파일을 찾을 수 없습니다: {name}")
+            return None
+    
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+        attachments: Optional[List[dict]] = None
+    ) -> MIMEMultipart:
+        """이메일 메시지 생성"""
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = f"{self.from_name} <{self.from_email}>"
+        message["To"] = to_email
+        
+        # HTML 내용 추가
+        html_part = MIMEText(html_content, "html", "utf-8")
+        message.attach(html_part)
+        
+        # 텍스트 내용 추가 (있는 경우)
+        if text_content:
+            text_part = MIMEText(text_content, "plain", "utf-8")
+            message.attach(text_part)
+        
+        # 첨부파일 추가
+        if attachments:
+            for attachment in attachments:
+                part = MIMEBase("application", "octet-stream")
+                part.set_payload(attachment["content"])
+                encoders.encode_base64(part)
+                part.add_header(
+                    "Content-Disposition",
+                    f"attachment; filename= {attachment['filename']}"
+                )
+                message.attach(part)
+        
+        return message
         
     def send_email(
         self,
@@ -46,62 +267,56 @@ class EmailService:
         Returns:
             bool: 발송 성공 여부
         """
-        try:
-            # 이메일 메시지 생성
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
-            
-            # HTML 내용 추가
-            html_part = MIMEText(html_content, "html", "utf-8")
-            message.attach(html_part)
-            
-            # 텍스트 내용 추가 (있는 경우)
-            if text_content:
-                text_part = MIMEText(text_content, "plain", "utf-8")
-                message.attach(text_part)
-            
-            # 첨부파일 추가
-            if attachments:
-                for attachment in attachments:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(attachment["content"])
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        "Content-Disposition",
-                        f"attachment; filename= {attachment['filename']}"
-                    )
-                    message.attach(part)
-            
-            # SMTP 서버 연결 및 이메일 발송
+        return self.send_many([{
+            "to_email": to_email,
+            "subject": subject,
+            "html_content": html_content,
+            "text_content": text_content,
+            "attachments": attachments
+        }])[0] is None
+    
+    def send_many(self, emails: List[dict]) -> List[Optional[Exception]]:
+        """
+        여러 이메일을 하나의 SMTP 연결로 일괄 발송
+        
+        Args:
+            emails: send_email 인자와 같은 키를 가진 딕셔너리 리스트
+        
+        Returns:
+            List[Optional[Exception]]: 이메일별 발송 오류 (성공 시 None)
+        """
+        results: List[Optional[Exception]] = [None] * len(emails)
+        messages = []
+        indexes = []
+        
+        for i, email in enumerate(emails):
             try:
-                # 기본 SSL 컨텍스트로 시도
-                context = ssl.create_default_context()
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls(context=context)
-                    server.login(self.smtp_username, self.smtp_password)
-                    server.send_message(message)
-            except ssl.SSLError as ssl_error:
-                # SSL 인증서 문제가 있는 경우 안전하지 않은 방법 사용
-                logger.warning(f"SSL 인증서 검증 실패, 안전하지 않은 연결로 재시도: {ssl_error}")
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-                
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls(context=context)
-                    server.login(self.smtp_username, self.smtp_password)
-                    server.send_message(message)
-            
-            logger.info(f"이메일 발송 성공: {to_email} - {subject}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"이메일 발송 실패: {to_email} - {subject} - {str(e)}")
-            return False
+                messages.append(self._build_message(**email))
+                indexes.append(i)
+            except Exception as e:
+                results[i] = e
+                logger.error(f"이메일 생성 실패: {email.get('to_email')} - {email.get('subject')} - {str(e)}")
+        
+        if not messages:
+            return results
+        
+        errors = self.pool.send_messages(messages)
+        
+        for i, error in zip(indexes, errors):
+            email = emails[i]
+            results[i] = error
+            if error is None:
+                logger.info(f"이메일 발송 성공: {email['to_email']} - {email['subject']}")
+            else:
+                logger.error(f"이메일 발송 실패: {email['to_email']} - {email['subject']} - {str(error)}")
+        
+        return results
+    
+    def close(self):
+        """SMTP 연결 풀 정리"""
+        self.pool.close()
     
-    def send_diagnosis_report(
+    def compose_diagnosis_report(
         self,
         to_email: str,
         user_name: str,
@@ -110,9 +325,9 @@ class EmailService:
         result_good_list: List[str],
         result_bad_list: List[str],
         scores: dict
-    ) -> bool:
+    ) -> dict:
         """
-        진단 리포트 이메일 발송
+        진단 리포트 이메일 생성 (발송은 하지 않음)
         
         Args:
             to_email: 수신자 이메일
@@ -124,7 +339,7 @@ class EmailService:
             scores: 진단 점수 딕셔너리
         
         Returns:
-            bool: 발송 성공 여부
+            dict: send_email 인자 (to_email, subject, html_content, text_content)
         """
         subject = f"[MINDI] {user_name}님의 인지 기능 진단 결과 리포트"
 
@@ -139,13 +354,18 @@ class EmailService:
             user_name, evaluate_good_list, evaluate_bad_list, result_good_list, result_bad_list, scores
         )
         
-        return self.send_email(
-            to_email=to_email,
-            subject=subject,
-            html_content=email_html
-        )
+        return {
+            "to_email": to_email,
+            "subject": subject,
+            "html_content": email_html,
+            "text_content": None
+        }
+    
+    def send_diagnosis_report(self, **kwargs) -> bool:
+        """진단 리포트 이메일 발송 (인자는 compose_diagnosis_report와 동일)"""
+        return self.send_email(**self.compose_diagnosis_report(**kwargs))
     
-    def send_care_report(
+    def compose_care_report(
         self,
         to_email: str,
         user_name: str,
@@ -153,9 +373,9 @@ class EmailService:
         report_text: str,
         period: dict,
         conversation_count: int
-    ) -> bool:
+    ) -> dict:
         """
-        케어 리포트 이메일 발송
+        케어 리포트 이메일 생성 (발송은 하지 않음)
         
         Args:
             to_email: 수신자 이메일
@@ -166,7 +386,7 @@ class EmailService:
             conversation_count: 대화 횟수
         
         Returns:
-            bool: 발송 성공 여부
+            dict: send_email 인자 (to_email, subject, html_content, text_content)
         """
         subject = f"[MINDI] {user_name}님의 주간 케어 서비스 분석 리포트"
         
@@ -175,12 +395,16 @@ class EmailService:
             user_name, report_html, period, conversation_count
         )
         
-        return self.send_email(
-            to_email=to_email,
-            subject=subject,
-            html_content=email_html,
-            text_content=report_text
-        )
+        return {
+            "to_email": to_email,
+            "subject": subject,
+            "html_content": email_html,
+            "text_content": report_text
+        }
+    
+    def send_care_report(self, **kwargs) -> bool:
+        """케어 리포트 이메일 발송 (인자는 compose_care_report와 동일)"""
+        return self.send_email(**self.compose_care_report(**kwargs))
     
     def _create_diagnosis_email_template(
         self,
@@ -192,87 +416,22 @@ class EmailService:
         scores: dict
     ) -> str:
         """진단 리포트 이메일 템플릿 생성"""
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        
-        # HTML 템플릿 파일 읽기
-        template_path = os.path.join(os.path.dirname(__file__), "email_template.html")
-        
-        try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-        except FileNotFoundError:
-            logger.error(f"이메일 템플릿 파일을 찾을 수 없습니다: {template_path}")
+        if self.diagnosis_template is None:
             return self._create_fallback_diagnosis_template(
                 user_name, evaluate_good_list, evaluate_bad_list, 
                 result_good_list, result_bad_list, scores
             )
         
-        # 동적 데이터로 템플릿 치환
-        email_html = template_content
-        
-        # 기본 정보 치환
-        email_html = email_html.replace("{{CURRENT_DATE}}", current_date)
-        
-        # 잘하고 있어요 섹션 처리
-        if evaluate_good_list:
-            evaluate_discription = ""
-            for item in evaluate_good_list:
-                evaluate_discription += f"{item}<br>"
-            
-            result_discription = ""
-            for item in result_good_list:
-                result_discription += f"{item}<br>"
-            
-            # 섹션 활성화
-            email_html = email_html.replace("{{#GOOD_LIST}}", "")
-            email_html = email_html.replace("{{/GOOD_LIST}}", "")
-
-            email_html = email_html.replace("{{#EVALUATE_GOOD_LIST}}", "")
-            email_html = email_html.replace("{{/EVALUATE_GOOD_LIST}}", "")
-            email_html = email_html.replace("{{.}}", evaluate_discription)
-            
-            email_html = email_html.replace("{{#RESULT_GOOD_LIST}}", "")
-            email_html = email_html.replace("{{/RESULT_GOOD_LIST}}", "")
-            email_html = email_html.replace("{{.}}", result_discription)
-        else:
-            # 섹션 비활성화
-            email_html = email_html.replace("{{#GOOD_LIST}}", "<!--")
-            email_html = email_html.replace("{{/GOOD_LIST}}", "-->")
-        
-        # 노력이 필요해요 섹션 처리
-        if evaluate_bad_list:
-            evaluate_discription = ""
-            for item in evaluate_bad_list:
-                evaluate_discription += f"{item}<br>"
-            
-            result_discription = ""
-            for item in result_bad_list:
-                result_discription += f"{item}<br>"
-            
-            # 섹션 활성화
-            email_html = email_html.replace("{{#BAD_LIST}}", "")
-            email_html = email_html.replace("{{/BAD_LIST}}", "")
-
-            email_html = email_html.replace("{{#EVALUATE_BAD_LIST}}", "")
-            email_html = email_html.replace("{{/EVALUATE_BAD_LIST}}", "")
-            email_html = email_html.replace("{{.}}", evaluate_discription)
-            
-            email_html = email_html.replace("{{#RESULT_BAD_LIST}}", "")
-            email_html = email_html.replace("{{/RESULT_BAD_LIST}}", "")
-            email_html = email_html.replace("{{.}}", result_discription)
-        else:
-            # 섹션 비활성화
-            email_html = email_html.replace("{{#BAD_LIST}}", "<!--")
-            email_html = email_html.replace("{{/BAD_LIST}}", "-->")
-
-        # 차트 날짜 치환
-        chart_labels = [datetime.now() - timedelta(days=i) for i in range(6, -1, -1)]
-        chart_labels_html = ""
-        for label in chart_labels:
-            chart_labels_html += f"<td class='chart-label'>{label.strftime('%m/%d')}</td>"
-        email_html = email_html.replace("{{CHART_LABELS}}", chart_labels_html)
-        
-        return email_html
+        now = datetime.now()
+        return self.diagnosis_template.render(
+            current_date=now.strftime("%Y-%m-%d"),
+            evaluate_good_list=evaluate_good_list,
+            evaluate_bad_list=evaluate_bad_list,
+            result_good_list=result_good_list,
+            result_bad_list=result_bad_list,
+            # 차트 날짜 (최근 7일)
+            chart_labels=[(now - timedelta(days=i)).strftime("%m/%d") for i in range(6, -1, -1)]
+        )
     
     def _create_fallback_diagnosis_template(
         self,
@@ -340,86 +499,15 @@ class EmailService:
         period: dict,
         conversation_count: int
     ) -> str:
-        """케어 리포트 이메일 템플릿 생성"""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>MINDI 케어 서비스 분석</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    text-align: center;
-                    border-radius: 10px 10px 0 0;
-                }}
-                .content {{
-                    background: #f9f9f9;
-                    padding: 30px;
-                    border-radius: 0 0 10px 10px;
-                }}
-                .stats {{
-                    background: white;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin: 20px 0;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #eee;
-                    color: #666;
-                    font-size: 12px;
-                }}
-                .logo {{
-                    font-size: 24px;
-                    font-weight: bold;
-                    margin-bottom: 10px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <div class="logo">🧠 MINDI</div>
-                <h1>주간 케어 서비스 분석 리포트</h1>
-                <p>분석 기간: {period.get('start_date', '')} ~ {period.get('end_date', '')}</p>
-            </div>
-            
-            <div class="content">
-                <h2>안녕하세요, {user_name}님!</h2>
-                <p>지난 주 MINDI와의 대화를 분석한 결과를 알려드립니다.</p>
-                
-                <div class="stats">
-                    <h3>📈 주간 활동 요약</h3>
-                    <ul>
-                        <li>분석 기간: {period.get('start_date', '')} ~ {period.get('end_date', '')}</li>
-                        <li>총 대화 횟수: {conversation_count}회</li>
-                        <li>평균 일일 대화: {conversation_count // 7 if conversation_count > 0 else 0}회</li>
-                    </ul>
-                </div>
-                
-                {report_html}
-                
-                <div class="footer">
-                    <p>본 이메일은 MINDI 서비스에서 자동으로 발송되었습니다.</p>
-                    <p>문의사항이 있으시면 고객센터로 연락해 주세요.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        """케어 리포트 이메일 템플릿 생성 (report_html은 AI 서버가 만든 HTML이므로 그대로 삽입)"""
+        return self.care_template.render(
+            user_name=user_name,
+            start_date=period.get("start_date", ""),
+            end_date=period.get("end_date", ""),
+            conversation_count=conversation_count,
+            daily_average=conversation_count // 7 if conversation_count > 0 else 0,
+            report_html=report_html
+        )
 
 # 전역 이메일 서비스 인스턴스
 email_service = EmailService()
@@ -0,0 +1,103 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from config import settings
+from database.session import engine
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElectionService:
+    """여러 워커 프로세스 중 스케줄 작업을 실행할 리더 1개를 선출
+
+    MySQL GET_LOCK은 잠금을 획득한 DB 연결이 끊기면 자동으로 해제되므로,
+    리더 프로세스가 종료되거나 죽으면 다음 확인 주기에 다른 프로세스가 리더가 됩니다.
+    잠금을 유지하기 위해 전용 연결 하나를 계속 열어 둡니다.
+    MySQL이 아닌 DB(로컬 개발용 SQLite 등)이거나 비활성화된 경우 항상 리더로 동작합니다.
+    """
+
+    def __init__(self):
+        self.enabled = settings.SCHEDULER_LEADER_ELECTION
+        self.lock_name = settings.SCHEDULER_LEADER_LOCK_NAME
+        self._connection: Optional[Connection] = None
+        self.is_leader = False
+        self.leader_since: Optional[datetime] = None
+
+    @property
+    def uses_lock(self) -> bool:
+        return self.enabled and engine.dialect.name == "mysql"
+
+    def check(self) -> bool:
+        """리더 여부 확인 (리더가 아니면 잠금 획득을 시도하고, 리더면 잠금 보유를 확인)"""
+        if not self.uses_lock:
+            self._set_leader(True)
+            return True
+
+        try:
+            if self._connection is None:
+                # 잠금 함수는 트랜잭션과 무관하므로 autocommit 연결 사용
+                self._connection = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+            if self.is_leader:
+                held = self._connection.execute(
+                    text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"),
+                    {"name": self.lock_name}
+                ).scalar() == 1
+            else:
+                held = self._connection.execute(
+                    text("SELECT GET_LOCK(:name, 0)"),
+                    {"name": self.lock_name}
+                ).scalar() == 1
+        except Exception as e:
+            logger.warning(f"스케줄러 리더 잠금 확인 실패: {e}")
+            self._discard_connection()
+            held = False
+
+        self._set_leader(held)
+        return held
+
+    def release(self):
+        """리더 잠금 해제 (종료 시 다른 프로세스가 바로 이어받도록)"""
+        if self._connection is not None and self.is_leader:
+            try:
+                self._connection.execute(
+                    text("SELECT RELEASE_LOCK(:name)"),
+                    {"name": self.lock_name}
+                )
+            except Exception as e:
+                logger.warning(f"스케줄러 리더 잠금 해제 실패: {e}")
+        self._discard_connection()
+        self._set_leader(False)
+
+    def _set_leader(self, is_leader: bool):
+        if is_leader and not self.is_leader:
+            self.leader_since = datetime.now()
+            logger.info("이 프로세스가 스케줄러 리더가 되었습니다.")
+        elif not is_leader and self.is_leader:
+            self.leader_since = None
+            logger.warning("이 프로세스가 스케줄러 리더 역할을 잃었습니다.")
+        self.is_leader = is_leader
+
+    def _discard_connection(self):
+        if self._connection is None:
+            return
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.uses_lock,
+            "lock_name": self.lock_name,
+            "is_leader": self.is_leader,
+            "leader_since": self.leader_since.isoformat() if self.leader_since else None
+        }
+
+# 전역 리더 선출 서비스 인스턴스
+leader_election_service = LeaderElectionService()
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Optional, Union
+from weakref import WeakKeyDictionary
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitorService:
+    """이벤트 루프 지연(lag) 측정 및 차단 감지 (LOOP_MONITOR_ENABLED일 때만 사용)
+
+    루프 안의 측정 태스크가 interval마다 깨어나 예정보다 늦어진 시간을 기록하고,
+    별도 감시 스레드가 측정 태스크의 마지막 실행 시각을 확인해 threshold 이상 멈춰 있으면
+    그 순간 루프 스레드의 스택과 실행 중인 라우트를 캡처합니다.
+    루프가 풀리면 전체 차단 시간과 함께 경고 로그를 남깁니다.
+    """
+
+    def __init__(self):
+        self.enabled = settings.LOOP_MONITOR_ENABLED
+        self.interval = settings.LOOP_MONITOR_INTERVAL_SECONDS
+        self.threshold = settings.LOOP_MONITOR_BLOCK_THRESHOLD_SECONDS
+        self._lags = deque(maxlen=settings.LOOP_MONITOR_SAMPLE_WINDOW)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._heartbeat = time.monotonic()
+        self._captured: Optional[dict] = None
+        self._lock = threading.Lock()
+        # 태스크 -> ASGI scope 또는 작업 이름 (미들웨어/스케줄러가 등록, 태스크가 끝나면 자동 제거)
+        self.task_labels: "WeakKeyDictionary[asyncio.Task, Union[dict, str]]" = WeakKeyDictionary()
+        self.blocked_count = 0
+        self.blocked_by_route: Counter = Counter()
+        self.recent_blocks = deque(maxlen=20)
+
+    def start(self):
+        """측정 태스크와 감시 스레드 시작 (이벤트 루프 안에서 호출)"""
+        if not self.enabled or self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info("이벤트 루프 감시를 시작합니다.")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._watchdog.join(timeout=self.threshold * 2)
+        self._watchdog = None
+
+    def register_task(self, label: Union[dict, str]):
+        """현재 태스크가 처리 중인 요청(ASGI scope) 또는 작업 이름 등록 (차단 위치 확인용)"""
+        if not self.enabled:
+            return
+        task = asyncio.current_task()
+        if task is not None:
+            self.task_labels[task] = label
+
+    async def _measure(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self._heartbeat = time.monotonic()
+            self._lags.append(lag)
+            if lag >= self.threshold:
+                self._report_block(lag)
+
+    def _watch(self):
+        # 측정 태스크가 threshold 이상 깨어나지 못하면 그 순간의 루프 스레드 스택을 캡처
+        poll = max(self.threshold / 4, 0.01)
+        while not self._stopping.wait(poll):
+            stalled = time.monotonic() - self._heartbeat
+            if stalled < self.threshold + self.interval:
+                continue
+            with self._lock:
+                if self._captured is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                self._captured = {
+                    "route": self._current_route(),
+                    "stack": "".join(traceback.format_stack(frame, limit=25)) if frame else ""
+                }
+
+    def _current_route(self) -> str:
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return "unknown"
+        if task is None:
+            return "loop callback"
+        label = self.task_labels.get(task)
+        if label is None:
+            # 등록되지 않은 태스크는 코루틴 이름으로 표시
+            return getattr(task.get_coro(), "__qualname__", task.get_name())
+        if isinstance(label, str):
+            return label
+        # 라우팅 후에는 scope["route"]에 매칭된 라우트가 들어 있음
+        route = getattr(label.get("route"), "path", label.get("path", ""))
+        return f"{label.get('method', '')} {route}"
+
+    def _report_block(self, lag: float):
+        with self._lock:
+            captured, self._captured = self._captured, None
+        route = captured["route"] if captured else "unknown"
+        self.blocked_count += 1
+        self.blocked_by_route[route] += 1
+        self.recent_blocks.append({
+            "route": route,
+            "blocked_seconds": round(lag, 3),
+            "at": time.time(),
+            "stack": captured["stack"] if captured else ""
+        })
+        logger.warning(
+            f"이벤트 루프가 {lag:.3f}초 동안 차단되었습니다 ({route})"
+            + (f"\n{captured['stack']}" if captured and captured["stack"] else "")
+        )
+
+    def stats(self) -> dict:
+        lags = sorted(self._lags)
+        if not lags:
+            return {"samples": 0, "blocked": self.blocked_count}
+
+        def percentile(p: float) -> float:
+            return lags[min(len(lags) - 1, int(p * len(lags)))]
+
+        return {
+            "samples": len(lags),
+            "lag_p50": percentile(0.5),
+            "lag_p90": percentile(0.9),
+            "lag_p99": percentile(0.99),
+            "lag_max": lags[-1],
+            "blocked": self.blocked_count
+        }
+
+    def metrics(self) -> list:
+        """이벤트 루프 지연 백분위와 라우트별 차단 횟수 메트릭 (/metrics용)"""
+        stats = self.stats()
+        lag_samples = [
+            ({"quantile": quantile}, stats[f"lag_{name}"])
+            for quantile, name in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99"), ("1", "max"))
+            if f"lag_{name}" in stats
+        ]
+        return [
+            ("mindi_event_loop_lag_seconds", "gauge", "Event loop lag over the recent sample window", lag_samples),
+            ("mindi_event_loop_blocked_total", "counter", "Event loop blocks longer than the threshold",
+             [({"route": route}, count) for route, count in sorted(self.blocked_by_route.items())])
+        ]
+
+# 전역 이벤트 루프 감시 서비스 인스턴스
+loop_monitor_service = LoopMonitorService()
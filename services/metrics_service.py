@@ -0,0 +1,160 @@
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 음성 파이프라인(업로드 ~ AI 호출 ~ TTS)을 고려한 초 단위 버킷
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# (이름, 타입, 설명, [(라벨, 값)]) 형태의 메트릭
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Prometheus 히스토그램 (누적 버킷, 합계, 건수)"""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[tuple, list] = {}  # 라벨 값 -> [버킷별 건수..., 합계, 건수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labelvalues, series in sorted(snapshot.items()):
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {series[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {series[-2]!r}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {series[-1]}")
+        return lines
+
+
+class MetricsService:
+    """Prometheus 텍스트 형식 메트릭 서비스 (프로세스 단위)
+
+    요청 처리 단계별 소요 시간은 stage()로 히스토그램에 기록하고,
+    DB 풀/캐시/배치 상태처럼 조회 시점에 읽는 값은 collector로 등록해 /metrics에서 함께 출력합니다.
+    uvicorn 워커가 여러 개면 워커마다 따로 집계되므로 Prometheus에서 합산합니다.
+    """
+
+    def __init__(self):
+        self.stage_seconds = Histogram(
+            "mindi_pipeline_stage_seconds",
+            "Duration of each request pipeline stage in seconds",
+            ("pipeline", "stage")
+        )
+        self.auth_seconds = Histogram(
+            "mindi_auth_stage_seconds",
+            "Duration of authentication stages in seconds",
+            ("stage",),
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+        )
+        self._in_progress: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self._collectors: List[Tuple[str, Callable[[], Iterable[MetricFamily]]]] = []
+
+    @contextmanager
+    def stage(self, pipeline: str, stage: str):
+        """with 블록의 소요 시간을 단계 히스토그램에 기록 (예외가 나도 기록)"""
+        key = (pipeline, stage)
+        with self._lock:
+            self._in_progress[key] = self._in_progress.get(key, 0) + 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds.observe(time.perf_counter() - started, pipeline, stage)
+            with self._lock:
+                self._in_progress[key] -= 1
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[MetricFamily]]):
+        """조회 시점에 값을 읽는 메트릭 등록"""
+        self._collectors.append((name, collect))
+
+    def register_stats(
+        self,
+        prefix: str,
+        stats: Callable[[], dict],
+        help_text: str,
+        counters: Sequence[str] = ()
+    ):
+        """stats() 딕셔너리의 숫자 값을 {prefix}_{키} 메트릭으로 등록 (counters에 있는 키는 counter 타입)"""
+        def collect() -> Iterable[MetricFamily]:
+            for key, value in stats().items():
+                if isinstance(value, (int, float)):
+                    kind = "counter" if key in counters else "gauge"
+                    name = f"{prefix}_{key}_total" if kind == "counter" else f"{prefix}_{key}"
+                    yield name, kind, f"{help_text} ({key})", [({}, float(value))]
+
+        self.register_collector(prefix, collect)
+
+    def render(self) -> str:
+        lines = self.stage_seconds.render() + self.auth_seconds.render()
+
+        lines.append("# HELP mindi_pipeline_stage_in_progress Pipeline stages currently running")
+        lines.append("# TYPE mindi_pipeline_stage_in_progress gauge")
+        with self._lock:
+            in_progress = sorted(self._in_progress.items())
+        for (pipeline, stage), count in in_progress:
+            lines.append(f"mindi_pipeline_stage_in_progress{_format_labels({'pipeline': pipeline, 'stage': stage})} {count}")
+
+        for collector_name, collect in self._collectors:
+            try:
+                families = list(collect())
+            except Exception as e:
+                logger.warning(f"메트릭 수집 실패 ({collector_name}): {e}")
+                continue
+            for name, kind, help_text, samples in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+# 전역 메트릭 서비스 인스턴스
+metrics_service = MetricsService()
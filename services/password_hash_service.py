@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from config import settings
+import security
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashServiceBusy(Exception):
+    """해싱 대기열이 가득 찬 경우"""
+
+
+class PasswordHashService:
+    """비밀번호 해싱 전용 실행 서비스
+
+    bcrypt는 요청당 수백 ms의 CPU를 점유하므로 Starlette 기본 스레드풀 대신
+    별도 크기의 프로세스 풀에서 실행합니다. 실행 중 + 대기 중 요청 수가
+    PASSWORD_HASH_MAX_PENDING을 넘으면 즉시 PasswordHashServiceBusy를 발생시킵니다.
+    """
+
+    def __init__(self):
+        self.executor_type = settings.PASSWORD_HASH_EXECUTOR
+        self.workers = settings.PASSWORD_HASH_WORKERS
+        self.max_pending = settings.PASSWORD_HASH_MAX_PENDING
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.rejected_count = 0
+
+    def start(self):
+        """해싱 워커 풀 시작"""
+        if self._executor is not None:
+            return
+        if self.executor_type == "process":
+            # 실행 중인 서버 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="password-hash"
+            )
+        logger.info(f"비밀번호 해싱 워커 풀 시작: {self.executor_type} x {self.workers}")
+
+    async def stop(self):
+        """해싱 워커 풀 종료 (워커 종료를 기다리는 동안 이벤트 루프를 막지 않음)"""
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+        logger.info("비밀번호 해싱 워커 풀이 종료되었습니다.")
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            self.rejected_count += 1
+            raise PasswordHashServiceBusy()
+
+        self._pending += 1
+        try:
+            if self._executor is None:
+                return await asyncio.to_thread(func, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(security.get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(security.verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected_count
+        }
+
+# 전역 비밀번호 해싱 서비스 인스턴스
+password_hash_service = PasswordHashService()
@@ -1,36 +1,122 @@
 import asyncio
+import hashlib
 import logging
+import multiprocessing
+import time
 from datetime import datetime, timedelta, date
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
-from database.session import get_db
+from config import settings
+from database.session import get_db, SessionLocal
 from domain.user import user_crud, user_schema
 from domain.report import report_crud, report_schema
 from domain.care import care_crud
 from services.email_service import email_service
+from services.email_outbox_service import email_outbox_service
+from services.care_archive_service import care_archive_service
+from services.care_digest_service import care_digest_service
+from services.leader_election_service import leader_election_service
+from services.ai_client import ai_client
+from services.loop_monitor_service import loop_monitor_service
 import httpx
 
 logger = logging.getLogger(__name__)
 
+WEEKLY_CARE_REPORT_JOB = "weekly_care_reports"
+AI_LATENCY_EWMA_ALPHA = 0.2
+# 주간 리포트 사용자별 처리 단계 (대화 수집, AI 리포트 생성, 리포트 저장, 이메일 생성)
+REPORT_STAGES = ("collect", "ai", "persist", "email")
+
+
+class AIServerError(Exception):
+    """AI 서버 호출 실패 (통신 오류 또는 200이 아닌 응답)"""
+
+
+def _distribution(values: List[float]) -> dict:
+    """소요 시간 분포 요약 (초)"""
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": percentile(0.5),
+        "p90": percentile(0.9),
+        "p99": percentile(0.99),
+        "max": round(ordered[-1], 3)
+    }
+
+
+async def _run_monitored(service: "SchedulerService", job_name: str):
+    """배치 프로세스에서도 이벤트 루프 차단을 감지하도록 감시 서비스와 함께 작업 실행"""
+    loop_monitor_service.start()
+    loop_monitor_service.register_task(f"batch:{job_name}")
+    try:
+        await getattr(service, job_name)()
+    finally:
+        await loop_monitor_service.stop()
+
+
+def _run_batch_job_process(job_name: str, conn):
+    """배치 작업 프로세스 진입점
+
+    spawn으로 새로 시작된 프로세스이므로 DB 연결 풀, HTTP 클라이언트 등은 모두 이 프로세스에서 새로 생성됩니다.
+    실행 요약(주간 리포트)은 conn으로 부모 프로세스에 전달합니다.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [batch] %(name)s %(levelname)s %(message)s")
+    # User 모델의 relationship 대상 매퍼 등록
+    from domain.diagnosis import diagnosis_model  # noqa: F401
+
+    service = SchedulerService()
+    try:
+        asyncio.run(_run_monitored(service, job_name))
+        conn.send(service.last_weekly_run)
+    finally:
+        conn.close()
+
 class SchedulerService:
     """스케줄링 서비스 클래스"""
     
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self.ai_server_url = "http://localhost:8001"
+        self.concurrency = settings.WEEKLY_REPORT_CONCURRENCY
+        self.chunk_size = settings.WEEKLY_REPORT_CHUNK_SIZE
+        self.spread_seconds = settings.WEEKLY_REPORT_SPREAD_MINUTES * 60
+        self.max_per_minute = settings.WEEKLY_REPORT_MAX_PER_MINUTE
+        self.ai_share = settings.WEEKLY_REPORT_AI_SHARE
+        self.ai_latency_ewma: Optional[float] = None  # AI 리포트 요청 응답 시간 이동 평균 (초)
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_start_at = 0.0
+        self.batch_execution = settings.SCHEDULER_BATCH_EXECUTION
+        self.batch_processes = {}  # 작업 이름 -> (프로세스, 시작 시각)
+        self.user_timeout = settings.WEEKLY_REPORT_USER_TIMEOUT_SECONDS
+        self.max_attempts = settings.WEEKLY_REPORT_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.WEEKLY_REPORT_RETRY_BASE_SECONDS
+        self.last_weekly_run: Optional[dict] = None  # 마지막 주간 리포트 실행 요약
         
     def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작
+
+        모든 워커 프로세스에서 호출되지만 스케줄 작업은 리더로 선출된 프로세스에만 등록됩니다.
+        """
         try:
-            # 주간 케어 리포트 자동 생성 (매주 일요일 오전 9시)
+            # 리더 확인 작업 (시작 즉시 1회 실행 후 주기적으로 실행)
             self.scheduler.add_job(
-                func=self.generate_weekly_care_reports,
-                trigger=CronTrigger(day_of_week='sun', hour=9, minute=0),
-                id='weekly_care_reports',
-                name='주간 케어 리포트 생성',
+                func=self.check_leadership,
+                trigger=IntervalTrigger(seconds=settings.SCHEDULER_LEADER_CHECK_SECONDS),
+                id='scheduler_leader_check',
+                name='스케줄러 리더 확인',
+                next_run_time=datetime.now(),
+                coalesce=True,
                 replace_existing=True
             )
             
@@ -41,6 +127,56 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"스케줄러 시작 실패: {e}")
     
+    def _add_leader_jobs(self):
+        """리더 프로세스에서만 실행하는 스케줄 작업 등록"""
+        # 주간 케어 리포트 자동 생성 (매주 일요일 오전 9시)
+        self.scheduler.add_job(
+            func=self.run_batch_job,
+            args=['generate_weekly_care_reports'],
+            trigger=CronTrigger(day_of_week='sun', hour=9, minute=0),
+            id='weekly_care_reports',
+            name='주간 케어 리포트 생성',
+            replace_existing=True
+        )
+        
+        # 전날 대화 요약 생성 (매일 새벽 2시, 주간 리포트는 이 요약을 사용)
+        self.scheduler.add_job(
+            func=self.run_batch_job,
+            args=['generate_daily_digests'],
+            trigger=CronTrigger(hour=2, minute=0),
+            id='care_daily_digests',
+            name='하루 대화 요약 생성',
+            replace_existing=True
+        )
+        
+        # 오래된 케어 로그 아카이브 (매월 1일 새벽 3시)
+        self.scheduler.add_job(
+            func=self.run_batch_job,
+            args=['archive_care_logs'],
+            trigger=CronTrigger(day=1, hour=3, minute=0),
+            id='care_log_archive',
+            name='케어 로그 아카이브',
+            replace_existing=True
+        )
+    
+    def _remove_leader_jobs(self):
+        for job in self.scheduler.get_jobs():
+            if job.id != 'scheduler_leader_check':
+                job.remove()
+    
+    async def check_leadership(self):
+        """리더 잠금을 확인하고 리더 여부에 따라 스케줄 작업을 등록/해제"""
+        was_leader = self.scheduler.get_job('weekly_care_reports') is not None
+        is_leader = await asyncio.to_thread(leader_election_service.check)
+        
+        if is_leader and not was_leader:
+            self._add_leader_jobs()
+            logger.info("리더 프로세스: 스케줄 작업을 등록했습니다.")
+        elif not is_leader and was_leader:
+            # 이미 실행 중인 작업은 끝까지 진행되고 이후 실행만 중단됨
+            self._remove_leader_jobs()
+            logger.warning("리더가 아니므로 스케줄 작업을 해제했습니다.")
+    
     def stop(self):
         """스케줄러 중지"""
         try:
@@ -48,160 +184,650 @@ class SchedulerService:
             logger.info("스케줄러가 중지되었습니다.")
         except Exception as e:
             logger.error(f"스케줄러 중지 실패: {e}")
+        finally:
+            # 진행 중인 배치 프로세스는 종료 (주간 리포트는 ledger로 다음 실행 시 이어서 처리)
+            for job_name, (process, _) in list(self.batch_processes.items()):
+                if process.is_alive():
+                    logger.warning(f"배치 작업 프로세스를 종료합니다: {job_name} (pid {process.pid})")
+                    process.terminate()
+            leader_election_service.release()
+    
+    async def run_batch_job(self, job_name: str):
+        """배치 작업 실행 (process 모드면 별도 프로세스에서 실행하고 이벤트 루프는 종료만 기다림)
+
+        배치 작업의 동기 DB/CPU 작업이 API 요청 처리와 같은 이벤트 루프를 막지 않도록 합니다.
+        """
+        if self.batch_execution != "process":
+            loop_monitor_service.register_task(f"batch:{job_name}")
+            return await getattr(self, job_name)()
+        
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_batch_job_process,
+            args=(job_name, sender),
+            name=f"batch-{job_name}",
+            daemon=True
+        )
+        process.start()
+        sender.close()
+        self.batch_processes[job_name] = (process, datetime.now())
+        logger.info(f"배치 작업 프로세스 시작: {job_name} (pid {process.pid})")
+        
+        try:
+            result = await asyncio.to_thread(self._wait_batch_process, process, receiver)
+            if result is not None:
+                self.last_weekly_run = result
+            if process.exitcode != 0:
+                logger.error(f"배치 작업 프로세스 비정상 종료: {job_name} (exit code {process.exitcode})")
+        finally:
+            receiver.close()
+            self.batch_processes.pop(job_name, None)
+    
+    def _wait_batch_process(self, process, receiver) -> Optional[dict]:
+        result = None
+        try:
+            # 프로세스가 종료되어 파이프가 닫히면 EOFError
+            result = receiver.recv()
+        except EOFError:
+            pass
+        process.join()
+        return result
+    
+    def batch_status(self) -> dict:
+        return {
+            "mode": self.batch_execution,
+            "running": [
+                {"job": job_name, "pid": process.pid, "started_at": started_at.isoformat()}
+                for job_name, (process, started_at) in self.batch_processes.items()
+            ]
+        }
+    
+    def job_run_metrics(self) -> list:
+        """작업별 최근 실행 결과 메트릭 (/metrics용)
+
+        배치는 별도 프로세스에서 실행될 수 있으므로 메모리 대신 DB 실행 이력을 기준으로 합니다.
+        """
+        db = SessionLocal()
+        try:
+            runs = report_crud.get_latest_scheduler_job_runs(db)
+        finally:
+            db.close()
+        
+        duration, processed, failed, succeeded, finished, stages = [], [], [], [], [], []
+        for run in runs:
+            labels = {"job": run.job_name}
+            duration.append((labels, run.duration_seconds))
+            processed.append((labels, run.processed))
+            failed.append((labels, run.failed))
+            succeeded.append((labels, 1 if run.status == "success" else 0))
+            finished.append((labels, run.finished_at.timestamp()))
+            for stage, distribution in ((run.summary or {}).get("stage_seconds") or {}).items():
+                for quantile in ("p50", "p90", "p99"):
+                    if quantile in distribution:
+                        stages.append((
+                            {"job": run.job_name, "stage": stage, "quantile": quantile},
+                            distribution[quantile]
+                        ))
+        return [
+            ("mindi_scheduler_last_run_duration_seconds", "gauge", "Duration of the latest run", duration),
+            ("mindi_scheduler_last_run_processed", "gauge", "Items processed by the latest run", processed),
+            ("mindi_scheduler_last_run_failed", "gauge", "Items failed in the latest run", failed),
+            ("mindi_scheduler_last_run_success", "gauge", "1 if the latest run finished without failures", succeeded),
+            ("mindi_scheduler_last_run_finished_timestamp_seconds", "gauge", "Finish time of the latest run", finished),
+            ("mindi_scheduler_last_run_stage_seconds", "gauge", "Per-user stage latency quantiles of the latest run", stages),
+            ("mindi_scheduler_batch_processes", "gauge", "Batch job processes currently running", [({}, len(self.batch_processes))])
+        ]
     
     async def generate_weekly_care_reports(self):
-        """주간 케어 리포트 자동 생성 및 이메일 발송"""
+        """주간 케어 리포트 자동 생성 및 이메일 발송
+
+        유료 구독자를 WEEKLY_REPORT_CHUNK_SIZE명씩 불러와 묶음마다 대화 로그를 한 번에 조회하고,
+        사용자별 처리를 WEEKLY_REPORT_CONCURRENCY개까지 동시에 실행합니다.
+        WEEKLY_REPORT_SPREAD_MINUTES가 설정되면 사용자별 고정 오프셋에 맞춰 구간 전체에 나눠 실행합니다.
+        사용자마다 제한 시간과 재시도(지수 백오프)를 적용한 뒤 실행 요약을 남깁니다.
+        """
         logger.info("주간 케어 리포트 생성 작업 시작")
         
+        # 분석 기간 설정 (지난 주 월요일 ~ 일요일)
+        end_date = date.today() - timedelta(days=date.today().weekday() + 1)  # 지난 주 일요일
+        start_date = end_date - timedelta(days=6)  # 지난 주 월요일
+        
+        logger.info(f"분석 기간: {start_date} ~ {end_date}")
+        
+        started_at = datetime.now()
+        summary = {
+            "started_at": started_at.isoformat(),
+            "finished_at": None,
+            "duration_seconds": None,
+            "period": {
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d")
+            },
+            "total": 0,
+            "skipped": 0,
+            "success": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "retries": 0,
+            "failed_user_ids": [],
+            "errors": {"ai": 0, "other": 0},
+            "stage_seconds": {stage: [] for stage in (*REPORT_STAGES, "user_total")},
+            "spread_minutes": self.spread_seconds // 60
+        }
+        job_error = None
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        
+        self._rate_lock = asyncio.Lock()
+        self._next_start_at = 0.0
+        
         try:
-            # 데이터베이스 세션 생성
-            db = next(get_db())
-            
-            # 유료 구독자 목록 조회
-            premium_users = self._get_premium_users(db)
+            async with httpx.AsyncClient(limits=limits) as client:
+                if self.spread_seconds > 0:
+                    await self._run_spread(semaphore, client, start_date, end_date, summary)
+                else:
+                    after_id = 0
+                    while True:
+                        chunk = await asyncio.to_thread(
+                            self._load_user_chunk, start_date, end_date, after_id
+                        )
+                        if chunk is None:
+                            break
+                        after_id, pending_users, logs_by_user, digests_by_user, skipped = chunk
+                        summary["total"] += len(pending_users) + skipped
+                        summary["skipped"] += skipped
+                        
+                        await asyncio.gather(*[
+                            self._run_user_care_report(
+                                semaphore, client, user, start_date, end_date, summary,
+                                daily_logs=logs_by_user[user.id],
+                                digests=digests_by_user.get(user.id)
+                            )
+                            for user in pending_users
+                        ])
             
-            if not premium_users:
+            if summary["total"] == 0:
                 logger.info("유료 구독자가 없습니다.")
-                return
+        except Exception as e:
+            job_error = str(e)
+            logger.error(f"주간 케어 리포트 생성 작업 실패: {e}")
+        finally:
+            finished_at = datetime.now()
+            summary["finished_at"] = finished_at.isoformat()
+            summary["duration_seconds"] = round(time.monotonic() - started, 3)
+            summary["ai_latency_ewma_seconds"] = self.ai_latency_ewma
+            summary["rate_cap_per_minute"] = self._rate_cap_per_minute()
+            summary["throughput_per_minute"] = (
+                round(summary["success"] / summary["duration_seconds"] * 60, 2)
+                if summary["duration_seconds"] else 0.0
+            )
+            summary["stage_seconds"] = {
+                stage: _distribution(values) for stage, values in summary["stage_seconds"].items()
+            }
+            if job_error:
+                summary["error"] = job_error
+            self.last_weekly_run = summary
             
-            # 분석 기간 설정 (지난 주 월요일 ~ 일요일)
-            end_date = date.today() - timedelta(days=date.today().weekday() + 1)  # 지난 주 일요일
-            start_date = end_date - timedelta(days=6)  # 지난 주 월요일
+            if job_error:
+                status = "failed"
+            elif summary["failed"]:
+                status = "partial"
+            else:
+                status = "success"
+            await asyncio.to_thread(
+                self._save_job_run, WEEKLY_CARE_REPORT_JOB, status, started_at, finished_at,
+                summary["success"], summary["failed"], summary
+            )
+            logger.info(
+                f"주간 케어 리포트 생성 완료: 성공 {summary['success']}건, 실패 {summary['failed']}건, "
+                f"이전 실행에서 완료 {summary['skipped']}건 "
+                f"(시간 초과 {summary['timeouts']}회, 재시도 {summary['retries']}회, "
+                f"{summary['duration_seconds']}초)"
+            )
+    
+    async def _run_spread(
+        self,
+        semaphore: asyncio.Semaphore,
+        client: httpx.AsyncClient,
+        start_date: date,
+        end_date: date,
+        summary: dict
+    ):
+        """분산 모드: 사용자별 고정 오프셋 순서로 묶음을 불러와 각자의 시작 시각에 생성
+
+        묶음은 첫 사용자의 시작 시각이 되었을 때 불러오므로 메모리에는 진행 중인 묶음만 유지됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        window_start = loop.time()
+        user_ids = await asyncio.to_thread(self._load_user_ids)
+        user_ids.sort(key=self._spread_offset)
+        
+        tasks = []
+        for i in range(0, len(user_ids), self.chunk_size):
+            chunk_ids = user_ids[i:i + self.chunk_size]
+            await asyncio.sleep(max(0.0, window_start + self._spread_offset(chunk_ids[0]) - loop.time()))
             
-            logger.info(f"분석 기간: {start_date} ~ {end_date}")
+            chunk = await asyncio.to_thread(
+                self._load_user_chunk, start_date, end_date, user_ids=chunk_ids
+            )
+            if chunk is None:
+                continue
+            _, pending_users, logs_by_user, digests_by_user, skipped = chunk
+            summary["total"] += len(pending_users) + skipped
+            summary["skipped"] += skipped
             
-            # 각 유료 구독자에 대해 리포트 생성
-            success_count = 0
-            error_count = 0
+            tasks.extend(
+                asyncio.create_task(self._run_user_care_report(
+                    semaphore, client, user, start_date, end_date, summary,
+                    daily_logs=logs_by_user[user.id],
+                    digests=digests_by_user.get(user.id),
+                    not_before=window_start + self._spread_offset(user.id)
+                ))
+                for user in pending_users
+            )
+        
+        await asyncio.gather(*tasks)
+    
+    def _spread_offset(self, user_id: int) -> float:
+        """사용자별 고정 시작 오프셋 (초, 매주 같은 시각에 받도록 사용자 id로만 계산)"""
+        digest = hashlib.sha256(str(user_id).encode()).digest()
+        return int.from_bytes(digest[:4], "big") / 2 ** 32 * self.spread_seconds
+    
+    def _rate_cap_per_minute(self) -> Optional[float]:
+        """분당 시작 수 상한
+
+        WEEKLY_REPORT_MAX_PER_MINUTE가 없으면 측정한 AI 응답 시간으로 계산합니다.
+        (동시 실행 수 / 평균 응답 시간) x WEEKLY_REPORT_AI_SHARE 이므로 대화 트래픽으로
+        AI 서버가 느려지면 배치 속도도 함께 줄어듭니다. 측정값이 없으면 상한 없음.
+        """
+        if self.max_per_minute > 0:
+            return self.max_per_minute
+        if self.spread_seconds <= 0 or not self.ai_latency_ewma:
+            return None
+        return self.concurrency / self.ai_latency_ewma * 60 * self.ai_share
+    
+    async def _wait_for_rate_slot(self):
+        """분당 시작 수 상한에 맞춰 시작 시각을 일정 간격으로 배정"""
+        rate = self._rate_cap_per_minute()
+        if not rate:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            start_at = max(now, self._next_start_at)
+            self._next_start_at = start_at + 60 / rate
+        await asyncio.sleep(start_at - now)
+    
+    def _record_ai_latency(self, elapsed: float):
+        if self.ai_latency_ewma is None:
+            self.ai_latency_ewma = elapsed
+        else:
+            self.ai_latency_ewma += AI_LATENCY_EWMA_ALPHA * (elapsed - self.ai_latency_ewma)
+    
+    def _load_user_ids(self) -> List[int]:
+        db = SessionLocal()
+        try:
+            return user_crud.get_user_ids_by_subscription_type(
+                db, ['premium', 'premium_plus'], email_required=True
+            )
+        finally:
+            db.close()
+    
+    def _load_user_chunk(
+        self,
+        start_date: date,
+        end_date: date,
+        after_id: int = 0,
+        user_ids: Optional[List[int]] = None
+    ) -> Optional[tuple]:
+        """유료 구독자 묶음과 그 사용자들의 주간 대화 로그를 조회
+
+        user_ids가 없으면 after_id 다음 사용자를 WEEKLY_REPORT_CHUNK_SIZE명 불러옵니다.
+
+        이미 처리된 사용자(ledger 완료 또는 같은 기간 리포트 존재)는 제외하며,
+        반환값은 (마지막 사용자 id, 처리할 사용자 목록, {user_id: {날짜: [로그]}},
+        {user_id: {날짜: 하루 요약}}, 제외된 사용자 수)입니다.
+        """
+        period = report_crud.report_period(start_date, end_date)
+        # ledger 기록(commit) 후에도 불러온 사용자/로그를 다시 조회하지 않도록 만료하지 않음
+        db = SessionLocal(expire_on_commit=False)
+        try:
+            if user_ids is None:
+                users = user_crud.get_users_by_subscription_type_chunk(
+                    db, ['premium', 'premium_plus'], after_id=after_id, limit=self.chunk_size,
+                    email_required=True
+                )
+            else:
+                users = user_crud.get_users_by_ids(db, user_ids)
+            if not users:
+                return None
+            user_ids = [user.id for user in users]
             
-            for user in premium_users:
+            # 이미 처리된 사용자는 건너뛰고 남은 사용자만 처리 (재시작 시 이어서 실행)
+            report_crud.ensure_report_run_entries(db, WEEKLY_CARE_REPORT_JOB, period, user_ids)
+            completed_user_ids = report_crud.get_completed_report_run_user_ids(
+                db, WEEKLY_CARE_REPORT_JOB, period
+            )
+            existing_reports = report_crud.get_report_log_ids_by_period(db, user_ids, "care", period)
+            adopted_reports = {
+                user_id: report_log_id for user_id, report_log_id in existing_reports.items()
+                if user_id not in completed_user_ids
+            }
+            # 리포트 저장 후 ledger 기록 전에 중단된 경우 또는 기간이 끝난 뒤 수동으로 생성된 리포트
+            self._enqueue_missing_report_emails(db, users, adopted_reports)
+            for user_id, report_log_id in adopted_reports.items():
+                report_crud.update_report_run_state(
+                    db, WEEKLY_CARE_REPORT_JOB, period, user_id, "done", report_log_id=report_log_id
+                )
+                completed_user_ids.add(user_id)
+            
+            pending_users = [user for user in users if user.id not in completed_user_ids]
+            pending_user_ids = [user.id for user in pending_users]
+            logs_by_user = care_crud.get_care_logs_for_users(db, pending_user_ids, start_date, end_date)
+            digests_by_user = {}
+            if care_digest_service.payload_mode == "digest":
+                digests_by_user = care_crud.get_daily_digests_for_users(
+                    db, pending_user_ids, start_date, end_date
+                )
+            return (
+                user_ids[-1], pending_users, logs_by_user, digests_by_user,
+                len(users) - len(pending_users)
+            )
+        finally:
+            db.close()
+    
+    def _enqueue_missing_report_emails(self, db: Session, users: list, report_log_ids: Dict[int, int]):
+        """이메일 없이 저장된 기존 리포트(수동 생성 등)의 이메일을 발송 대기열에 추가"""
+        with_email = report_crud.get_report_log_ids_with_email(db, list(report_log_ids.values()))
+        users_by_id = {user.id: user for user in users}
+        enqueued = 0
+        for user_id, report_log_id in report_log_ids.items():
+            user = users_by_id.get(user_id)
+            if report_log_id in with_email or user is None or not user.email:
+                continue
+            report_data = report_crud.get_report_log_by_id(db, report_log_id).report_data
+            email = email_service.compose_care_report(
+                to_email=user.email,
+                user_name=user.name,
+                report_html=report_data["report_html"],
+                report_text=report_data["report_text"],
+                period=report_data["period"],
+                conversation_count=report_data["conversation_count"]
+            )
+            report_crud.add_report_email(db, report_log_id, email)
+            enqueued += 1
+        if enqueued:
+            email_outbox_service.notify()
+            logger.info(f"기존 리포트 {enqueued}건의 이메일을 발송 대기열에 추가했습니다.")
+    
+    async def _run_user_care_report(
+        self,
+        semaphore: asyncio.Semaphore,
+        client: httpx.AsyncClient,
+        user: user_schema.User,
+        start_date: date,
+        end_date: date,
+        summary: dict,
+        daily_logs: Optional[dict] = None,
+        digests: Optional[dict] = None,
+        not_before: Optional[float] = None
+    ):
+        """사용자 1명의 리포트 생성 (제한 시간 + 재시도, 세션은 시도마다 새로 생성)
+
+        처리 상태는 report_run_ledger에 기록합니다.
+        not_before: 분산 모드에서 이 사용자의 시작 시각 (이벤트 루프 시각)
+        """
+        period = report_crud.report_period(start_date, end_date)
+        last_error = None
+        
+        if not_before is not None:
+            await asyncio.sleep(max(0.0, not_before - asyncio.get_running_loop().time()))
+        
+        for attempt in range(1, self.max_attempts + 1):
+            await self._wait_for_rate_slot()
+            # 재시도 대기 중에는 동시 실행 슬롯을 반납
+            async with semaphore:
+                db = SessionLocal()
+                attempt_started = time.monotonic()
                 try:
-                    await self._generate_user_care_report(
-                        db, user, start_date, end_date
+                    report_crud.update_report_run_state(
+                        db, WEEKLY_CARE_REPORT_JOB, period, user.id, "processing"
+                    )
+                    report_log = await asyncio.wait_for(
+                        self._generate_user_care_report(
+                            db, user, start_date, end_date, client=client,
+                            daily_logs=daily_logs, digests=digests,
+                            timings=summary["stage_seconds"]
+                        ),
+                        timeout=self.user_timeout
+                    )
+                    summary["stage_seconds"]["user_total"].append(time.monotonic() - attempt_started)
+                    report_crud.update_report_run_state(
+                        db, WEEKLY_CARE_REPORT_JOB, period, user.id, "done",
+                        report_log_id=report_log.id
                     )
-                    success_count += 1
+                    summary["success"] += 1
                     logger.info(f"사용자 {user.id} ({user.name}) 리포트 생성 성공")
-                    
+                    return
+                except asyncio.TimeoutError:
+                    last_error = "timeout"
+                    summary["timeouts"] += 1
+                    logger.warning(
+                        f"사용자 {user.id} 리포트 생성 시간 초과 ({attempt}/{self.max_attempts})"
+                    )
+                except AIServerError as e:
+                    last_error = str(e)
+                    summary["errors"]["ai"] += 1
+                    logger.warning(
+                        f"사용자 {user.id} 리포트 생성 실패 ({attempt}/{self.max_attempts}): {e}"
+                    )
                 except Exception as e:
-                    error_count += 1
-                    logger.error(f"사용자 {user.id} ({user.name}) 리포트 생성 실패: {e}")
-            
-            logger.info(f"주간 케어 리포트 생성 완료: 성공 {success_count}건, 실패 {error_count}건")
+                    last_error = str(e)
+                    summary["errors"]["other"] += 1
+                    logger.warning(
+                        f"사용자 {user.id} 리포트 생성 실패 ({attempt}/{self.max_attempts}): {e}"
+                    )
+                finally:
+                    db.close()
             
+            if attempt < self.max_attempts:
+                summary["retries"] += 1
+                await asyncio.sleep(self.retry_base_seconds * 2 ** (attempt - 1))
+        
+        db = SessionLocal()
+        try:
+            report_crud.update_report_run_state(
+                db, WEEKLY_CARE_REPORT_JOB, period, user.id, "failed", error=last_error
+            )
         except Exception as e:
-            logger.error(f"주간 케어 리포트 생성 작업 실패: {e}")
+            logger.error(f"사용자 {user.id} 처리 상태 기록 실패: {e}")
         finally:
             db.close()
+        
+        summary["failed"] += 1
+        summary["failed_user_ids"].append(user.id)
+        logger.error(f"사용자 {user.id} ({user.name}) 리포트 생성 최종 실패")
     
-    def _get_premium_users(self, db: Session) -> List[user_schema.User]:
-        """유료 구독자 목록 조회"""
+    async def generate_daily_digests(self):
+        """전날 대화를 사용자별로 요약 (주간 리포트의 LLM 작업을 한 주에 걸쳐 분산)"""
+        if care_digest_service.payload_mode != "digest":
+            return
+        logger.info("하루 대화 요약 생성 작업 시작")
+        started_at = datetime.now()
         try:
-            # subscription_type이 'premium' 또는 'premium_plus'인 사용자 조회
-            users = user_crud.get_users_by_subscription_type(db, ['premium', 'premium_plus'])
-            return [user for user in users if user.email]  # 이메일이 있는 사용자만
+            summary = await care_digest_service.generate_daily_digests()
+            status = "partial" if summary["failed"] else "success"
         except Exception as e:
-            logger.error(f"유료 구독자 조회 실패: {e}")
-            return []
+            logger.error(f"하루 대화 요약 생성 작업 실패: {e}")
+            summary = {"error": str(e), "created": 0, "failed": 0}
+            status = "failed"
+        await asyncio.to_thread(
+            self._save_job_run, 'care_daily_digests', status, started_at, datetime.now(),
+            summary["created"], summary["failed"], summary
+        )
+    
+    async def archive_care_logs(self):
+        """보관 기간이 지난 케어 로그를 콜드 아카이브로 이동"""
+        logger.info("케어 로그 아카이브 작업 시작")
+        
+        def _archive() -> int:
+            db = SessionLocal()
+            try:
+                return care_archive_service.archive_old_months(db)
+            finally:
+                db.close()
+        
+        started_at = datetime.now()
+        try:
+            # 대용량 파일/DB 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            archived_count = await asyncio.to_thread(_archive)
+            logger.info(f"케어 로그 아카이브 완료: {archived_count}건")
+            status, summary = "success", {"archived": archived_count}
+        except Exception as e:
+            logger.error(f"케어 로그 아카이브 작업 실패: {e}")
+            archived_count, status, summary = 0, "failed", {"error": str(e)}
+        await asyncio.to_thread(
+            self._save_job_run, 'care_log_archive', status, started_at, datetime.now(),
+            archived_count, 0, summary
+        )
+    
+    def _save_job_run(
+        self,
+        job_name: str,
+        status: str,
+        started_at: datetime,
+        finished_at: datetime,
+        processed: int,
+        failed: int,
+        summary: dict
+    ):
+        """작업 실행 이력 저장 (실패해도 작업 결과에는 영향 없음)"""
+        db = SessionLocal()
+        try:
+            report_crud.create_scheduler_job_run(
+                db, job_name, status, started_at, finished_at,
+                processed=processed, failed=failed, summary=summary
+            )
+        except Exception as e:
+            logger.error(f"작업 실행 이력 저장 실패 ({job_name}): {e}")
+        finally:
+            db.close()
     
     async def _generate_user_care_report(
         self,
         db: Session,
         user: user_schema.User,
         start_date: date,
-        end_date: date
+        end_date: date,
+        client: Optional[httpx.AsyncClient] = None,
+        daily_logs: Optional[dict] = None,
+        digests: Optional[dict] = None,
+        timings: Optional[Dict[str, list]] = None
     ):
-        """개별 사용자의 케어 리포트 생성 및 이메일 발송"""
+        """개별 사용자의 케어 리포트 생성 및 이메일 발송 (같은 기간의 리포트가 있으면 기존 리포트 반환)
+
+        daily_logs/digests: 미리 조회한 {날짜: [로그]}/{날짜: 하루 요약} (없으면 직접 조회)
+        timings: 단계별 소요 시간을 추가할 {단계: [초]} (REPORT_STAGES)
+        """
+        period = report_crud.report_period(start_date, end_date)
+        if daily_logs is None:
+            # 배치에서는 묶음 조회 시 이미 확인했으므로 단건 호출일 때만 확인
+            existing = report_crud.get_report_log_by_period(db, user.id, "care", period)
+            if existing:
+                logger.info(f"사용자 {user.id} {period} 리포트가 이미 있어 생성을 건너뜁니다.")
+                return existing
         
-        # 주간 대화 데이터 수집
-        weekly_conversations = []
-        current_date = start_date
+        if client is None:
+            async with httpx.AsyncClient() as client:
+                return await self._generate_user_care_report(
+                    db, user, start_date, end_date, client=client,
+                    daily_logs=daily_logs, digests=digests, timings=timings
+                )
         
-        while current_date <= end_date:
-            # 해당 날짜의 대화 로그 조회
-            daily_logs = care_crud.get_daily_conversations(db, user.id, current_date)
-            
-            # 대화 데이터 구성
-            conversations = []
-            for log in daily_logs:
-                conversations.append({
-                    "user_question": log.user_question,
-                    "ai_reply": log.ai_reply,
-                    "conversation_id": log.conversation_id,
-                    "created_at": log.created_at.isoformat() if log.created_at else None
-                })
-            
-            weekly_conversations.append({
-                "date": current_date.strftime("%Y-%m-%d"),
-                "conversations": conversations
-            })
-            
-            current_date += timedelta(days=1)
+        def record_stage(stage: str, stage_started: float):
+            if timings is not None:
+                timings[stage].append(time.monotonic() - stage_started)
+        
+        # 주간 대화 데이터 수집 (기본값은 대화 원문 대신 하루 요약 + 통계)
+        stage_started = time.monotonic()
+        report_content, conversation_count = await care_digest_service.build_report_content(
+            db, client, user.id, start_date, end_date, daily_logs=daily_logs, digests=digests
+        )
+        record_stage("collect", stage_started)
         
         # AI 서버에 케어 리포트 생성 요청
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            stage_started = time.monotonic()
+            try:
+                response = await ai_client.post_json(
+                    client,
                     f"{self.ai_server_url}/generate-care-report",
-                    json={
+                    {
                         "user_id": user.id,
                         "start_date": start_date.strftime("%Y-%m-%d"),
                         "end_date": end_date.strftime("%Y-%m-%d"),
                         "user_email": user.email,
                         "user_name": user.name,
-                        "weekly_conversations": weekly_conversations
+                        **report_content
                     },
                     timeout=60
                 )
-                
-                if response.status_code != 200:
-                    raise Exception(f"AI 서버 응답 오류: {response.status_code}")
-                
-                ai_response = response.json()
-                
-                # 리포트 데이터를 DB에 저장
-                report_data = {
-                    "report_html": ai_response["report_html"],
-                    "report_text": ai_response["report_text"],
-                    "weekly_data": ai_response["weekly_data"],
-                    "overall_comment": ai_response["overall_comment"],
-                    "care_recommendations": ai_response["care_recommendations"],
-                    "period": {
-                        "start_date": start_date.strftime("%Y-%m-%d"),
-                        "end_date": end_date.strftime("%Y-%m-%d")
-                    },
-                    "conversation_count": sum(len(day["conversations"]) for day in weekly_conversations)
-                }
-                
-                report_log = report_crud.create_report_log(
-                    db,
-                    report_schema.ReportLogCreate(
-                        user_id=user.id,
-                        report_type="care",
-                        report_data=report_data
-                    )
+            except httpx.HTTPError as e:
+                raise AIServerError(f"AI 서버 통신 오류: {e}") from e
+            
+            if response.status_code != 200:
+                raise AIServerError(f"AI 서버 응답 오류: {response.status_code}")
+            ai_response = response.json()
+            self._record_ai_latency(time.monotonic() - stage_started)
+            record_stage("ai", stage_started)
+            
+            # 리포트 데이터를 DB에 저장
+            report_data = {
+                "report_html": ai_response["report_html"],
+                "report_text": ai_response["report_text"],
+                "weekly_data": ai_response["weekly_data"],
+                "overall_comment": ai_response["overall_comment"],
+                "care_recommendations": ai_response["care_recommendations"],
+                "period": {
+                    "start_date": start_date.strftime("%Y-%m-%d"),
+                    "end_date": end_date.strftime("%Y-%m-%d")
+                },
+                "conversation_count": conversation_count
+            }
+            
+            # 이메일은 리포트와 같은 트랜잭션으로 발송 대기열에 기록 (발송은 outbox 워커가 담당)
+            stage_started = time.monotonic()
+            email = None
+            if user.email:
+                email = email_service.compose_care_report(
+                    to_email=user.email,
+                    user_name=user.name,
+                    report_html=ai_response["report_html"],
+                    report_text=ai_response["report_text"],
+                    period=report_data["period"],
+                    conversation_count=report_data["conversation_count"]
                 )
-                
-                # 이메일 발송
-                if user.email:
-                    email_success = email_service.send_care_report(
-                        to_email=user.email,
-                        user_name=user.name,
-                        report_html=ai_response["report_html"],
-                        report_text=ai_response["report_text"],
-                        period={
-                            "start_date": start_date.strftime("%Y-%m-%d"),
-                            "end_date": end_date.strftime("%Y-%m-%d")
-                        },
-                        conversation_count=sum(len(day["conversations"]) for day in weekly_conversations)
-                    )
-                    
-                    if email_success:
-                        # 이메일 발송 상태 업데이트
-                        report_crud.update_report_sent_status(db, report_log.id, datetime.now())
-                        logger.info(f"사용자 {user.id} ({user.name}) 이메일 발송 성공")
-                    else:
-                        logger.error(f"사용자 {user.id} ({user.name}) 이메일 발송 실패")
-                
+            record_stage("email", stage_started)
+
+            stage_started = time.monotonic()
+            report_log = report_crud.create_report_log(
+                db,
+                report_schema.ReportLogCreate(
+                    user_id=user.id,
+                    report_type="care",
+                    report_data=report_data,
+                    period=period
+                ),
+                email=email
+            )
+            record_stage("persist", stage_started)
+            if email:
+                email_outbox_service.notify()
+                logger.info(f"사용자 {user.id} ({user.name}) 이메일 발송 대기열 등록")
+            return report_log
+            
         except Exception as e:
             logger.error(f"사용자 {user.id} 리포트 생성 실패: {e}")
             raise